@@ -0,0 +1,92 @@
+"""create orders and order_items tables
+
+Revision ID: 3f1a9c2d7e84
+Revises: 5c7b62e589f9
+Create Date: 2026-10-18 10:12:31.402118
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1a9c2d7e84'
+down_revision: Union[str, Sequence[str], None] = '5c7b62e589f9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 이전에는 orders/order_items가 마이그레이션 없이 create_all로만 생성되었으므로,
+    # 이미 테이블이 있는 환경에서는 생성을 건너뜁니다.
+    inspector = sa.inspect(op.get_bind())
+    existing_tables = set(inspector.get_table_names())
+
+    if 'orders' not in existing_tables:
+        op.create_table('orders',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('channel_id', sa.Integer(), nullable=False),
+        sa.Column('external_order_id', sa.String(length=100), nullable=False),
+        sa.Column('channel_type', sa.String(length=50), nullable=False),
+        sa.Column('order_date', sa.DateTime(), nullable=False),
+        sa.Column('total_amount', sa.Numeric(precision=10, scale=2), nullable=False),
+        sa.Column('recipient_name', sa.String(length=100), nullable=False),
+        sa.Column('recipient_phone', sa.String(length=50), nullable=False),
+        sa.Column('shipping_address', sa.Text(), nullable=False),
+        sa.Column('umos_status', sa.String(length=50), nullable=False),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['channel_id'], ['channel_configs.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index(op.f('ix_orders_external_order_id'), 'orders', ['external_order_id'], unique=True)
+        op.create_index(op.f('ix_orders_id'), 'orders', ['id'], unique=False)
+        op.create_index(op.f('ix_orders_umos_status'), 'orders', ['umos_status'], unique=False)
+
+    if 'order_items' not in existing_tables:
+        op.create_table('order_items',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('order_id', sa.Integer(), nullable=False),
+        sa.Column('external_item_id', sa.String(length=100), nullable=False),
+        sa.Column('product_name', sa.String(length=255), nullable=False),
+        sa.Column('quantity', sa.Integer(), nullable=False),
+        sa.Column('item_price', sa.Numeric(precision=10, scale=2), nullable=False),
+        sa.Column('courier_name', sa.String(length=50), nullable=True),
+        sa.Column('tracking_number', sa.String(length=100), nullable=True),
+        sa.Column('umos_status', sa.String(length=50), nullable=False),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['order_id'], ['orders.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index(op.f('ix_order_items_external_item_id'), 'order_items', ['external_item_id'], unique=False)
+        op.create_index(op.f('ix_order_items_id'), 'order_items', ['id'], unique=False)
+        op.create_index(op.f('ix_order_items_umos_status'), 'order_items', ['umos_status'], unique=False)
+    else:
+        # 수집 시점에는 송장 정보가 없으므로 NULL을 허용합니다.
+        op.alter_column('order_items', 'courier_name', existing_type=sa.String(length=50), nullable=True)
+        op.alter_column('order_items', 'tracking_number', existing_type=sa.String(length=100), nullable=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # upgrade는 create_all로 만든 기존 테이블을 그대로 이어받을 수 있고, downgrade 시점에는 어느 쪽인지 알 수 없습니다.
+    # 운영 주문 데이터를 조용히 삭제하지 않도록, 주문이 있으면 -x drop_order_data=true를 지정한 경우에만 삭제합니다.
+    # (예: alembic downgrade 5c7b62e589f9 -x drop_order_data=true)
+    has_orders = op.get_bind().execute(sa.text("SELECT EXISTS (SELECT 1 FROM orders)")).scalar()
+    if has_orders and context.get_x_argument(as_dictionary=True).get('drop_order_data') != 'true':
+        raise RuntimeError(
+            "orders table is not empty; refusing to drop order data. "
+            "Back up the data and rerun with -x drop_order_data=true to drop it."
+        )
+    op.drop_index(op.f('ix_order_items_umos_status'), table_name='order_items')
+    op.drop_index(op.f('ix_order_items_id'), table_name='order_items')
+    op.drop_index(op.f('ix_order_items_external_item_id'), table_name='order_items')
+    op.drop_table('order_items')
+    op.drop_index(op.f('ix_orders_umos_status'), table_name='orders')
+    op.drop_index(op.f('ix_orders_id'), table_name='orders')
+    op.drop_index(op.f('ix_orders_external_order_id'), table_name='orders')
+    op.drop_table('orders')
@@ -0,0 +1,55 @@
+"""add order ingest and listing indexes
+
+Revision ID: 8d2e4b6a1c37
+Revises: 3f1a9c2d7e84
+Create Date: 2026-10-18 10:31:07.118245
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d2e4b6a1c37'
+down_revision: Union[str, Sequence[str], None] = '3f1a9c2d7e84'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 유니크 키 생성 전에 (order_id, external_item_id) 중복 행을 정리합니다. (가장 최근 id만 유지)
+    op.execute(
+        "DELETE older FROM order_items AS older "
+        "JOIN order_items AS newer "
+        "ON newer.order_id = older.order_id "
+        "AND newer.external_item_id = older.external_item_id "
+        "AND newer.id > older.id"
+    )
+    op.create_unique_constraint('uq_order_items_order_id_external_item_id', 'order_items', ['order_id', 'external_item_id'])
+    op.create_index('ix_orders_channel_id_order_date', 'orders', ['channel_id', 'order_date'], unique=False)
+    op.create_index('ix_orders_umos_status_order_date', 'orders', ['umos_status', 'order_date'], unique=False)
+
+
+def _ensure_fk_index(table: str, column: str, index_name: str, dropping: set) -> None:
+    # InnoDB는 외래 키 컬럼으로 시작하는 다른 인덱스가 생기면 자동 생성한 외래 키 인덱스를 삭제할 수 있습니다.
+    # 그 상태에서 아래 인덱스들을 삭제하면 error 1553(needed in a foreign key constraint)이 발생하므로,
+    # 남는 인덱스 중 외래 키 컬럼으로 시작하는 것이 없으면 단일 컬럼 인덱스를 먼저 만듭니다.
+    inspector = sa.inspect(op.get_bind())
+    remaining = [
+        index for index in inspector.get_indexes(table)
+        if index['name'] not in dropping and index['column_names'][:1] == [column]
+    ]
+    if not remaining:
+        op.create_index(index_name, table, [column], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _ensure_fk_index('orders', 'channel_id', 'ix_orders_channel_id', {'ix_orders_channel_id_order_date'})
+    _ensure_fk_index('order_items', 'order_id', 'ix_order_items_order_id', {'uq_order_items_order_id_external_item_id'})
+    op.drop_index('ix_orders_umos_status_order_date', table_name='orders')
+    op.drop_index('ix_orders_channel_id_order_date', table_name='orders')
+    op.drop_constraint('uq_order_items_order_id_external_item_id', 'order_items', type_='unique')
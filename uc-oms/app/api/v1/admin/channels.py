@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.services import channel_service
 from app.schemas.channel import ChannelConfigCreate, ChannelConfigUpdate, ChannelConfigRead
 
@@ -48,7 +48,7 @@ async def create_channel_endpoint(
 async def read_channels_endpoint(
     skip: int = 0, 
     limit: int = 100, 
-    db: AsyncSession = Depends(get_db) # DB 세션 의존성 주입
+    db: AsyncSession = Depends(get_read_db) # 읽기 전용 세션 (복제본)
 ):
     """
     등록된 채널 목록을 조회합니다.
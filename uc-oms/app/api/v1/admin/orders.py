@@ -1,22 +1,125 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.core.database import get_db
-from typing import List, Dict, Any
+from app.core.database import get_db, get_read_db, AsyncReadSessionLocal
+from app.services.order_service import OrderService
+from app.services.order_export_service import OrderExportService
+from app.schemas.order import (
+    OrderListResponse, BulkShipmentRequest, BulkPreparationRequest, BulkItemActionResponse,
+    ItemStatusUpdateRequest, ItemStatusUpdateResponse
+)
+from app.schemas.sync import SyncJobCreate, SyncJobRead
+from app.services.sync_job_service import SyncJobService
+from pydantic import ValidationError
+from datetime import datetime
+from typing import List, Dict, Any, Literal, Optional
 
 router = APIRouter(prefix="/orders", tags=['Admin Orders'])
 
-@router.get("/", response_model=List[Dict[str,Any]], summary="주문 목록 조회")
+@router.get("/", response_model=OrderListResponse, summary="주문 목록 조회 (커서 기반 페이지네이션)")
 async def get_orders_list_endpoint(
-    db: AsyncSession = Depends(get_db)
+    channel_id: Optional[int] = None,
+    umos_status: Optional[str] = None,
+    date_from: Optional[datetime] = Query(None, description="주문일시 시작 (포함)"),
+    date_to: Optional[datetime] = Query(None, description="주문일시 종료 (미포함)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    limit: int = Query(50, ge=1, le=200),
+    db: AsyncSession = Depends(get_read_db)
+):
+    try:
+        service = OrderService(db=db)
+        orders, next_cursor = await service.list_orders(
+            channel_id=channel_id,
+            umos_status=umos_status,
+            date_from=date_from,
+            date_to=date_to,
+            cursor=cursor,
+            limit=limit
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return OrderListResponse(orders=orders, next_cursor=next_cursor)
+
+@router.get("/export", summary="주문 전체 내보내기 (NDJSON/CSV 스트리밍)")
+async def export_orders_endpoint(
+    export_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+    channel_id: Optional[int] = None,
+    umos_status: Optional[str] = None,
+    date_from: Optional[datetime] = Query(None, description="주문일시 시작 (포함)"),
+    date_to: Optional[datetime] = Query(None, description="주문일시 종료 (미포함)")
 ):
-    return[
-        {"order_id": 1001, "channel_name": "coupang", "status": "PAYMENT_COMPLETE"},
-        {"order_id": 1002, "channel_name": "smartstore", "status": "SHIPPING_PREPARE"},
-    ]
+    """
+    조건에 맞는 주문을 주문 상품과 함께 스트리밍으로 내보냅니다.
+    전체 결과를 메모리에 올리지 않고 서버 사이드 커서에서 읽는 즉시 전송합니다.
+    """
+    service = OrderExportService(AsyncReadSessionLocal)
+    filters = dict(channel_id=channel_id, umos_status=umos_status, date_from=date_from, date_to=date_to)
+    
+    if export_format == "csv":
+        body, media_type = service.export_csv(**filters), "text/csv; charset=utf-8"
+    else:
+        body, media_type = service.export_ndjson(**filters), "application/x-ndjson"
     
-@router.get("/channels/{channel_id}/fetch", response_model=List[Dict[str,Any]], summary="특정 채널로부터 주문 목록 수집 (API 통신)")
+    filename = f"orders_{datetime.now():%Y%m%d%H%M%S}.{export_format}"
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+    
+@router.post(
+    "/channels/{channel_id}/fetch",
+    response_model=SyncJobRead,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="특정 채널의 주문 수집 작업 등록 (워커 프로세스에서 실행)"
+)
 async def fetch_orders_from_channel_endpoint(
     channel_id: int,
+    start_date: datetime = Query(..., description="수집 구간 시작"),
+    end_date: datetime = Query(..., description="수집 구간 종료"),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    order_fetch 작업을 등록하고 바로 반환합니다. 진행 상황은 GET /sync-jobs/{job_id}로 확인합니다.
+    """
+    try:
+        job = SyncJobCreate(job_type="order_fetch", channel_id=channel_id, start_date=start_date, end_date=end_date)
+        return await SyncJobService(db).enqueue(job)
+    except ValidationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+@router.post("/items/preparation", response_model=BulkItemActionResponse, summary="주문 상품 대량 발주 확인")
+async def confirm_preparation_bulk_endpoint(
+    request: BulkPreparationRequest,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    여러 주문 상품의 발주를 채널별 묶음으로 확인하고, 상품별 성공/실패를 반환합니다.
+    """
+    service = OrderService(db=db)
+    return await service.confirm_preparation_bulk(request.order_item_ids)
+
+@router.post("/items/shipments", response_model=BulkItemActionResponse, summary="주문 상품 대량 송장 등록 (발송 처리)")
+async def ship_items_bulk_endpoint(
+    request: BulkShipmentRequest,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    (주문 상품, 택배사, 송장번호) 목록을 채널별 묶음으로 등록하고, 상품별 성공/실패를 반환합니다.
+    성공한 상품은 택배사/송장번호/상태(SHIPPED)가 반영됩니다.
+    """
+    service = OrderService(db=db)
+    return await service.ship_items_bulk(request.items)
+
+@router.patch("/items/status", response_model=ItemStatusUpdateResponse, summary="주문 상품 상태 변경 (채널 반영은 비동기)")
+async def update_item_statuses_endpoint(
+    request: ItemStatusUpdateRequest,
     db: AsyncSession = Depends(get_db)
 ):
-    return [{"message": f"Fetching orders from channel {channel_id} is not fully implemented yet."}]
\ No newline at end of file
+    """
+    주문 상품 상태를 변경하고 바로 반환합니다. 채널 API 반영은 워커가 outbox를 통해 묶어서 처리합니다.
+    """
+    service = OrderService(db=db)
+    return await service.update_item_statuses(request.items)
\ No newline at end of file
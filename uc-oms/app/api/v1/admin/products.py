@@ -2,26 +2,33 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import get_db
 from app.services.product_service import ProductCollectorService
+from app.schemas.product import ProductFetchAllResponse, ProductSnapshotResponse
 from typing import List, Dict, Any
 
 router = APIRouter(prefix="/products", tags=["Admin Products"])
 
 @router.get(
     "/{channel_id}/fetch", 
-    response_model=List[Dict[str,Any]], 
-    summary="특정 채널로부터 상품 목록 조회 (API 통신)"
+    response_model=ProductSnapshotResponse, 
+    summary="특정 채널의 상품 목록 조회 (스냅샷, 오래되면 백그라운드 갱신)"
 )
 async def fetch_products_endpoint(
     channel_id: int, 
     page: int=1, 
     page_size: int=50, 
+    refresh: bool=False,
     db:AsyncSession = Depends(get_db)):
+    """
+    products 테이블의 스냅샷을 반환합니다. synced_at은 스냅샷 갱신 시각입니다.
+    refresh=true이면 채널 API에서 다시 수집한 뒤 반환합니다.
+    """
     try:
         service = ProductCollectorService(db=db)
-        products = await service.fetch_products_from_channel(
+        products = await service.get_channel_products(
             channel_id=channel_id,
             page=page,
-            page_size=page_size
+            page_size=page_size,
+            force_refresh=refresh
         )
         return products
     except ValueError as e:
@@ -38,8 +45,8 @@ async def fetch_products_endpoint(
     
 @router.get(
     "/fetch_all", 
-    response_model=List[Dict[str,Any]], 
-    summary="모든 활성 채널로부터 상품 목록 일괄 조회 (API 통신)")
+    response_model=ProductFetchAllResponse, 
+    summary="모든 활성 채널의 상품 목록 일괄 조회 (스냅샷)")
 async def fetch_all_products_endpoint(
     page: int=1,
     page_size: int=50,
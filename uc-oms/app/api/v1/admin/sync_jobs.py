@@ -0,0 +1,35 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.database import get_db
+from app.services.sync_job_service import SyncJobService
+from app.schemas.sync import SyncJobCreate, SyncJobRead
+
+router = APIRouter(prefix="/sync-jobs", tags=["Admin Sync Jobs"])
+
+@router.post(
+    "/",
+    response_model=SyncJobRead,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="수집 작업 등록 (워커 프로세스에서 비동기 실행)"
+)
+async def enqueue_sync_job_endpoint(
+    job: SyncJobCreate,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    주문/상품 수집 작업을 큐에 등록하고 바로 반환합니다. 진행 상황은 GET /sync-jobs/{job_id}로 확인합니다.
+    """
+    try:
+        return await SyncJobService(db).enqueue(job)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+@router.get("/{job_id}", response_model=SyncJobRead, summary="수집 작업 상태 조회")
+async def read_sync_job_endpoint(
+    job_id: int,
+    db: AsyncSession = Depends(get_db)
+):
+    job = await SyncJobService(db).get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Sync job not found")
+    return job
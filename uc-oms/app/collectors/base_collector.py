@@ -1,5 +1,30 @@
+import asyncio
+import logging
+import httpx
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from collections import deque
+from datetime import datetime, timedelta
+from typing import List, Dict, Any, AsyncIterator, Optional, Tuple
+from app.core.config import settings
+from app.core.http_client import get_http_client
+from app.collectors.rate_limiter import AdaptiveRateLimiter, get_rate_limiter, parse_retry_after, backoff_delay
+from app.collectors.records import OrderRecord
+
+logger = logging.getLogger(__name__)
+
+# 재시도 대상 응답 코드 (429: 요청 한도 초과, 5xx: 일시적인 서버 오류)
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+# 여러 번 보내도 결과가 같은 HTTP 메서드. 그 밖의 요청은 idempotent=True로 호출한 경우에만 5xx/네트워크 오류를 재시도합니다.
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+async def _cancel_pending(pending: "deque[asyncio.Task]") -> None:
+    """미리 요청해 둔 페이지 작업을 취소하고 끝날 때까지 기다립니다."""
+    tasks = list(pending)
+    pending.clear()
+    for task in tasks:
+        task.cancel()
+    if tasks:
+        await asyncio.gather(*tasks, return_exceptions=True)
 
 class IProductCollector(ABC):
     """
@@ -17,7 +42,65 @@ class IProductCollector(ABC):
         """
         pass
     
+    async def fetch_product_page(self, page: int=1, page_size: int=50) -> Tuple[List[Dict[str,Any]], bool]:
+        """
+        한 페이지의 상품 목록과 다음 페이지 존재 여부를 반환합니다.
+        기본 구현은 조회된 상품 수가 page_size보다 적으면 마지막 페이지로 판단합니다.
+        채널 API가 전체 페이지 수나 다음 페이지 토큰을 제공하면 하위 클래스에서 재정의합니다.
+        """
+        products = await self.fetch_products(page=page, page_size=page_size)
+        return products, len(products) >= page_size
+    
+    async def iter_products(
+        self,
+        page_size: int=50,
+        prefetch: Optional[int]=None,
+        start_page: int=1
+    ) -> AsyncIterator[Dict[str,Any]]:
+        """
+        채널의 모든 상품을 페이지 순서대로 하나씩 반환하는 비동기 제너레이터입니다.
+        호출자가 N 페이지를 처리하는 동안 최대 prefetch개의 다음 페이지를 미리 요청하여
+        네트워크 대기와 처리 시간을 겹치게 하고, 메모리에는 lookahead 범위의 페이지만 유지합니다.
+        """
+        prefetch = max(1, prefetch or settings.PRODUCT_PAGE_PREFETCH)
+        pending: deque[asyncio.Task] = deque()
+        next_page = start_page
+        
+        def schedule() -> None:
+            nonlocal next_page
+            pending.append(asyncio.create_task(self.fetch_product_page(page=next_page, page_size=page_size)))
+            next_page += 1
+        
+        schedule()
+        try:
+            while pending:
+                products, has_next = await pending.popleft()
+                
+                if has_next:
+                    while len(pending) < prefetch:
+                        schedule()
+                else:
+                    # 마지막 페이지 이후로 미리 요청한 페이지는 버립니다.
+                    await _cancel_pending(pending)
+                
+                for product in products:
+                    yield product
+        finally:
+            await _cancel_pending(pending)
+    
 class IOrderCollector(ABC):
+    # fetch_orders 한 번에 조회할 수 있는 최대 기간 (채널 API 제한). 과거 주문 백필 시 이 단위로 구간을 나눕니다.
+    MAX_QUERY_WINDOW: timedelta = timedelta(days=1)
+    # 수집 파이프라인에서 fetch_orders 한 번에 조회할 구간. None이면 MAX_QUERY_WINDOW 단위로 조회합니다.
+    # 조회 구간을 줄여도 API 호출 수가 늘지 않는 채널(시간 구간 단위 페이지 조회 등)만 설정합니다.
+    PIPELINE_SHARD_WINDOW: Optional[timedelta] = None
+    # 한 번의 호출로 처리할 수 있는 최대 주문 상품 수 (채널 API 제한). 대량 발주 확인/발송 처리 시 이 단위로 나눕니다.
+    PREPARATION_BATCH_SIZE: int = 50
+    SHIPMENT_BATCH_SIZE: int = 50
+    # 일괄 등록 API가 없는 채널에서 register_tracking_and_ship_bulk가 동시에 보낼 최대 송장 등록 요청 수
+    SHIPMENT_CONCURRENCY: int = 5
+    # 주문 목록 API의 한 페이지 크기 (채널 API 제한)
+    ORDER_PAGE_SIZE: int = 100
     
     def __init__(self, channel_id: int, api_key: str, api_secret: str):
         self.channel_id = channel_id
@@ -25,9 +108,67 @@ class IOrderCollector(ABC):
         self.api_secret = api_secret
     
     @abstractmethod
-    async def fetch_orders(self, start_date, end_date) -> List[Dict[str,Any]]:
+    async def fetch_orders(self, start_date, end_date) -> List[OrderRecord]:
+        """
+        기간 내 주문을 정규화된 OrderRecord 목록으로 반환합니다. (검증은 수집 파이프라인에서 수행)
+        """
         pass
 
+    async def fetch_order_page(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        page: int=1,
+        page_size: int=100
+    ) -> Tuple[List[OrderRecord], bool]:
+        """
+        기간 내 주문 한 페이지와 다음 페이지 존재 여부를 반환합니다.
+        기본 구현은 fetch_orders 결과 전체를 한 페이지로 반환합니다.
+        채널 API가 페이지 단위 조회를 지원하면 하위 클래스에서 재정의합니다.
+        """
+        if page > 1:
+            return [], False
+        return await self.fetch_orders(start_date, end_date), False
+
+    async def iter_orders(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        page_size: Optional[int]=None,
+        prefetch: Optional[int]=None
+    ) -> AsyncIterator[List[OrderRecord]]:
+        """
+        기간 내 주문을 페이지 순서대로 한 페이지(OrderRecord 목록)씩 반환하는 비동기 제너레이터입니다.
+        iter_products와 같이 호출자가 N 페이지를 처리하는 동안 최대 prefetch개의 다음 페이지를 미리 요청하며,
+        메모리에는 lookahead 범위의 페이지만 유지합니다.
+        """
+        page_size = page_size or self.ORDER_PAGE_SIZE
+        prefetch = max(1, prefetch or settings.ORDER_PAGE_PREFETCH)
+        pending: deque[asyncio.Task] = deque()
+        next_page = 1
+        
+        def schedule() -> None:
+            nonlocal next_page
+            pending.append(asyncio.create_task(
+                self.fetch_order_page(start_date, end_date, page=next_page, page_size=page_size)
+            ))
+            next_page += 1
+        
+        schedule()
+        try:
+            while pending:
+                orders, has_next = await pending.popleft()
+                
+                if has_next:
+                    while len(pending) < prefetch:
+                        schedule()
+                else:
+                    await _cancel_pending(pending)
+                
+                yield orders
+        finally:
+            await _cancel_pending(pending)
+
     @abstractmethod
     async def confirm_order_preparation(self, order_item_ids: List[int]):
         pass
@@ -35,3 +176,103 @@ class IOrderCollector(ABC):
     @abstractmethod
     async def register_tracking_and_ship(self, order_item_id: int, courier_code: str, tracking_number: str):
         pass
+
+    async def register_tracking_and_ship_bulk(self, shipments: List[Tuple[str, str, str]]) -> Dict[str, Optional[str]]:
+        """
+        (order_item_id, courier_code, tracking_number) 목록의 송장을 등록하고, order_item_id별 오류 메시지(성공 시 None)를 반환합니다.
+        기본 구현은 register_tracking_and_ship을 최대 SHIPMENT_CONCURRENCY개씩 동시에 호출합니다.
+        주문 컬렉터는 채널 속도 제한기를 거치지 않으므로 동시 요청 수는 여기서 제한합니다.
+        채널 API가 일괄 등록을 지원하면 하위 클래스에서 SHIPMENT_BATCH_SIZE 단위 한 번의 호출로 재정의합니다.
+        """
+        semaphore = asyncio.Semaphore(max(1, self.SHIPMENT_CONCURRENCY))
+
+        async def ship(order_item_id: str, courier_code: str, tracking_number: str):
+            async with semaphore:
+                return await self.register_tracking_and_ship(order_item_id, courier_code, tracking_number)
+
+        outcomes = await asyncio.gather(
+            *(ship(order_item_id, courier_code, tracking_number)
+              for order_item_id, courier_code, tracking_number in shipments),
+            return_exceptions=True
+        )
+        results: Dict[str, Optional[str]] = {}
+        for (order_item_id, _, _), outcome in zip(shipments, outcomes):
+            if isinstance(outcome, BaseException):
+                results[order_item_id] = str(outcome) or type(outcome).__name__
+            elif outcome is False:
+                results[order_item_id] = "Rejected by channel API"
+            else:
+                results[order_item_id] = None
+        return results
+
+class HttpCollectorMixin:
+    """
+    외부 HTTP API를 호출하는 컬렉터의 공통 기능
+    채널 타입별로 공유되는 커넥션 풀(AsyncClient)을 사용합니다.
+    """
+    CHANNEL_TYPE: str = ""
+    BASE_URL: str = ""
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        return get_http_client(self.CHANNEL_TYPE, self.BASE_URL)
+
+    @property
+    def rate_limiter(self) -> AdaptiveRateLimiter:
+        return get_rate_limiter(self.channel_id, self.CHANNEL_TYPE)
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        stream: bool=False,
+        idempotent: Optional[bool]=None,
+        **kwargs
+    ) -> httpx.Response:
+        """
+        채널 속도 제한기를 거쳐 요청을 보냅니다.
+        429/5xx 응답과 네트워크 오류는 지수 백오프(jitter 포함)로 재시도하고,
+        429 응답의 Retry-After는 같은 채널의 다른 요청에도 적용됩니다.
+        - 멱등이 아닌 요청(기본: IDEMPOTENT_METHODS 외의 메서드)은 서버가 처리했을 수 있으므로 5xx 응답과
+          연결 이후의 네트워크 오류는 재시도하지 않습니다. (429와 연결 실패만 재시도)
+          조회용 POST처럼 다시 보내도 안전한 요청은 idempotent=True로 호출합니다.
+        마지막 시도의 응답은 상태 코드와 관계없이 그대로 반환합니다.
+        stream=True이면 본문을 읽지 않은 응답을 반환하며(json_stream.iter_json_items용), 호출자가 aclose()해야 합니다.
+        """
+        max_retries = settings.COLLECTOR_MAX_RETRIES
+        limiter = self.rate_limiter
+        if idempotent is None:
+            idempotent = method.upper() in IDEMPOTENT_METHODS
+        
+        for attempt in range(max_retries + 1):
+            await limiter.acquire()
+            try:
+                if stream:
+                    response = await self.client.send(self.client.build_request(method, url, **kwargs), stream=True)
+                else:
+                    response = await self.client.request(method, url, **kwargs)
+            except httpx.TransportError as e:
+                if attempt >= max_retries or not (idempotent or isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout))):
+                    raise
+                delay = backoff_delay(attempt)
+                logger.warning(f"{self.CHANNEL_TYPE} request failed ({e}). Retrying in {delay:.2f}s")
+                await asyncio.sleep(delay)
+                continue
+            
+            if response.status_code not in RETRYABLE_STATUS_CODES:
+                limiter.on_success()
+                return response
+            
+            if response.status_code == 429:
+                limiter.on_throttle(parse_retry_after(response.headers.get("Retry-After")))
+            
+            if attempt >= max_retries or not (idempotent or response.status_code == 429):
+                return response
+            if stream:
+                await response.aclose()
+            
+            delay = backoff_delay(attempt)
+            logger.warning(f"{self.CHANNEL_TYPE} responded {response.status_code}. Retrying in {delay:.2f}s")
+            await asyncio.sleep(delay)
+        
+        return response
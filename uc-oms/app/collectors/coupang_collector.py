@@ -1,11 +1,14 @@
 import httpx
-from typing import List, Dict, Any
-from .base_collector import IProductCollector, IOrderCollector
+from typing import List, Dict, Any, Tuple
+from .base_collector import IProductCollector, IOrderCollector, HttpCollectorMixin
+from .json_stream import iter_json_items
 import hmac, hashlib, base64, time
+from datetime import timedelta
 from urllib.parse import urlencode, urlparse
 
-class CoupangCollector(IProductCollector):
+class CoupangCollector(HttpCollectorMixin, IProductCollector):
     BASE_URL="https://api-gateway.coupang.com"
+    CHANNEL_TYPE="coupang"
     
     def _generate_signature(self, method:str, path:str, query: str="") -> Dict[str, str]:
         datetime_gmt = time.strftime("%y%m%d", time.gmtime()) + "T" + time.strftime("%H%M%S", time.gmtime()) + "Z"
@@ -34,33 +37,54 @@ class CoupangCollector(IProductCollector):
         }
         
     async def fetch_products(self, page: int=1, page_size: int=50) -> List[Dict[str,Any]]:
+        products, _ = await self.fetch_product_page(page=page, page_size=page_size)
+        return products
+    
+    async def fetch_product_page(self, page: int=1, page_size: int=50) -> Tuple[List[Dict[str,Any]], bool]:
+        """
+        상품 한 페이지와 다음 페이지 존재 여부를 반환합니다.
+        쿠팡은 다음 페이지가 있을 때만 응답에 nextToken을 포함합니다.
+        """
         path = "/v2/providers/seller_api/apis/api/v1/marketplace/seller-products"
         query_params = {'pageSize': page_size, 'page': page}
+        query = urlencode(query_params)
         
-        headers = self._generate_signature("GET", path, query_params)
+        headers = self._generate_signature("GET", path, query)
         
-        url = f"{self.BASE_URL}{path}?{query_params}"
+        url = f"{path}?{query}"
         
-        async with httpx.AsyncClient() as client:
+        try:
+            response = await self._send("GET", url, headers=headers, stream=True)
             try:
-                response = await client.get(url, headers=headers)
-                response.raise_for_status()
-                data = response.json()
+                if not response.is_success:
+                    await response.aread()
+                    response.raise_for_status()
                 
+                # 응답 전체를 파싱하지 않고 data.content 항목을 받는 대로 필요한 필드만 추려 담습니다.
+                # 반환 형태가 페이지 단위 목록이므로, 추린 상품은 한 페이지(page_size)만큼 메모리에 유지됩니다.
                 products = []
-                for item in data.get('data',{}).get('content',[]):
-                    products.append({
-                        "channel_id": self.channel_id,
-                        "external_id": item.get('sellerPoductId'),
-                        "product_name": item.get('productName'),
-                        "status": item.get('salesStatus'),
-                        "channel_type": "coupang"
-                    })
-                return products
-            except httpx.HTTPStatusError as e:
-                raise ConnectionError(f"Coupang API Error: {e.response.status_code} - {e.response.text}") from e
-            except Exception as e:
-                raise ConnectionError(f"Coupang API Connection Failed: {e}") from e
+                has_next = False
+                async for key, value in iter_json_items(response, "data.content.item", ("nextToken",)):
+                    if key == "nextToken":
+                        has_next = bool(value)
+                    elif isinstance(value, dict):
+                        products.append({
+                            "channel_id": self.channel_id,
+                            "external_id": value.get('sellerProductId'),
+                            "product_name": value.get('productName'),
+                            "status": value.get('salesStatus'),
+                            "channel_type": "coupang"
+                        })
+            finally:
+                await response.aclose()
+            return products, has_next
+        except httpx.HTTPStatusError as e:
+            raise ConnectionError(f"Coupang API Error: {e.response.status_code} - {e.response.text}") from e
+        except Exception as e:
+            raise ConnectionError(f"Coupang API Connection Failed: {e}") from e
 
 class CoupangOrderCollector(IOrderCollector):
-    pass
\ No newline at end of file
+    MAX_QUERY_WINDOW = timedelta(days=31) # 발주서 목록 조회 최대 기간
+    PREPARATION_BATCH_SIZE = 50 # 상품준비중 처리 1회 최대 묶음배송번호 수
+    SHIPMENT_BATCH_SIZE = 50 # 송장업로드 1회 최대 건수
+    ORDER_PAGE_SIZE = 50 # 발주서 목록 조회 페이지당 최대 건수
\ No newline at end of file
@@ -0,0 +1,96 @@
+"""
+채널 API 응답 JSON을 스트리밍으로 파싱합니다.
+
+ijson(선택 의존성)이 설치되어 있으면 response.aiter_bytes()로 받는 대로 파싱하여, 응답 전체의 파이썬 객체 트리를 만들지 않고
+목록 항목을 하나씩 반환합니다. 메모리에는 현재 항목과 수신 버퍼만 유지됩니다.
+설치되어 있지 않으면 본문 전체를 읽어 response.json()으로 파싱한 뒤 같은 형태로 반환합니다.
+호출자(컬렉터의 fetch_product_page)는 반환된 항목을 페이지 단위 목록으로 모으므로, 메모리 사용량은 응답 본문 대신
+정규화된 상품 한 페이지 크기로 제한됩니다.
+"""
+from typing import Any, AsyncIterator, Iterable, List, Optional, Tuple
+
+import httpx
+
+try:
+    import ijson
+    from ijson.common import ObjectBuilder
+except ImportError:
+    ijson = None
+
+_SCALAR_EVENTS = {"null", "boolean", "integer", "double", "number", "string"}
+
+
+class _ResponseReader:
+    """
+    ijson 비동기 API가 요구하는 async read(size) 인터페이스를 response.aiter_bytes() 위에 제공합니다.
+    """
+    def __init__(self, response: httpx.Response):
+        self._chunks = response.aiter_bytes()
+        self._buffer = b""
+
+    async def read(self, size: int=-1) -> bytes:
+        if not self._buffer:
+            try:
+                self._buffer = await self._chunks.__anext__()
+            except StopAsyncIteration:
+                return b""
+        if size is None or size < 0 or size >= len(self._buffer):
+            data, self._buffer = self._buffer, b""
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+def _lookup(data: Any, path: List[str]) -> Optional[Any]:
+    for key in path:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
+async def iter_json_items(
+    response: httpx.Response,
+    items_prefix: str,
+    scalar_prefixes: Iterable[str]=()
+) -> AsyncIterator[Tuple[str, Any]]:
+    """
+    응답 본문에서 items_prefix(ijson prefix, 예: "data.content.item") 배열의 항목은 ("item", 항목)으로,
+    scalar_prefixes(예: "data.totalPages")에 해당하는 값은 (prefix, 값)으로 반환합니다.
+    response는 stream=True로 받은, 본문을 아직 읽지 않은 응답이어야 합니다. (닫기는 호출자가 수행)
+    """
+    scalar_prefixes = set(scalar_prefixes)
+
+    if ijson is None:
+        await response.aread()
+        data = response.json()
+        items = _lookup(data, items_prefix.split(".")[:-1])
+        for item in items if isinstance(items, list) else []:
+            yield "item", item
+        for prefix in scalar_prefixes:
+            value = _lookup(data, prefix.split("."))
+            if value is not None and not isinstance(value, (dict, list)):
+                yield prefix, value
+        return
+
+    builder: Optional[ObjectBuilder] = None
+    depth = 0
+    async for prefix, event, value in ijson.parse_async(_ResponseReader(response), use_float=True):
+        if builder is not None:
+            builder.event(event, value)
+            if event in ("start_map", "start_array"):
+                depth += 1
+            elif event in ("end_map", "end_array"):
+                depth -= 1
+            if depth == 0:
+                yield "item", builder.value
+                builder = None
+        elif prefix == items_prefix:
+            if event in ("start_map", "start_array"):
+                builder = ObjectBuilder()
+                builder.event(event, value)
+                depth = 1
+            elif event in _SCALAR_EVENTS:
+                yield "item", value
+        elif prefix in scalar_prefixes and event in _SCALAR_EVENTS:
+            yield prefix, value
@@ -1,13 +1,19 @@
 import json, time, hmac, hashlib, base64, logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from .base_collector import IProductCollector, IOrderCollector
+from .records import OrderRecord, OrderItemRecord
 from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
-class MockCollector(IProductCollector):
+class MockCollector(IProductCollector, IOrderCollector):
     BASE_URL = "test.mockCollector.test"
+    MOCK_TOTAL_PAGES = 3 # iter_products 페이지 순회 테스트용 전체 페이지 수
+    PREPARATION_BATCH_SIZE = 100
+    SHIPMENT_BATCH_SIZE = 100
+    # 목업 주문의 주문 일시 기준 시각. 주문 번호(초)만큼 더한 고정값을 사용하여, 같은 주문은 수집할 때마다 같은 content_hash를 갖습니다.
+    MOCK_ORDER_EPOCH = datetime(2026, 1, 1)
     
     
     async def fetch_products(self, page: int=1, page_size: int=50) -> List[Dict[str, Any]]:
@@ -30,7 +36,7 @@ class MockCollector(IProductCollector):
         mock_products = [
             {
                 "channel_id": self.channel_id,
-                "external_id": "P_MOCK_1001_",
+                "external_id": f"P_MOCK_1001_{page}",
                 "product_name": f"{self.channel_id} - 테스트 상품 A",
                 "status": "SALE",
                 "channel_type": "mock",
@@ -38,7 +44,7 @@ class MockCollector(IProductCollector):
             },
             {
                 "channel_id": self.channel_id,
-                "external_id": "P_MOCK_1002_",
+                "external_id": f"P_MOCK_1002_{page}",
                 "product_name": f"{self.channel_id} - 테스트 상품 B",
                 "status": "SOLD_OUT",
                 "channel_type": "mock",
@@ -47,42 +53,50 @@ class MockCollector(IProductCollector):
         ]
         return mock_products
     
-    async def fetch_orders(self, start_date: str, end_date: str) -> List[Dict[str, Any]]:
+    async def fetch_product_page(self, page: int=1, page_size: int=50) -> Tuple[List[Dict[str, Any]], bool]:
+        # 실제 채널처럼 MOCK_TOTAL_PAGES 페이지까지만 상품을 반환합니다.
+        if page > self.MOCK_TOTAL_PAGES:
+            return [], False
+        products = await self.fetch_products(page=page, page_size=page_size)
+        return products, page < self.MOCK_TOTAL_PAGES
+    
+    async def fetch_orders(self, start_date: str, end_date: str) -> List[OrderRecord]:
         channel_name = f"MockChannel_{self.channel_id}"
+        order_number = 10001
         
         mock_orders = [
             # 주문 1: 상품 2개
-            {
-                "channel_id": self.channel_id,
-                "channel_type": "mock",
-                "external_order_id": f"O_MOCK_{self.channel_id}_10001",
-                "order_date": (datetime.now() - timedelta(hours=1)),
-                "total_amount": 35000.0,
-                "recipient_name": "홍길동",
-                "recipient_phone": "010-1234-5678",
-                "shipping_address": "서울시 강남구 테스트로 123",
-                "uoms_status": "PAID",
-                "items": [
-                    {
-                        "external_item_id": f"I_MOCK_{self.channel_id}_10001_A",
-                        "product_name": f"{channel_name} - 노트북 파우치",
-                        "quantity": 1,
-                        "item_price": 20000.0,
-                        "courier_code": None,
-                        "tracking_number": None,
-                        "uoms_status": "PAID"
-                    },
-                    {
-                        "external_item_id": f"I_MOCK_{self.channel_id}_10001_B",
-                        "product_name": f"{channel_name} - 키보드",
-                        "quantity": 1,
-                        "item_price": 15000.0,
-                        "courier_code": None,
-                        "tracking_number": None,
-                        "uoms_status": "PAID"
-                    }
+            OrderRecord(
+                channel_id=self.channel_id,
+                channel_type="mock",
+                external_order_id=f"O_MOCK_{self.channel_id}_{order_number}",
+                order_date=self.MOCK_ORDER_EPOCH + timedelta(seconds=order_number),
+                total_amount=35000.0,
+                recipient_name="홍길동",
+                recipient_phone="010-1234-5678",
+                shipping_address="서울시 강남구 테스트로 123",
+                umos_status="PAID",
+                items=[
+                    OrderItemRecord(
+                        external_item_id=f"I_MOCK_{self.channel_id}_{order_number}_A",
+                        product_name=f"{channel_name} - 노트북 파우치",
+                        quantity=1,
+                        item_price=20000.0,
+                        courier_code=None,
+                        tracking_number=None,
+                        umos_status="PAID"
+                    ),
+                    OrderItemRecord(
+                        external_item_id=f"I_MOCK_{self.channel_id}_{order_number}_B",
+                        product_name=f"{channel_name} - 키보드",
+                        quantity=1,
+                        item_price=15000.0,
+                        courier_code=None,
+                        tracking_number=None,
+                        umos_status="PAID"
+                    )
                 ]
-            }
+            )
         ]
         
         return mock_orders
@@ -0,0 +1,112 @@
+import asyncio
+import logging
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveRateLimiter:
+    """
+    채널 하나의 모든 요청이 공유하는 토큰 버킷 기반 속도 제한기입니다.
+    - rate(초당 요청 수)만큼 토큰이 채워지고, 요청마다 토큰 하나를 사용합니다.
+    - 429 응답을 받으면 속도를 절반으로 낮추고, Retry-After 동안 모든 요청을 멈춥니다.
+    - 요청이 성공할 때마다 조금씩 속도를 올려 최대 속도(max_rate)까지 회복합니다.
+    """
+
+    DECREASE_FACTOR = 0.5   # 429 응답 시 속도 감소 비율
+    INCREASE_RATIO = 0.05   # 성공 응답 시 최대 속도 대비 증가량
+
+    def __init__(self, rate: float, capacity: int, min_rate: float):
+        self.max_rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated_at
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated_at = now
+
+    async def acquire(self) -> None:
+        """
+        요청 하나를 보낼 수 있을 때까지 대기합니다.
+        """
+        while True:
+            async with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now < self._blocked_until:
+                    wait = self._blocked_until - now
+                elif self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                else:
+                    wait = (1 - self._tokens) / self.rate
+            await asyncio.sleep(wait)
+
+    def on_success(self) -> None:
+        if self.rate < self.max_rate:
+            self.rate = min(self.max_rate, self.rate + self.max_rate * self.INCREASE_RATIO)
+
+    def on_throttle(self, retry_after: Optional[float] = None) -> None:
+        now = time.monotonic()
+        self._refill(now)
+        self.rate = max(self.min_rate, self.rate * self.DECREASE_FACTOR)
+        self._tokens = 0.0
+        if retry_after:
+            self._blocked_until = max(self._blocked_until, now + retry_after)
+        logger.warning(f"Rate limited by channel API. Slowing down to {self.rate:.2f} req/s (retry_after={retry_after})")
+
+
+# channel_id별로 공유되는 속도 제한기 저장소
+_limiters: Dict[int, AdaptiveRateLimiter] = {}
+
+
+def get_rate_limiter(channel_id: int, channel_type: str) -> AdaptiveRateLimiter:
+    """
+    채널에 해당하는 속도 제한기를 반환합니다. 속도와 버스트 크기는 채널 타입별 설정을 따릅니다.
+    """
+    limiter = _limiters.get(channel_id)
+    if limiter is None:
+        rate = settings.COLLECTOR_RATE_LIMITS.get(channel_type, settings.COLLECTOR_DEFAULT_RATE_LIMIT)
+        capacity = settings.COLLECTOR_RATE_BURSTS.get(channel_type, max(1, int(rate)))
+        limiter = AdaptiveRateLimiter(rate=rate, capacity=capacity, min_rate=settings.COLLECTOR_MIN_RATE_LIMIT)
+        _limiters[channel_id] = limiter
+    return limiter
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Retry-After 헤더(초 단위 숫자 또는 HTTP 날짜)를 대기 시간(초)으로 변환합니다.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def backoff_delay(attempt: int) -> float:
+    """
+    지수 백오프 + full jitter 대기 시간을 계산합니다. (attempt는 0부터 시작)
+    """
+    ceiling = min(settings.COLLECTOR_BACKOFF_MAX, settings.COLLECTOR_BACKOFF_BASE * (2 ** attempt))
+    return random.uniform(0, ceiling)
@@ -0,0 +1,209 @@
+"""
+컬렉터가 반환하는 정규화된 주문 레코드입니다.
+
+컬렉터는 채널 응답을 바로 OrderRecord/OrderItemRecord로 만들고, 수집 파이프라인은 validate()로 값만 확인한 뒤
+같은 객체로 DB 행(order_row/item_row)과 content_hash 입력(payload)을 만듭니다.
+dict → OrderBase(pydantic) → model_dump로 이어지던 변환을 거치지 않으며, __slots__를 사용하므로
+주문 하나에 인스턴스 __dict__가 생기지 않습니다.
+검증은 app.schemas.order.OrderBase/OrderItemBase의 필드 정의(타입, max_length, ge 등)로 만든 필드별 validator를 사용하므로,
+규칙과 타입 변환(숫자 문자열 → 숫자, ISO 문자열 → datetime 등)이 스키마와 같고 스키마를 바꾸면 함께 바뀝니다.
+"""
+from datetime import datetime
+from typing import Annotated, Any, Dict, List, Optional
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from app.schemas.order import OrderBase, OrderItemBase
+
+
+def _field_adapters(model: type[BaseModel], exclude: set[str]=frozenset()) -> Dict[str, TypeAdapter]:
+    return {
+        name: TypeAdapter(Annotated[(field.annotation, *field.metadata)]) if field.metadata else TypeAdapter(field.annotation)
+        for name, field in model.model_fields.items()
+        if name not in exclude
+    }
+
+
+_ORDER_FIELDS = _field_adapters(OrderBase, {"items"})
+_ORDER_ITEM_FIELDS = _field_adapters(OrderItemBase)
+
+
+def _validate_fields(record: Any, adapters: Dict[str, TypeAdapter]) -> None:
+    """
+    레코드의 각 필드를 스키마 필드 validator로 검증하고, 변환된 값으로 바꿉니다. 잘못된 값이면 ValueError를 발생시킵니다.
+    """
+    for name, adapter in adapters.items():
+        try:
+            setattr(record, name, adapter.validate_python(getattr(record, name)))
+        except ValidationError as e:
+            raise ValueError(f"{name}: {e.errors()[0]['msg']}") from None
+
+
+def _isoformat(value: datetime) -> str:
+    # OrderBase.model_dump(mode="json")과 같은 형식 (UTC는 "Z")으로 맞추어, 기존에 저장된 content_hash와 호환되도록 합니다.
+    text = value.isoformat()
+    return text[:-6] + "Z" if text.endswith("+00:00") else text
+
+
+class OrderItemRecord:
+    __slots__ = (
+        "external_item_id", "product_name", "quantity", "item_price",
+        "courier_code", "tracking_number", "umos_status",
+    )
+
+    def __init__(
+        self,
+        external_item_id: str,
+        product_name: str,
+        quantity: int,
+        item_price: float,
+        umos_status: str,
+        courier_code: Optional[str]=None,
+        tracking_number: Optional[str]=None
+    ):
+        self.external_item_id = external_item_id
+        self.product_name = product_name
+        self.quantity = quantity
+        self.item_price = item_price
+        self.courier_code = courier_code
+        self.tracking_number = tracking_number
+        self.umos_status = umos_status
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "OrderItemRecord":
+        return cls(
+            external_item_id=data["external_item_id"],
+            product_name=data["product_name"],
+            quantity=data["quantity"],
+            item_price=data["item_price"],
+            umos_status=data["umos_status"],
+            courier_code=data.get("courier_code"),
+            tracking_number=data.get("tracking_number")
+        )
+
+    def validate(self) -> None:
+        """
+        OrderItemBase의 필드 정의로 값을 검증하고 변환합니다. 잘못된 값이면 ValueError를 발생시킵니다.
+        """
+        _validate_fields(self, _ORDER_ITEM_FIELDS)
+
+    def payload(self) -> Dict[str, Any]:
+        """채널 데이터 (OrderItemBase.model_dump(mode="json")과 같은 형태). content_hash 계산과 dead letter 기록에 사용합니다."""
+        return {
+            "external_item_id": self.external_item_id,
+            "product_name": self.product_name,
+            "quantity": self.quantity,
+            "item_price": self.item_price,
+            "courier_code": self.courier_code,
+            "tracking_number": self.tracking_number,
+            "umos_status": self.umos_status,
+        }
+
+    def item_row(self, order_id: int) -> Dict[str, Any]:
+        """order_items 테이블 행 (content_hash 제외)"""
+        return {
+            "order_id": order_id,
+            "external_item_id": self.external_item_id,
+            "product_name": self.product_name,
+            "quantity": self.quantity,
+            "item_price": self.item_price,
+            "courier_name": self.courier_code,
+            "tracking_number": self.tracking_number,
+            "umos_status": self.umos_status,
+        }
+
+
+class OrderRecord:
+    __slots__ = (
+        "channel_id", "channel_type", "external_order_id", "order_date", "total_amount",
+        "recipient_name", "recipient_phone", "shipping_address", "umos_status", "items",
+    )
+
+    def __init__(
+        self,
+        channel_id: int,
+        channel_type: str,
+        external_order_id: str,
+        order_date: datetime,
+        total_amount: float,
+        recipient_name: str,
+        recipient_phone: str,
+        shipping_address: str,
+        umos_status: str,
+        items: List[OrderItemRecord]
+    ):
+        self.channel_id = channel_id
+        self.channel_type = channel_type
+        self.external_order_id = external_order_id
+        self.order_date = order_date
+        self.total_amount = total_amount
+        self.recipient_name = recipient_name
+        self.recipient_phone = recipient_phone
+        self.shipping_address = shipping_address
+        self.umos_status = umos_status
+        self.items = items
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "OrderRecord":
+        """
+        dict를 반환하는 컬렉터와의 호환용입니다. 필수 키가 없으면 KeyError가 발생합니다.
+        """
+        return cls(
+            channel_id=data["channel_id"],
+            channel_type=data["channel_type"],
+            external_order_id=data["external_order_id"],
+            order_date=data["order_date"],
+            total_amount=data["total_amount"],
+            recipient_name=data["recipient_name"],
+            recipient_phone=data["recipient_phone"],
+            shipping_address=data["shipping_address"],
+            umos_status=data["umos_status"],
+            items=[OrderItemRecord.from_dict(item) for item in data["items"]]
+        )
+
+    def validate(self) -> None:
+        """
+        OrderBase의 필드 정의로 주문과 상품의 값을 검증하고 변환합니다. 잘못된 값이면 ValueError를 발생시킵니다.
+        """
+        _validate_fields(self, _ORDER_FIELDS)
+        if not isinstance(self.items, list) or not self.items:
+            raise ValueError("items: at least one item is required")
+        for index, item in enumerate(self.items):
+            try:
+                item.validate()
+            except ValueError as e:
+                raise ValueError(f"items[{index}].{e}")
+
+    def payload(self) -> Dict[str, Any]:
+        """채널 데이터 (OrderBase.model_dump(mode="json", exclude={"items"})과 같은 형태)"""
+        return {
+            "channel_id": self.channel_id,
+            "channel_type": self.channel_type,
+            "external_order_id": self.external_order_id,
+            "order_date": _isoformat(self.order_date) if isinstance(self.order_date, datetime) else self.order_date,
+            "total_amount": self.total_amount,
+            "recipient_name": self.recipient_name,
+            "recipient_phone": self.recipient_phone,
+            "shipping_address": self.shipping_address,
+            "umos_status": self.umos_status,
+        }
+
+    def to_json(self) -> Dict[str, Any]:
+        """상품을 포함한 전체 데이터 (dead letter 기록용)"""
+        data = self.payload()
+        data["items"] = [item.payload() for item in self.items]
+        return data
+
+    def order_row(self) -> Dict[str, Any]:
+        """orders 테이블 행 (content_hash 제외)"""
+        return {
+            "channel_id": self.channel_id,
+            "channel_type": self.channel_type,
+            "external_order_id": self.external_order_id,
+            "order_date": self.order_date,
+            "total_amount": self.total_amount,
+            "recipient_name": self.recipient_name,
+            "recipient_phone": self.recipient_phone,
+            "shipping_address": self.shipping_address,
+            "umos_status": self.umos_status,
+        }
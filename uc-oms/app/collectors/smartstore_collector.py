@@ -1,12 +1,24 @@
 import httpx, json, time
-from typing import List, Dict, Any
-from .base_collector import IProductCollector, IOrderCollector
+from datetime import timedelta
+from typing import List, Dict, Any, Optional, Tuple
+from .base_collector import IProductCollector, IOrderCollector, HttpCollectorMixin
+from .json_stream import iter_json_items
+from .token_cache import token_cache
 
-class SmartstoreCollector(IProductCollector):
-    BASE_URL = "api.commerce.naver.com"
+class SmartstoreCollector(HttpCollectorMixin, IProductCollector):
+    BASE_URL = "https://api.commerce.naver.com"
+    CHANNEL_TYPE = "smartstore"
     AUTH_TOKEN_URL = "/external/v1/oauth2/token"
     
-    async def _get_access_token(self) -> str:
+    async def _get_access_token(self, force_refresh: bool=False) -> str:
+        """
+        채널별로 캐시된 액세스 토큰을 반환합니다. 만료가 임박한 경우에만 새로 발급받습니다.
+        """
+        if force_refresh:
+            token_cache.invalidate(self.channel_id)
+        return await token_cache.get(self.channel_id, self._request_access_token)
+    
+    async def _request_access_token(self) -> Tuple[str, Optional[float]]:
         client_id = self.api_key
         client_secret_sign = self.api_secret
         
@@ -24,22 +36,21 @@ class SmartstoreCollector(IProductCollector):
             "Content-Type": "application/x-www-form-urlencoded"
         }
         
-        async with httpx.AsyncClient() as client:
-           try:
-               response = await client.post(self.AUTH_TOKEN_URL, data=auth_data, headers=headers)
-               response.raise_for_status()
-               
-               token_data = response.json()
-               access_token = token_data.get("access_token")
-               
-               if not access_token:
-                   raise ConnectionError(f"Smartstore Token Error: Access token not found in response: {token_data}")
-               return access_token
-           except httpx.HTTPStatusError as e:
-               error_detail = e.response.text
-               raise ConnectionError(f"Smartstore API Auth Error: {e.response.status_code} - {error_detail}")
-           except Exception as e:
-               raise ConnectionError(f"Smartstore API Auth Failed: {e}")
+        try:
+            response = await self._send("POST", self.AUTH_TOKEN_URL, idempotent=True, data=auth_data, headers=headers)
+            response.raise_for_status()
+            
+            token_data = response.json()
+            access_token = token_data.get("access_token")
+            
+            if not access_token:
+                raise ConnectionError(f"Smartstore Token Error: Access token not found in response: {token_data}")
+            return access_token, token_data.get("expires_in")
+        except httpx.HTTPStatusError as e:
+            error_detail = e.response.text
+            raise ConnectionError(f"Smartstore API Auth Error: {e.response.status_code} - {error_detail}")
+        except Exception as e:
+            raise ConnectionError(f"Smartstore API Auth Failed: {e}")
         
     def _get_auth_headers(self, access_token: str) -> Dict[str, str]:
         
@@ -51,37 +62,71 @@ class SmartstoreCollector(IProductCollector):
             "Accept": "application/json",
             "Content-Type": "application/json"
         }
+    
+    async def _authorized_request(self, method: str, path: str, stream: bool=False, **kwargs) -> httpx.Response:
+        """
+        캐시된 토큰으로 요청을 보냅니다.
+        401 응답을 받으면 해당 토큰을 폐기하고 새 토큰으로 한 번만 재시도합니다.
+        """
+        access_token = await self._get_access_token()
+        response = await self._send(method, path, stream=stream, headers=self._get_auth_headers(access_token), **kwargs)
         
-    async def fetch_products(self, page: int=1, size: int=50) -> List[Dict[str,Any]]:
+        if response.status_code == httpx.codes.UNAUTHORIZED:
+            if stream:
+                await response.aclose()
+            token_cache.invalidate(self.channel_id, access_token)
+            access_token = await self._get_access_token()
+            response = await self._send(method, path, stream=stream, headers=self._get_auth_headers(access_token), **kwargs)
         
-        access_token = await self._get_access_token()
-        headers = self._get_auth_headers(access_token)
+        return response
         
+    async def fetch_products(self, page: int=1, page_size: int=50) -> List[Dict[str,Any]]:
+        products, _ = await self.fetch_product_page(page=page, page_size=page_size)
+        return products
+    
+    async def fetch_product_page(self, page: int=1, page_size: int=50) -> Tuple[List[Dict[str,Any]], bool]:
+        """
+        상품 한 페이지와 다음 페이지 존재 여부를 반환합니다.
+        응답의 totalPages를 기준으로 판단하고, 없으면 조회된 상품 수로 판단합니다.
+        """
         path = "/external/v1/products/search"
-        url = self.BASE_URL + path
 
-        payload = {"page": page -1, "size": size}
+        payload = {"page": page -1, "size": page_size}
         
-        async with httpx.AsyncClient() as client:
+        try:
+            response = await self._authorized_request("POST", path, stream=True, idempotent=True, content=json.dumps(payload))
             try:
-                response = await client.post(url, headers=headers, content=json.dumps(payload))
-                response.raise_for_status()
-                raw_data = response.json()
+                if not response.is_success:
+                    await response.aread()
+                    response.raise_for_status()
                 
+                # 응답 전체를 파싱하지 않고 data.content 항목을 받는 대로 필요한 필드만 추려 담습니다.
+                # 반환 형태가 페이지 단위 목록이므로, 추린 상품은 한 페이지(page_size)만큼 메모리에 유지됩니다.
                 products = []
-                for item in raw_data.get("data",{}).get('content',[]):
-                    products.append({
-                        "channel_id": self.channel_id,
-                        "external_id": item.get("id"),
-                        "product_name": item.get("name"),
-                        "status": item.get("statusType"),
-                        "channel_type": "smartstore"
-                    })
-                return products
-            except httpx.HTTPStatusError as e:
-                raise ConnectionError(f"Smartstore API Error: {e.response.status_code} - {e.response.text}") from e
-            except Exception as e:
-                raise ConnectionError(f"Smartstore API Connection Failed: {e}") from e
+                total_pages = None
+                async for key, value in iter_json_items(response, "data.content.item", ("data.totalPages",)):
+                    if key == "data.totalPages":
+                        total_pages = value
+                    elif isinstance(value, dict):
+                        products.append({
+                            "channel_id": self.channel_id,
+                            "external_id": value.get("id"),
+                            "product_name": value.get("name"),
+                            "status": value.get("statusType"),
+                            "channel_type": "smartstore"
+                        })
+            finally:
+                await response.aclose()
+            
+            has_next = page < total_pages if total_pages is not None else len(products) >= page_size
+            return products, has_next
+        except httpx.HTTPStatusError as e:
+            raise ConnectionError(f"Smartstore API Error: {e.response.status_code} - {e.response.text}") from e
+        except Exception as e:
+            raise ConnectionError(f"Smartstore API Connection Failed: {e}") from e
                     
 class SmartstoreOrderCollector(IOrderCollector):
-    pass
\ No newline at end of file
+    MAX_QUERY_WINDOW = timedelta(hours=24) # 변경 상품 주문 내역 조회 최대 기간
+    PREPARATION_BATCH_SIZE = 30 # 발주 확인 처리 1회 최대 상품 주문 수
+    SHIPMENT_BATCH_SIZE = 30 # 발송 처리 1회 최대 상품 주문 수
+    ORDER_PAGE_SIZE = 300 # 변경 상품 주문 내역 조회 1회 최대 건수
\ No newline at end of file
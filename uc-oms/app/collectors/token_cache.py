@@ -0,0 +1,74 @@
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 토큰 발급 함수: (access_token, expires_in[초]) 를 반환하는 코루틴 함수
+TokenFetcher = Callable[[], Awaitable[Tuple[str, Optional[float]]]]
+
+
+class TokenCache:
+    """
+    만료 시간을 고려하는 OAuth 액세스 토큰 캐시입니다.
+    - 채널 ID 등의 키별로 토큰과 만료 시각을 보관합니다.
+    - 만료 refresh_margin초 전부터는 토큰을 갱신 대상으로 간주합니다.
+    - 같은 키에 대한 갱신은 한 코루틴만 수행하고, 나머지는 그 결과를 기다립니다. (single-flight)
+    """
+
+    def __init__(self, refresh_margin: float, default_ttl: float):
+        self.refresh_margin = refresh_margin
+        self.default_ttl = default_ttl
+        self._tokens: Dict[Hashable, Tuple[str, float]] = {}
+        self._locks: Dict[Hashable, asyncio.Lock] = {}
+
+    def _get_valid(self, key: Hashable) -> Optional[str]:
+        cached = self._tokens.get(key)
+        if cached is None:
+            return None
+        token, expires_at = cached
+        if time.monotonic() >= expires_at - self.refresh_margin:
+            return None
+        return token
+
+    async def get(self, key: Hashable, fetcher: TokenFetcher) -> str:
+        """
+        유효한 캐시 토큰을 반환합니다. 없거나 곧 만료되면 fetcher로 새 토큰을 발급받습니다.
+        """
+        token = self._get_valid(key)
+        if token is not None:
+            return token
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # 락을 기다리는 동안 다른 코루틴이 이미 갱신했을 수 있으므로 다시 확인
+            token = self._get_valid(key)
+            if token is not None:
+                return token
+
+            token, expires_in = await fetcher()
+            ttl = float(expires_in) if expires_in else self.default_ttl
+            self._tokens[key] = (token, time.monotonic() + ttl)
+            logger.debug(f"Access token refreshed for {key} (expires in {ttl:.0f}s)")
+            return token
+
+    def invalidate(self, key: Hashable, token: Optional[str] = None) -> None:
+        """
+        캐시된 토큰을 폐기합니다.
+        token이 주어지면 현재 캐시된 토큰과 같을 때만 폐기하여, 이미 갱신된 새 토큰을 지우지 않도록 합니다.
+        """
+        cached = self._tokens.get(key)
+        if cached is None:
+            return
+        if token is None or cached[0] == token:
+            self._tokens.pop(key, None)
+
+
+# Smartstore 등 OAuth 기반 채널에서 공유하는 토큰 캐시 (키: channel_id)
+token_cache = TokenCache(
+    refresh_margin=settings.OAUTH_TOKEN_REFRESH_MARGIN,
+    default_ttl=settings.OAUTH_TOKEN_DEFAULT_TTL,
+)
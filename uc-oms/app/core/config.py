@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Dict, Optional
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict # pydantic v2 이상에서는 pydantic_settings 사용
 
@@ -21,13 +21,99 @@ class Settings(BaseSettings):
     MYSQL_PASSWORD: str = Field(..., env='MYSQL_PASSWORD')
     MYSQL_HOST: str = Field(..., env='MYSQL_HOST')
     MYSQL_DATABASE: str = Field(..., env='MYSQL_DATABASE')
+    # 읽기 전용 복제본(replica) 호스트. 지정하면 목록 조회/내보내기 등 읽기 전용 요청이 복제본으로 전달됩니다.
+    MYSQL_REPLICA_HOST: Optional[str] = None
+
+    # 커넥션 풀 설정 (엔진별로 적용)
+    DB_POOL_SIZE: int = 10                    # 상시 유지할 커넥션 수
+    DB_MAX_OVERFLOW: int = 20                 # pool_size를 넘어 추가로 열 수 있는 커넥션 수
+    DB_POOL_TIMEOUT: float = 30.0             # 풀에서 커넥션을 얻기까지 기다릴 최대 시간 (초)
+    DB_POOL_RECYCLE: int = 1800               # 커넥션 재생성 주기 (초). MySQL wait_timeout보다 짧게 설정
+    DB_CONNECT_TIMEOUT: int = 10              # DB 서버 TCP 연결 타임아웃 (초)
+    DB_READ_POOL_SIZE: int = 10               # 복제본 엔진의 pool_size
+    DB_READ_MAX_OVERFLOW: int = 20            # 복제본 엔진의 max_overflow
     
     # ==================
     # Security Settings
     # ==================
     SECRET_KEY: str = Field(..., env='SECRET_KEY')
+    # 키 교체 시 이전 SECRET_KEY들을 쉼표로 구분하여 지정 (복호화에만 사용, 암호화는 항상 SECRET_KEY)
+    PREVIOUS_SECRET_KEYS: str = ""
     ALGORITHM: str = Field("HS256", env='ALGORITHM')
-    
+    CRYPTO_EXECUTOR_WORKERS: int = 4          # bcrypt/Fernet 연산을 이벤트 루프 밖에서 실행할 전용 스레드 수
+
+    # ==================
+    # HTTP Client Settings (외부 채널 API 통신)
+    # ==================
+    # 채널 타입별로 하나씩 생성되는 공용 httpx.AsyncClient의 커넥션 풀 설정
+    HTTP_MAX_CONNECTIONS: int = 100           # 클라이언트당 최대 동시 커넥션 수
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20  # 유휴 상태로 유지할 keep-alive 커넥션 수
+    HTTP_KEEPALIVE_EXPIRY: float = 30.0       # 유휴 커넥션 유지 시간 (초)
+    HTTP_TIMEOUT: float = 10.0                # 읽기/쓰기/풀 대기 타임아웃 (초)
+    HTTP_CONNECT_TIMEOUT: float = 5.0         # TCP/TLS 연결 타임아웃 (초)
+    HTTP2_ENABLED: bool = False               # HTTP/2 사용 여부 (h2 패키지 필요)
+
+    # OAuth 액세스 토큰 캐시 설정 (Smartstore 등)
+    OAUTH_TOKEN_REFRESH_MARGIN: float = 60.0  # 만료 몇 초 전부터 토큰을 미리 갱신할지
+    OAUTH_TOKEN_DEFAULT_TTL: float = 600.0    # 응답에 expires_in이 없을 때 적용할 유효 시간 (초)
+
+    # ==================
+    # Collector Settings
+    # ==================
+    PRODUCT_FETCH_CONCURRENCY: int = 10       # 전체 채널 상품 조회 시 동시에 호출할 최대 채널 수
+    PRODUCT_FETCH_CHANNEL_TIMEOUT: float = 15.0  # 채널 하나당 상품 조회 제한 시간 (초)
+    PRODUCT_PAGE_PREFETCH: int = 1            # 전체 상품 순회 시 미리 요청해 둘 다음 페이지 수
+    COLLECTOR_CACHE_TTL: float = 300.0        # 복호화된 키로 생성한 컬렉터 인스턴스를 재사용할 시간 (초)
+
+    # 상품 스냅샷(products 테이블) 설정. 조회 시 스냅샷이 TTL보다 오래되었으면 백그라운드에서 갱신합니다.
+    PRODUCT_SNAPSHOT_TTL: float = 600.0       # 기본 스냅샷 유효 시간 (초)
+    PRODUCT_SNAPSHOT_TTLS: Dict[str, float] = {}  # 채널 타입별 유효 시간 (예: {"coupang": 1800})
+    PRODUCT_SNAPSHOT_PAGE_SIZE: int = 100     # 스냅샷 갱신 시 채널 API 페이지 크기
+    PRODUCT_SNAPSHOT_BATCH_SIZE: int = 500    # 스냅샷 갱신 시 한 번의 INSERT 문에 담을 상품 수
+    PRODUCT_SNAPSHOT_REFRESH_CONCURRENCY: int = 10  # 프로세스 전체에서 동시에 실행할 최대 스냅샷 갱신(채널 크롤링) 수
+
+    # 채널 타입별 요청 속도 제한 (초당 요청 수 / 순간 허용 버스트). 각 플랫폼의 판매자별 정책에 맞게 조정합니다.
+    COLLECTOR_RATE_LIMITS: Dict[str, float] = {"coupang": 10.0, "smartstore": 5.0}
+    COLLECTOR_RATE_BURSTS: Dict[str, int] = {"coupang": 10, "smartstore": 5}
+    COLLECTOR_DEFAULT_RATE_LIMIT: float = 5.0 # 위 목록에 없는 채널 타입의 기본값
+    COLLECTOR_MIN_RATE_LIMIT: float = 0.5     # 429 응답으로 속도를 낮출 때의 하한
+    COLLECTOR_MAX_RETRIES: int = 3            # 429/5xx/네트워크 오류 시 최대 재시도 횟수
+    COLLECTOR_BACKOFF_BASE: float = 0.5       # 지수 백오프 기본 대기 시간 (초)
+    COLLECTOR_BACKOFF_MAX: float = 30.0       # 지수 백오프 최대 대기 시간 (초)
+
+    # ==================
+    # Order Ingest Settings
+    # ==================
+    ORDER_INGEST_BATCH_SIZE: int = 500        # 주문 일괄 UPSERT 시 한 번의 INSERT 문에 담을 주문 수
+    ORDER_SYNC_OVERLAP_MINUTES: int = 10      # 증분 동기화 시 마지막 동기화 시점보다 앞당겨 다시 조회할 구간 (분)
+    ORDER_SYNC_INITIAL_LOOKBACK_HOURS: int = 24  # 동기화 기록이 없는 채널의 최초 수집 구간 (시간)
+    ORDER_BACKFILL_CONCURRENCY: int = 4       # 과거 주문 백필 시 동시에 수집할 구간(shard) 수
+    ORDER_PIPELINE_FETCH_CONCURRENCY: int = 2 # 파이프라인 수집 단계에서 동시에 조회할 구간 수
+    ORDER_PIPELINE_QUEUE_SIZE: int = 4        # 단계 사이 큐에 쌓아둘 최대 페이지/묶음 수 (가득 차면 앞 단계가 대기하여 메모리 사용량을 제한)
+    ORDER_PAGE_PREFETCH: int = 1              # 주문 페이지 순회 시 미리 요청해 둘 다음 페이지 수
+    ORDER_EXPORT_YIELD_PER: int = 1000        # 주문 내보내기 시 서버 사이드 커서에서 한 번에 읽을 행 수
+    ORDER_BULK_CHUNK_CONCURRENCY: int = 4     # 대량 발주 확인/발송 처리 시 동시에 호출할 최대 묶음(chunk) 수
+    ORDER_OUTBOX_FLUSH_INTERVAL: float = 5.0  # 상태 변경 outbox를 채널로 전송하는 주기 (초, 워커에서 실행)
+    ORDER_OUTBOX_BATCH_SIZE: int = 500        # 한 번에 처리할 outbox 이벤트 수
+    ORDER_OUTBOX_MAX_ATTEMPTS: int = 5        # 이벤트당 최대 전송 시도 횟수
+    ORDER_OUTBOX_RETRY_DELAY: int = 30        # 전송 실패 이벤트의 재시도 대기 시간 기본값 (초, 시도마다 2배)
+    ORDER_OUTBOX_MAX_RETRY_DELAY: int = 900   # 재시도 대기 시간 상한 (초)
+    ORDER_OUTBOX_CLAIM_TIMEOUT: int = 300     # 가져간 이벤트의 전송 제한 시간 (초). 지나면 IN_FLIGHT 이벤트를 다시 가져감
+
+    # 주기적 주문 동기화 스케줄러 (기본적으로 워커에서 `python -m app.worker --with-scheduler`로 실행)
+    SYNC_SCHEDULER_ENABLED: bool = False      # True이면 API 프로세스(app.main lifespan)에서도 스케줄러를 실행 (워커 없이 단독 실행 시)
+    ORDER_SYNC_INTERVAL_SECONDS: float = 300.0  # 채널별 증분 동기화 주기 (초)
+    ORDER_SYNC_JITTER_SECONDS: float = 30.0   # 워커들이 동시에 깨어나지 않도록 주기에 더하는 무작위 지연 (초)
+    ORDER_SYNC_LEASE_SECONDS: int = 600       # 동기화 lease 유효 시간 (초). 워커가 죽으면 이 시간 후 다른 워커가 이어받음
+    ORDER_SYNC_CONCURRENCY: int = 4           # 워커 하나가 동시에 동기화할 최대 채널 수
+
+    # 수집 작업 큐(sync_jobs) 워커 설정 (python -m app.worker)
+    SYNC_WORKER_CONCURRENCY: int = 4          # 워커 프로세스 하나가 동시에 실행할 작업 수
+    SYNC_WORKER_POLL_INTERVAL: float = 2.0    # 실행할 작업이 없을 때 큐를 다시 조회하기까지 대기 시간 (초)
+    SYNC_JOB_VISIBILITY_TIMEOUT: int = 900    # 작업 실행 제한 시간 (초). 지나면 다른 워커가 작업을 다시 가져감
+    SYNC_JOB_MAX_ATTEMPTS: int = 3            # 작업당 최대 실행 횟수
+    SYNC_JOB_RETRY_DELAY: int = 30            # 실패한 작업의 재시도 대기 시간 기본값 (초, 시도마다 2배)
+
 
     # 2. computed property를 사용하여 SQLAlchemy URL 생성
     @property
@@ -42,6 +128,15 @@ class Settings(BaseSettings):
         # MySQL 8.0 이상에서 Caching SHA2 인증 문제 발생 시: 
         # return f"mysql+mysqlclient://{self.MYSQL_USER}:{self.MYSQL_PASSWORD}@{self.MYSQL_HOST}/{self.MYSQL_DATABASE}?charset=utf8mb4"
 
+    @property
+    def DATABASE_READ_URL(self) -> Optional[str]:
+        """
+        읽기 전용 복제본 연결 URL을 반환합니다. MYSQL_REPLICA_HOST가 없으면 None입니다.
+        """
+        if not self.MYSQL_REPLICA_HOST:
+            return None
+        return f"mysql+aiomysql://{self.MYSQL_USER}:{self.MYSQL_PASSWORD}@{self.MYSQL_REPLICA_HOST}/{self.MYSQL_DATABASE}?client_flag=2"
+
 
 # 3. 애플리케이션 전체에서 사용할 설정 객체 인스턴스 생성
 settings = Settings()
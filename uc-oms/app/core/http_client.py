@@ -0,0 +1,74 @@
+import logging
+from typing import Dict, Optional
+
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 채널 타입(coupang, smartstore 등)별로 하나씩 유지되는 공용 AsyncClient 저장소
+# 요청마다 AsyncClient를 새로 만들면 매번 TCP/TLS 핸드셰이크가 발생하므로,
+# 프로세스 전체에서 커넥션 풀을 공유하고 애플리케이션 종료 시점에 한 번에 닫습니다.
+_clients: Dict[str, httpx.AsyncClient] = {}
+
+
+def _http2_available() -> bool:
+    """
+    HTTP/2 사용에 필요한 h2 패키지가 설치되어 있는지 확인합니다.
+    """
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _build_client(channel_type: str, base_url: Optional[str]) -> httpx.AsyncClient:
+    """
+    settings의 커넥션 풀/타임아웃 설정을 적용한 AsyncClient를 생성합니다.
+    """
+    http2 = settings.HTTP2_ENABLED
+    if http2 and not _http2_available():
+        logger.warning("HTTP2_ENABLED is set but 'h2' is not installed. Falling back to HTTP/1.1.")
+        http2 = False
+
+    limits = httpx.Limits(
+        max_connections=settings.HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY,
+    )
+    timeout = httpx.Timeout(settings.HTTP_TIMEOUT, connect=settings.HTTP_CONNECT_TIMEOUT)
+
+    logger.info(f"Creating shared HTTP client for channel type '{channel_type}' (http2={http2})")
+    return httpx.AsyncClient(
+        base_url=base_url or "",
+        limits=limits,
+        timeout=timeout,
+        http2=http2,
+    )
+
+
+def get_http_client(channel_type: str, base_url: Optional[str] = None) -> httpx.AsyncClient:
+    """
+    채널 타입에 해당하는 공용 AsyncClient를 반환합니다. 없으면 새로 생성합니다.
+    반환된 클라이언트는 호출자가 닫지 않아야 합니다. (close_http_clients에서 일괄 종료)
+    """
+    client = _clients.get(channel_type)
+    if client is None or client.is_closed:
+        client = _build_client(channel_type, base_url)
+        _clients[channel_type] = client
+    return client
+
+
+async def close_http_clients() -> None:
+    """
+    생성된 모든 공용 AsyncClient를 닫습니다. FastAPI 종료(lifespan) 시 호출됩니다.
+    """
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.warning(f"Failed to close HTTP client: {e}")
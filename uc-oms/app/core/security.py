@@ -1,6 +1,8 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from passlib.context import CryptContext
-from cryptography.fernet import Fernet
-from typing import Optional
+from cryptography.fernet import Fernet, MultiFernet, InvalidToken
+from typing import Any, Callable, List, Optional, TypeVar
 
 from app.core.config import settings
 
@@ -13,18 +15,50 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 # SECRET_KEY를 Fernet 키로 변환하여 사용합니다.
 # Fernet 키는 32 URL-safe base64-encoded bytes여야 합니다. 
 # settings.SECRET_KEY가 이 요건을 충족하지 않을 경우 예외 처리가 필요할 수 있습니다.
+# 키 교체를 위해 MultiFernet을 사용합니다.
+# - 암호화는 항상 첫 번째 키(SECRET_KEY)로 수행합니다.
+# - 복호화는 SECRET_KEY, PREVIOUS_SECRET_KEYS 순서로 시도하므로 교체 작업 중에도 기존 데이터를 읽을 수 있습니다.
+def _build_fernet(key: str) -> Fernet:
+    return Fernet(key.encode('utf-8').ljust(44, b'='))
+
+def _previous_secret_keys() -> List[str]:
+    return [key.strip() for key in settings.PREVIOUS_SECRET_KEYS.split(",") if key.strip()]
+
 try:
     # SECRET_KEY가 Fernet 요구사항을 충족한다고 가정하고 초기화
     # 실제 프로덕션 환경에서는 settings.SECRET_KEY를 기반으로 Fernet 키를 안전하게 생성하고 관리해야 합니다.
     # 여기서는 간단하게 SECRET_KEY를 Fernet 인스턴스 초기화에 사용합니다.
-    cipher = Fernet(settings.SECRET_KEY.encode('utf-8').ljust(44, b'='))
+    primary_cipher = _build_fernet(settings.SECRET_KEY)
+    cipher = MultiFernet([primary_cipher] + [_build_fernet(key) for key in _previous_secret_keys()])
 except Exception as e:
     # 실제로는 키 길이가 32바이트가 아닌 경우 등을 처리해야 합니다.
     print(f"Error initializing Fernet: {e}")
     # 임시적으로 더미 키를 사용하거나, 애플리케이션 시작을 중단할 수 있습니다.
+    primary_cipher = None
     cipher = None
 
 
+# 3. 암호화 연산 전용 스레드 풀
+# bcrypt는 의도적으로 수십~수백 ms가 걸리므로 이벤트 루프에서 직접 실행하면 같은 워커의 모든 요청이 멈춥니다.
+# 기본 스레드 풀(DB 드라이버, 동기 엔드포인트 등과 공유)을 점유하지 않도록 크기가 제한된 별도 풀을 사용합니다.
+_crypto_executor = ThreadPoolExecutor(
+    max_workers=settings.CRYPTO_EXECUTOR_WORKERS,
+    thread_name_prefix="crypto"
+)
+
+T = TypeVar("T")
+
+async def run_in_crypto_executor(func: Callable[..., T], *args: Any) -> T:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_crypto_executor, func, *args)
+
+def shutdown_crypto_executor() -> None:
+    """
+    애플리케이션 종료 시 암호화 전용 스레드 풀을 정리합니다.
+    """
+    _crypto_executor.shutdown(wait=False)
+
+
 # ==================================
 # I. 비밀번호 해싱 함수
 # ==================================
@@ -41,6 +75,18 @@ def get_password_hash(password: str) -> str:
     """
     return pwd_context.hash(password)
 
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    verify_password의 비동기 버전. 암호화 전용 스레드 풀에서 실행합니다.
+    """
+    return await run_in_crypto_executor(verify_password, plain_password, hashed_password)
+
+async def get_password_hash_async(password: str) -> str:
+    """
+    get_password_hash의 비동기 버전. 암호화 전용 스레드 풀에서 실행합니다.
+    """
+    return await run_in_crypto_executor(get_password_hash, password)
+
 
 # ==================================
 # II. 데이터 암호화/복호화 함수 (API Keys, Secrets 용도)
@@ -68,4 +114,44 @@ def decrypt_data(encrypted_data: str) -> Optional[str]:
         except Exception:
             # 복호화 실패(잘못된 키, 손상된 데이터 등) 시 None 반환
             return None
+    return None
+
+async def encrypt_data_async(data: str) -> Optional[str]:
+    """
+    encrypt_data의 비동기 버전. 암호화 전용 스레드 풀에서 실행합니다.
+    """
+    return await run_in_crypto_executor(encrypt_data, data)
+
+async def decrypt_data_async(encrypted_data: str) -> Optional[str]:
+    """
+    decrypt_data의 비동기 버전. 암호화 전용 스레드 풀에서 실행합니다.
+    """
+    return await run_in_crypto_executor(decrypt_data, encrypted_data)
+
+# ==================================
+# III. 키 교체(rotation) 함수
+# ==================================
+
+def is_encrypted_with_primary_key(encrypted_data: str) -> bool:
+    """
+    데이터가 현재 SECRET_KEY로 암호화되어 있는지 확인합니다. (이미 교체된 데이터 판별용)
+    """
+    if primary_cipher:
+        try:
+            primary_cipher.decrypt(encrypted_data.encode())
+            return True
+        except InvalidToken:
+            return False
+    return False
+
+def rotate_data(encrypted_data: str) -> Optional[str]:
+    """
+    이전 키로 암호화된 데이터를 복호화하여 현재 SECRET_KEY로 다시 암호화합니다.
+    어떤 키로도 복호화할 수 없으면 None을 반환합니다.
+    """
+    if cipher:
+        try:
+            return cipher.rotate(encrypted_data.encode()).decode()
+        except InvalidToken:
+            return None
     return None
\ No newline at end of file
@@ -0,0 +1,149 @@
+"""
+채널 API 키/시크릿 암호화 키 교체(rotation) 배치 작업입니다.
+
+사용 절차:
+1. 새 키를 SECRET_KEY로, 기존 키를 PREVIOUS_SECRET_KEYS에 지정하고 애플리케이션을 재시작합니다.
+   (이 시점부터 신규 데이터는 새 키로 암호화되고, 기존 데이터는 이전 키로 복호화됩니다.)
+2. 이 작업을 실행하여 channel_configs의 api_key/api_secret을 새 키로 다시 암호화합니다.
+       python -m app.jobs.rotate_channel_secrets --batch-size 200
+3. 작업이 끝나면 PREVIOUS_SECRET_KEYS에서 이전 키를 제거합니다.
+
+- id 순서로 batch_size개씩 읽고 청크마다 커밋하므로 테이블을 오래 잠그지 않고, API는 계속 요청을 처리합니다.
+- 이미 새 키로 암호화된 행은 건너뛰므로 중단된 경우 다시 실행하면 이어서 처리됩니다.
+  (--start-after-id로 마지막으로 출력된 id 이후부터 시작할 수도 있습니다.)
+- 작업 도중 관리자가 같은 채널의 키를 수정한 경우, 해당 행은 덮어쓰지 않습니다.
+"""
+import argparse
+import asyncio
+import logging
+from typing import Optional
+
+from pydantic import BaseModel
+from sqlalchemy import select, update, and_, bindparam
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core import security
+from app.core.database import AsyncSessionLocal
+from app.models.channel import ChannelConfig
+from app.services.collector_cache import collector_cache
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+channel_table = ChannelConfig.__table__
+
+# 읽은 시점의 암호문과 같을 때만 갱신하여, 작업 도중 관리자가 수정한 값을 덮어쓰지 않습니다.
+ROTATE_STMT = (
+    update(channel_table)
+    .where(and_(
+        channel_table.c.id == bindparam("b_id"),
+        channel_table.c.api_key == bindparam("b_old_api_key"),
+        channel_table.c.api_secret == bindparam("b_old_api_secret"),
+    ))
+    .values(api_key=bindparam("b_api_key"), api_secret=bindparam("b_api_secret"))
+)
+
+
+class KeyRotationReport(BaseModel):
+    """키 교체 작업 진행 상황"""
+    scanned: int = 0    # 읽은 행 수
+    rotated: int = 0    # 새 키로 다시 암호화한 행 수
+    skipped: int = 0    # 이미 새 키로 암호화되어 있던 행 수
+    failed: int = 0     # 어떤 키로도 복호화할 수 없는 행 수
+    last_id: int = 0    # 마지막으로 처리한 id (재시작 지점)
+
+
+def _rotate_row(api_key: str, api_secret: str) -> tuple[str, Optional[str], Optional[str]]:
+    """
+    한 행의 키/시크릿을 교체합니다. ("skipped" | "rotated" | "failed", 새 api_key, 새 api_secret)
+    """
+    if security.is_encrypted_with_primary_key(api_key) and security.is_encrypted_with_primary_key(api_secret):
+        return "skipped", None, None
+
+    new_api_key = security.rotate_data(api_key)
+    new_api_secret = security.rotate_data(api_secret)
+    if new_api_key is None or new_api_secret is None:
+        return "failed", None, None
+    return "rotated", new_api_key, new_api_secret
+
+
+async def _rotate_chunk(session: AsyncSession, after_id: int, batch_size: int, report: KeyRotationReport) -> int:
+    """
+    after_id 다음부터 batch_size개의 행을 교체하고 커밋합니다. 처리한 행 수를 반환합니다.
+    """
+    stmt = (
+        select(ChannelConfig.id, ChannelConfig.api_key, ChannelConfig.api_secret)
+        .where(ChannelConfig.id > after_id)
+        .order_by(ChannelConfig.id)
+        .limit(batch_size)
+    )
+    rows = (await session.execute(stmt)).all()
+    if not rows:
+        return 0
+
+    params = []
+    rotated_ids = []
+    for channel_id, api_key, api_secret in rows:
+        outcome, new_api_key, new_api_secret = await security.run_in_crypto_executor(_rotate_row, api_key, api_secret)
+        if outcome == "rotated":
+            params.append({
+                "b_id": channel_id,
+                "b_old_api_key": api_key,
+                "b_old_api_secret": api_secret,
+                "b_api_key": new_api_key,
+                "b_api_secret": new_api_secret,
+            })
+            rotated_ids.append(channel_id)
+        elif outcome == "skipped":
+            report.skipped += 1
+        else:
+            report.failed += 1
+            logger.error(f"Channel {channel_id}: api_key/api_secret cannot be decrypted with any configured key.")
+
+    if params:
+        await session.execute(ROTATE_STMT, params)
+    await session.commit()
+
+    for channel_id in rotated_ids:
+        collector_cache.invalidate(channel_id)
+
+    report.scanned += len(rows)
+    report.rotated += len(params)
+    report.last_id = rows[-1][0]
+    return len(rows)
+
+
+async def rotate_channel_secrets(
+    batch_size: int = 100,
+    start_after_id: int = 0,
+    session_factory: async_sessionmaker[AsyncSession] = AsyncSessionLocal
+) -> KeyRotationReport:
+    """
+    channel_configs 전체를 청크 단위로 순회하며 api_key/api_secret을 현재 SECRET_KEY로 다시 암호화합니다.
+    """
+    if security.cipher is None:
+        raise RuntimeError("Fernet cipher is not initialized. Check SECRET_KEY / PREVIOUS_SECRET_KEYS.")
+
+    report = KeyRotationReport(last_id=start_after_id)
+    while True:
+        # 청크마다 새 세션(짧은 트랜잭션)을 사용합니다.
+        async with session_factory() as session:
+            processed = await _rotate_chunk(session, report.last_id, batch_size, report)
+        if processed == 0:
+            break
+        logger.info(
+            f"Key rotation progress: scanned={report.scanned} rotated={report.rotated} "
+            f"skipped={report.skipped} failed={report.failed} last_id={report.last_id}"
+        )
+
+    logger.info(f"Key rotation finished: {report.model_dump()}")
+    return report
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Re-encrypt channel API secrets with the current SECRET_KEY")
+    parser.add_argument("--batch-size", type=int, default=100, help="청크(커밋) 단위 행 수")
+    parser.add_argument("--start-after-id", type=int, default=0, help="이 id 이후부터 처리 (재시작 지점)")
+    args = parser.parse_args()
+    asyncio.run(rotate_channel_secrets(batch_size=args.batch_size, start_after_id=args.start_after_id))
@@ -1,9 +1,31 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, APIRouter
 from app.api.v1.admin.channels import router as channel_router
 from app.api.v1.admin.products import router as product_router
 from app.api.v1.admin.orders import router as order_router
-from app.core.database import Base, engine
+from app.api.v1.admin.sync_jobs import router as sync_job_router
+from app.core.database import Base, engine, dispose_engines
 from app.core.config import settings
+from app.core.http_client import close_http_clients
+from app.core.security import shutdown_crypto_executor
+from app.services.sync_scheduler import OrderSyncScheduler
+
+
+# 0. 애플리케이션 수명 주기(lifespan) 관리
+# 주기적 주문 동기화는 워커 프로세스(app.worker --with-scheduler)에서 실행하고, API 프로세스에서는
+# SYNC_SCHEDULER_ENABLED=True일 때만 실행합니다. (워커 없이 단독 실행 시. 여러 프로세스여도 채널별 DB lease로 한 곳만 동기화)
+# 종료 시점에 스케줄러를 멈추고 채널별 공용 HTTP 클라이언트(커넥션 풀), 암호화 전용 스레드 풀, DB 커넥션 풀을 정리합니다.
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    scheduler = OrderSyncScheduler() if settings.SYNC_SCHEDULER_ENABLED else None
+    if scheduler:
+        scheduler.start()
+    yield
+    if scheduler:
+        await scheduler.stop()
+    await close_http_clients()
+    shutdown_crypto_executor()
+    await dispose_engines()
 
 # 1. FastAPI 애플리케이션 인스턴스 생성 및 설정
 app = FastAPI(
@@ -11,7 +33,8 @@ app = FastAPI(
     description="통합 주문 관리 시스템 백엔드 API",
     version="0.0.3",
     docs_url="/docs",       # Swagger UI 경로
-    redoc_url="/redoc"      # ReDoc 문서 경로
+    redoc_url="/redoc",     # ReDoc 문서 경로
+    lifespan=lifespan
 )
 
 # 2. 데이터베이스 테이블 초기화 (선택적)
@@ -38,6 +61,7 @@ admin_router = APIRouter(prefix="/admin")
 admin_router.include_router(channel_router) # /admin/channels 로 경로 설정
 admin_router.include_router(product_router)
 admin_router.include_router(order_router)
+admin_router.include_router(sync_job_router)
 
 # 3.2. 메인 애플리케이션에 라우터 연결
 app.include_router(admin_router, prefix=API_V1_PREFIX)
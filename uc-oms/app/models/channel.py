@@ -24,6 +24,8 @@ class ChannelConfig(Base):
 
     # 관리 및 상태 정보
     is_active = Column(Boolean, default=True) # 주문 수집 활성화 여부
+    last_sync_at = Column(DateTime, nullable=True) # 주문 증분 동기화 커서 (이 시점까지 수집 완료)
+    products_synced_at = Column(DateTime, nullable=True) # 상품 스냅샷(products 테이블) 마지막 갱신 시각
     
     # 타임스탬프
     created_at = Column(DateTime, default=func.now()) # 레코드 생성 시간
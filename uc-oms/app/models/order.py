@@ -1,10 +1,15 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Numeric, ForeignKey, Text, func
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Numeric, ForeignKey, Text, JSON, UniqueConstraint, Index, func
 from sqlalchemy.orm import relationship, Mapped
 from app.core.database import Base
 from typing import List
 
 class Order(Base):
     __tablename__ = "orders"
+    __table_args__ = (
+        # 채널별/상태별 주문 목록 조회 (order_date 정렬 및 기간 필터)
+        Index("ix_orders_channel_id_order_date", "channel_id", "order_date"),
+        Index("ix_orders_umos_status_order_date", "umos_status", "order_date"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     channel_id = Column(Integer, ForeignKey("channel_configs.id"), nullable=False)
@@ -20,6 +25,9 @@ class Order(Base):
     
     umos_status = Column(String(50), index=True, nullable=False)
     
+    # 마지막으로 수집한 채널 데이터(OrderBase, 상품 제외)의 해시. 같으면 재수집 시 다시 쓰지 않습니다.
+    content_hash = Column(String(64), nullable=True)
+    
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, onupdate=func.now())
     
@@ -27,6 +35,10 @@ class Order(Base):
     
 class OrderItem(Base):
     __tablename__ = "order_items"
+    __table_args__ = (
+        # 주문 단위 UPSERT(INSERT ... ON DUPLICATE KEY UPDATE)의 기준 키
+        UniqueConstraint("order_id", "external_item_id", name="uq_order_items_order_id_external_item_id"),
+    )
     
     id = Column(Integer, primary_key= True, index=True)
     order_id = Column(Integer, ForeignKey("orders.id"), nullable=False)
@@ -36,12 +48,64 @@ class OrderItem(Base):
     quantity = Column(Integer, nullable=False)
     item_price = Column(Numeric(10,2), nullable=False)
     
-    courier_name = Column(String(50), nullable=False)
-    tracking_number = Column(String(100), nullable=False)
+    # 수집 시점에는 아직 발송 전이므로 비어 있을 수 있습니다.
+    courier_name = Column(String(50), nullable=True)
+    tracking_number = Column(String(100), nullable=True)
     
     umos_status = Column(String(50), index=True, nullable=False)
     
+    # 마지막으로 수집한 채널 데이터(OrderItemBase)의 해시
+    content_hash = Column(String(64), nullable=True)
+    
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, onupdate=func.now())
     
-    order: Mapped["Order"] = relationship(back_populates="items")
\ No newline at end of file
+    order: Mapped["Order"] = relationship(back_populates="items")
+    
+class OrderStatusOutbox(Base):
+    """
+    채널에 반영해야 할 주문 상품 상태 변경 이벤트(transactional outbox)입니다.
+    상태 변경과 같은 트랜잭션에서 기록되고, 워커의 flusher가 채널별로 묶어 채널 API로 전송합니다.
+    """
+    __tablename__ = "order_status_outbox"
+    __table_args__ = (
+        # 전송 대기 이벤트를 기록 순서대로 조회
+        Index("ix_order_status_outbox_status_id", "status", "id"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    channel_id = Column(Integer, ForeignKey("channel_configs.id"), nullable=False)
+    order_item_id = Column(Integer, ForeignKey("order_items.id"), nullable=False)
+    
+    umos_status = Column(String(50), nullable=False)
+    courier_name = Column(String(50), nullable=True)
+    tracking_number = Column(String(100), nullable=True)
+    
+    status = Column(String(20), nullable=False, default="PENDING") # PENDING / IN_FLIGHT / SENT / SUPERSEDED / SKIPPED / FAILED
+    attempts = Column(Integer, nullable=False, default=0)
+    error = Column(Text, nullable=True)
+    # PENDING: 재시도 가능 시각 (NULL이면 바로 전송), IN_FLIGHT: 전송 lease 만료 시각 (지나면 다른 flush가 다시 가져감)
+    next_attempt_at = Column(DateTime, nullable=True)
+    
+    created_at = Column(DateTime, server_default=func.now())
+    processed_at = Column(DateTime, nullable=True)
+
+class OrderIngestDeadLetter(Base):
+    """
+    수집 중 검증 또는 저장에 실패하여 격리된 주문입니다. 나머지 주문은 정상적으로 저장됩니다.
+    원본 데이터(payload)와 오류를 남겨 원인 확인 후 재처리할 수 있도록 합니다.
+    """
+    __tablename__ = "order_ingest_dead_letters"
+    __table_args__ = (
+        Index("ix_order_ingest_dead_letters_channel_id_created_at", "channel_id", "created_at"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    channel_id = Column(Integer, ForeignKey("channel_configs.id"), nullable=False)
+    external_order_id = Column(String(100), nullable=True, index=True) # 검증 실패 시 없을 수 있음
+    
+    stage = Column(String(20), nullable=False) # validate / persist
+    error = Column(Text, nullable=False)
+    payload = Column(JSON, nullable=True)
+    
+    created_at = Column(DateTime, server_default=func.now())
\ No newline at end of file
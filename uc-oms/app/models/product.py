@@ -0,0 +1,26 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, UniqueConstraint, func
+from app.core.database import Base
+
+
+class Product(Base):
+    """
+    채널 API에서 수집한 상품 목록의 스냅샷입니다.
+    상품 조회 API는 외부 API 대신 이 테이블을 읽고, 스냅샷이 오래되면 백그라운드에서 갱신합니다.
+    """
+    __tablename__ = "products"
+    __table_args__ = (
+        # 스냅샷 갱신 시 UPSERT(INSERT ... ON DUPLICATE KEY UPDATE)의 기준 키
+        UniqueConstraint("channel_id", "external_id", name="uq_products_channel_id_external_id"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    channel_id = Column(Integer, ForeignKey("channel_configs.id"), nullable=False)
+    channel_type = Column(String(50), nullable=False)
+    external_id = Column(String(100), nullable=False)
+    
+    product_name = Column(String(255), nullable=True)
+    status = Column(String(50), nullable=True)
+    
+    synced_at = Column(DateTime, nullable=False) # 마지막으로 채널 API에서 확인된 갱신 시각
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
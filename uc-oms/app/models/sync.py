@@ -0,0 +1,72 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, JSON, UniqueConstraint, Index, func
+from app.core.database import Base
+
+
+class OrderBackfillShard(Base):
+    """
+    과거 주문 백필의 구간(shard)별 진행 상태를 저장하는 체크포인트 테이블입니다.
+    프로세스가 재시작되어도 완료(DONE)된 구간은 다시 수집하지 않습니다.
+    """
+    __tablename__ = "order_backfill_shards"
+    __table_args__ = (
+        UniqueConstraint("channel_id", "shard_start", "shard_end", name="uq_order_backfill_shards_channel_window"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    channel_id = Column(Integer, ForeignKey("channel_configs.id"), nullable=False)
+    shard_start = Column(DateTime, nullable=False)
+    shard_end = Column(DateTime, nullable=False)
+    
+    status = Column(String(20), nullable=False)   # DONE / FAILED
+    order_count = Column(Integer, nullable=False, default=0)
+    attempts = Column(Integer, nullable=False, default=0)
+    error = Column(Text, nullable=True)
+    
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+
+class SyncLease(Base):
+    """
+    여러 워커(uvicorn 프로세스/컨테이너) 중 하나만 작업을 실행하도록 하는 DB 기반 lease 테이블입니다.
+    name(예: "order_sync:3")별로 한 행이며, expires_at이 지나기 전까지는 owner만 해당 작업을 실행합니다.
+    """
+    __tablename__ = "sync_leases"
+    
+    name = Column(String(100), primary_key=True)
+    owner = Column(String(100), nullable=False)
+    expires_at = Column(DateTime, nullable=False)
+    
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+
+class SyncJob(Base):
+    """
+    수집 작업 큐 테이블입니다. API는 작업을 등록만 하고, 별도 워커 프로세스(python -m app.worker)가 실행합니다.
+    - 워커는 SELECT ... FOR UPDATE SKIP LOCKED로 작업을 가져가므로 여러 프로세스가 같은 작업을 중복 실행하지 않습니다.
+    - run_after: 이 시각 이후에 실행 가능. 실행 중(RUNNING)인 작업은 visibility timeout 만료 시각이 기록되어,
+      워커가 죽으면 그 시각 이후 다른 워커가 다시 가져갑니다.
+    """
+    __tablename__ = "sync_jobs"
+    __table_args__ = (
+        # 실행 가능한 작업 조회 (status, run_after)
+        Index("ix_sync_jobs_status_run_after", "status", "run_after"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    job_type = Column(String(50), nullable=False)  # order_fetch / order_sync / product_sync
+    channel_id = Column(Integer, ForeignKey("channel_configs.id"), nullable=False)
+    payload = Column(JSON, nullable=True)           # 작업별 파라미터 (예: order_fetch의 start_date/end_date)
+    
+    status = Column(String(20), nullable=False, default="PENDING")  # PENDING / RUNNING / DONE / FAILED
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=3)
+    run_after = Column(DateTime, nullable=False, server_default=func.now())
+    locked_by = Column(String(100), nullable=True)  # 실행 중인 워커 식별자
+    
+    result = Column(JSON, nullable=True)
+    error = Column(Text, nullable=True)
+    
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    finished_at = Column(DateTime, nullable=True)
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, model_validator
 from datetime import datetime
 from typing import List, Optional
 
@@ -7,11 +7,12 @@ class OrderItemBase(BaseModel):
     
     external_item_id: str = Field(..., max_length=100)
     product_name: str = Field(..., max_length=255)
+    quantity: int = Field(..., ge=1)
     item_price: float = Field(..., ge=0)
     courier_code: Optional[str] = Field(None, max_length=50)
     tracking_number: Optional[str] = Field(None, max_length=100)
     
-    umons_status: str = Field(..., max_length=50)
+    umos_status: str = Field(..., max_length=50)
     
 class OrderBase(BaseModel):
     model_config = ConfigDict(from_attributes=True)
@@ -19,6 +20,8 @@ class OrderBase(BaseModel):
     channel_id: int
     channel_type: str = Field(..., max_length=50)
     external_order_id: str = Field(..., max_length=100)
+    order_date: datetime
+    total_amount: float = Field(..., ge=0)
     recipient_name: str = Field(..., max_length=100)
     recipient_phone: str = Field(..., max_length=50)
     shipping_address: str
@@ -26,4 +29,114 @@ class OrderBase(BaseModel):
     umos_status: str = Field(..., max_length=50)
     
     items: List[OrderItemBase] = Field(..., min_length=1)
-    
\ No newline at end of file
+
+class OrderItemRead(BaseModel):
+    """주문 목록 응답에 포함되는 주문 상품"""
+    model_config = ConfigDict(from_attributes=True)
+    
+    id: int
+    external_item_id: str
+    product_name: str
+    quantity: int
+    item_price: float
+    courier_name: Optional[str] = None
+    tracking_number: Optional[str] = None
+    umos_status: str
+    
+class OrderRead(BaseModel):
+    """주문 목록 응답의 주문 한 건"""
+    model_config = ConfigDict(from_attributes=True)
+    
+    id: int
+    channel_id: int
+    channel_type: str
+    external_order_id: str
+    order_date: datetime
+    total_amount: float
+    recipient_name: str
+    recipient_phone: str
+    shipping_address: str
+    umos_status: str
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    
+    items: List[OrderItemRead] = Field(default_factory=list)
+    
+class OrderListResponse(BaseModel):
+    """주문 목록 페이지. next_cursor를 다음 요청의 cursor로 전달하면 이어지는 페이지를 조회합니다."""
+    orders: List[OrderRead]
+    next_cursor: Optional[str] = None
+
+class OrderIngestResult(BaseModel):
+    """
+    주문 저장 결과. 이전 수집 때와 내용(content_hash)이 같은 주문은 다시 쓰지 않고 unchanged로 집계합니다.
+    수집 구간이 여러 개로 나뉘어 같은 주문이 두 번 이상 조회되면 조회된 횟수만큼 집계됩니다.
+    """
+    inserted: int = 0
+    updated: int = 0      # 주문 또는 주문 상품 중 하나라도 바뀐 기존 주문
+    unchanged: int = 0
+    failed: int = 0       # 검증/저장에 실패하여 order_ingest_dead_letters로 격리된 주문
+    
+    @property
+    def total(self) -> int:
+        return self.inserted + self.updated + self.unchanged
+    
+    def add(self, other: "OrderIngestResult") -> None:
+        self.inserted += other.inserted
+        self.updated += other.updated
+        self.unchanged += other.unchanged
+        self.failed += other.failed
+
+class OrderBackfillResult(BaseModel):
+    """과거 주문 백필 실행 결과 요약"""
+    channel_id: int
+    total_shards: int
+    skipped_shards: int = 0     # 이전 실행에서 이미 완료되어 건너뛴 구간 수
+    completed_shards: int = 0
+    failed_shards: int = 0
+    order_count: int = 0
+    failed_order_count: int = 0 # 검증/저장에 실패하여 order_ingest_dead_letters로 격리된 주문 수
+
+class ShipmentItem(BaseModel):
+    """송장 등록 대상 주문 상품 (order_item_id는 내부 OrderItem.id)"""
+    order_item_id: int
+    courier_code: str = Field(..., max_length=50)
+    tracking_number: str = Field(..., max_length=100)
+
+class BulkShipmentRequest(BaseModel):
+    items: List[ShipmentItem] = Field(..., min_length=1, max_length=5000)
+
+class BulkPreparationRequest(BaseModel):
+    order_item_ids: List[int] = Field(..., min_length=1, max_length=5000)
+
+class BulkItemResult(BaseModel):
+    order_item_id: int
+    success: bool
+    error: Optional[str] = None
+
+class BulkItemActionResponse(BaseModel):
+    """대량 발주 확인/발송 처리 결과. 실패한 상품은 error에 사유가 담깁니다."""
+    succeeded: int = 0
+    failed: int = 0
+    results: List[BulkItemResult] = Field(default_factory=list)
+
+class ItemStatusUpdate(BaseModel):
+    """주문 상품 상태 변경. SHIPPED로 변경할 때는 택배사/송장번호가 필요합니다."""
+    order_item_id: int
+    umos_status: str = Field(..., max_length=50)
+    courier_code: Optional[str] = Field(None, max_length=50)
+    tracking_number: Optional[str] = Field(None, max_length=100)
+    
+    @model_validator(mode="after")
+    def check_shipment(self) -> "ItemStatusUpdate":
+        if self.umos_status == "SHIPPED" and (not self.courier_code or not self.tracking_number):
+            raise ValueError("SHIPPED requires courier_code and tracking_number")
+        return self
+
+class ItemStatusUpdateRequest(BaseModel):
+    items: List[ItemStatusUpdate] = Field(..., min_length=1, max_length=5000)
+
+class ItemStatusUpdateResponse(BaseModel):
+    """상태 변경 결과. 변경된 상품은 채널 반영 대기열(outbox)에 등록되어 워커가 전송합니다."""
+    updated: int = 0
+    not_found: List[int] = Field(default_factory=list)
\ No newline at end of file
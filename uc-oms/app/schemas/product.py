@@ -0,0 +1,34 @@
+from pydantic import BaseModel, Field, ConfigDict
+from datetime import datetime
+from typing import List, Dict, Any, Literal, Optional
+
+class ProductRead(BaseModel):
+    """상품 스냅샷(products 테이블)의 상품 한 건"""
+    model_config = ConfigDict(from_attributes=True)
+    
+    channel_id: int
+    channel_type: str
+    external_id: str
+    product_name: Optional[str] = None
+    status: Optional[str] = None
+
+class ProductSnapshotResponse(BaseModel):
+    """채널 상품 조회 응답. synced_at은 스냅샷이 채널 API에서 마지막으로 갱신된 시각입니다."""
+    channel_id: int
+    products: List[ProductRead] = Field(default_factory=list)
+    synced_at: Optional[datetime] = None
+    stale: bool = False         # TTL이 지나 백그라운드 갱신이 예약된 경우 True
+
+class ChannelFetchResult(BaseModel):
+    """채널별 상품 조회 결과 요약 (ok / error / timeout)"""
+    channel_id: int
+    status: Literal["ok", "error", "timeout"]
+    product_count: int = 0
+    synced_at: Optional[datetime] = None
+    stale: bool = False
+    error: Optional[str] = None
+    
+class ProductFetchAllResponse(BaseModel):
+    """모든 활성 채널 상품 일괄 조회 응답. 일부 채널이 실패해도 성공한 채널의 상품은 포함됩니다."""
+    products: List[ProductRead] = Field(default_factory=list)
+    channels: List[ChannelFetchResult] = Field(default_factory=list)
@@ -0,0 +1,52 @@
+from pydantic import BaseModel, Field, ConfigDict, model_validator
+from datetime import datetime
+from typing import Any, Dict, Literal, Optional
+
+SyncJobType = Literal["order_fetch", "order_sync", "product_sync"]
+
+class SyncJobCreate(BaseModel):
+    """
+    수집 작업 등록 요청
+    - order_fetch : start_date ~ end_date 구간의 주문 수집 (OrderService.fetch_and_save_orders)
+    - order_sync  : 마지막 동기화 이후 주문 증분 수집 (OrderService.sync_incremental)
+    - product_sync: 상품 스냅샷 갱신 (ProductCollectorService.refresh_snapshot)
+    """
+    job_type: SyncJobType
+    channel_id: int
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    
+    @model_validator(mode="after")
+    def check_window(self) -> "SyncJobCreate":
+        if self.job_type == "order_fetch":
+            if self.start_date is None or self.end_date is None:
+                raise ValueError("order_fetch requires start_date and end_date")
+            if self.start_date >= self.end_date:
+                raise ValueError("start_date must be before end_date")
+        return self
+
+class SyncJobRead(BaseModel):
+    """수집 작업 상태 (PENDING / RUNNING / DONE / FAILED)"""
+    model_config = ConfigDict(from_attributes=True)
+    
+    id: int
+    job_type: str
+    channel_id: int
+    payload: Optional[Dict[str, Any]] = None
+    status: str
+    attempts: int
+    max_attempts: int
+    run_after: datetime
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    created_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+class ClaimedSyncJob(BaseModel):
+    """워커가 가져간(RUNNING) 작업. attempts는 이번 실행을 포함한 실행 횟수입니다."""
+    id: int
+    job_type: str
+    channel_id: int
+    payload: Optional[Dict[str, Any]] = None
+    attempts: int
+    max_attempts: int
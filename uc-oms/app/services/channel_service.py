@@ -3,6 +3,7 @@ from sqlalchemy import select, update, delete
 from typing import List, Optional, Dict, Any
 from app.core.config import settings
 from app.core import security
+from app.services.collector_cache import collector_cache
 
 from app.models.channel import ChannelConfig
 from app.schemas.channel import ChannelConfigCreate, ChannelConfigUpdate
@@ -48,8 +49,8 @@ async def create_channel(db: AsyncSession, channel: ChannelConfigCreate) -> Chan
     """
     
     # 🚨 핵심 보안 로직: 민감 정보를 암호화
-    encrypted_key = security.encrypt_data(channel.api_key)
-    encrypted_secret = security.encrypt_data(channel.api_secret)
+    encrypted_key = await security.encrypt_data_async(channel.api_key)
+    encrypted_secret = await security.encrypt_data_async(channel.api_secret)
     
     # 암호화된 데이터와 나머지 데이터를 ORM 모델에 맞게 준비
     db_channel = ChannelConfig(
@@ -96,10 +97,10 @@ async def update_channel(db: AsyncSession, channel_id: int, channel_update: Chan
         
         # 🚨 핵심 보안 로직: API 키/시크릿이 변경된 경우 암호화
         if "api_key" in update_data:
-            update_data["api_key"] = security.encrypt_data(update_data["api_key"])
+            update_data["api_key"] = await security.encrypt_data_async(update_data["api_key"])
         
         if "api_secret" in update_data:
-            update_data["api_secret"] = security.encrypt_data(update_data["api_secret"])
+            update_data["api_secret"] = await security.encrypt_data_async(update_data["api_secret"])
             
         # Pydantic dict를 ORM 객체에 적용
         for key, value in update_data.items():
@@ -107,6 +108,8 @@ async def update_channel(db: AsyncSession, channel_id: int, channel_update: Chan
             
         await db.commit()
         await db.refresh(db_channel)
+        # 키/활성 상태가 바뀌었을 수 있으므로 캐시된 컬렉터와 토큰을 폐기
+        collector_cache.invalidate(channel_id)
         return db_channel
     
     return None
@@ -121,6 +124,7 @@ async def delete_channel(db: AsyncSession, channel_id: int) -> bool:
     
     if result.rowcount > 0:
         await db.commit()
+        collector_cache.invalidate(channel_id)
         return True
         
     return False
@@ -134,6 +138,6 @@ async def get_decrypted_secret(db: AsyncSession, channel_id: int) -> Optional[st
     
     if db_channel and db_channel.api_secret:
         # 🚨 핵심 보안 로직: 암호화된 Secret을 복호화
-        return security.decrypt_data(db_channel.api_secret)
+        return await security.decrypt_data_async(db_channel.api_secret)
         
     return None
\ No newline at end of file
@@ -0,0 +1,58 @@
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from app.core.config import settings
+from app.collectors.token_cache import token_cache
+
+
+class CollectorCache:
+    """
+    채널별로 생성된 컬렉터 인스턴스(복호화된 API 키 포함)를 일정 시간 재사용하는 프로세스 내 캐시입니다.
+    - 캐시 적중 시 ChannelConfig 조회와 api_key/api_secret 복호화를 생략합니다.
+    - 컬렉터 종류(product/order)와 channel_id를 키로 사용합니다.
+    - 채널 설정이 수정/삭제되면 channel_service에서 invalidate를 호출합니다.
+      (다른 워커 프로세스의 캐시는 TTL이 지나면 갱신됩니다.)
+    - invalidate마다 채널의 세대(generation)가 증가합니다. 컬렉터를 만들기 전에 generation()을 읽어 put에 넘기면,
+      복호화 등을 기다리는 동안 invalidate된 경우 이전 설정으로 만든 컬렉터가 캐시에 저장되지 않습니다.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries: Dict[Tuple[str, int], Tuple[Any, float]] = {}
+        self._generations: Dict[int, int] = {}
+
+    def get(self, kind: str, channel_id: int) -> Optional[Any]:
+        entry = self._entries.get((kind, channel_id))
+        if entry is None:
+            return None
+        collector, expires_at = entry
+        if time.monotonic() >= expires_at:
+            self._entries.pop((kind, channel_id), None)
+            return None
+        return collector
+
+    def generation(self, channel_id: int) -> int:
+        return self._generations.get(channel_id, 0)
+
+    def put(self, kind: str, channel_id: int, collector: Any, generation: int) -> None:
+        """
+        generation은 컬렉터를 만들기 전에 읽은 generation(channel_id) 값입니다. 그 사이 invalidate되었으면 저장하지 않습니다.
+        """
+        if generation != self.generation(channel_id):
+            return
+        self._entries[(kind, channel_id)] = (collector, time.monotonic() + self.ttl)
+
+    def invalidate(self, channel_id: int) -> None:
+        """
+        채널의 모든 컬렉터와 발급받은 액세스 토큰을 폐기합니다. (API 키 변경 시 기존 토큰도 무효)
+        """
+        self._generations[channel_id] = self.generation(channel_id) + 1
+        for key in [key for key in self._entries if key[1] == channel_id]:
+            self._entries.pop(key, None)
+        token_cache.invalidate(channel_id)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+collector_cache = CollectorCache(ttl=settings.COLLECTOR_CACHE_TTL)
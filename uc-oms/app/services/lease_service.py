@@ -0,0 +1,60 @@
+from sqlalchemy import select, update, delete, func, or_, case, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from app.models.sync import SyncLease
+
+
+def db_now_plus(seconds: float):
+    # 만료 시각은 워커 간 시계 차이의 영향을 받지 않도록 DB 서버 시간(NOW()) 기준으로 계산합니다.
+    return func.date_add(func.now(), text(f"INTERVAL {int(seconds)} SECOND"))
+
+
+class LeaseService:
+    """
+    sync_leases 테이블을 이용한 DB lease입니다.
+    같은 name의 작업은 lease를 가진 owner 하나만 실행하고, 만료된 lease는 다른 owner가 가져갈 수 있습니다.
+    """
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    
+    async def try_acquire(self, name: str, owner: str, ttl_seconds: float) -> bool:
+        """
+        lease를 획득(또는 이미 가진 lease를 연장)하고 성공 여부를 반환합니다.
+        INSERT ... ON DUPLICATE KEY UPDATE 한 문장으로 처리하므로 여러 워커가 동시에 시도해도 한 워커만 성공합니다.
+        """
+        stmt = mysql_insert(SyncLease).values(name=name, owner=owner, expires_at=db_now_plus(ttl_seconds))
+        acquirable = or_(SyncLease.expires_at < func.now(), SyncLease.owner == stmt.inserted.owner)
+        # MySQL은 UPDATE 절을 왼쪽부터 적용하므로, owner를 먼저 바꾼 뒤 바뀐 owner 기준으로 expires_at을 갱신합니다.
+        stmt = stmt.on_duplicate_key_update([
+            ("owner", case((acquirable, stmt.inserted.owner), else_=SyncLease.owner)),
+            ("expires_at", case((SyncLease.owner == stmt.inserted.owner, stmt.inserted.expires_at), else_=SyncLease.expires_at)),
+            ("updated_at", func.now()),
+        ])
+        await self.db.execute(stmt)
+        await self.db.commit()
+        
+        result = await self.db.execute(select(SyncLease.owner).where(SyncLease.name == name))
+        acquired = result.scalar_one_or_none() == owner
+        await self.db.commit() # 읽기 트랜잭션 종료
+        return acquired
+    
+    async def extend(self, name: str, owner: str, seconds: float) -> bool:
+        """
+        가지고 있는 lease의 만료 시각을 지금부터 seconds초 후로 변경합니다. (다른 owner의 lease는 변경하지 않음)
+        lease를 아직 가지고 있어 연장했으면 True, 다른 owner가 가져갔거나 lease가 없으면 False를 반환합니다.
+        """
+        stmt = (
+            update(SyncLease)
+            .where(SyncLease.name == name, SyncLease.owner == owner)
+            .values(expires_at=db_now_plus(seconds))
+        )
+        result = await self.db.execute(stmt)
+        await self.db.commit()
+        return result.rowcount > 0
+    
+    async def release(self, name: str, owner: str) -> None:
+        """
+        가지고 있는 lease를 반납하여 다른 owner가 바로 가져갈 수 있도록 합니다. (정상 종료 시)
+        """
+        await self.db.execute(delete(SyncLease).where(SyncLease.name == name, SyncLease.owner == owner))
+        await self.db.commit()
@@ -0,0 +1,123 @@
+import csv
+import io
+import json
+import logging
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.models.order import Order, OrderItem
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+ORDER_EXPORT_COLUMNS = (
+    Order.id, Order.channel_id, Order.channel_type, Order.external_order_id, Order.order_date,
+    Order.total_amount, Order.recipient_name, Order.recipient_phone, Order.shipping_address, Order.umos_status,
+)
+ORDER_ITEM_EXPORT_COLUMNS = (
+    OrderItem.order_id, OrderItem.id, OrderItem.external_item_id, OrderItem.product_name, OrderItem.quantity,
+    OrderItem.item_price, OrderItem.courier_name, OrderItem.tracking_number, OrderItem.umos_status,
+)
+# CSV는 주문 상품 한 개당 한 행으로 펼치고, 주문 컬럼은 각 행에 반복합니다.
+CSV_HEADER = [column.key for column in ORDER_EXPORT_COLUMNS] + [
+    "item_id", "external_item_id", "product_name", "quantity", "item_price",
+    "courier_name", "tracking_number", "item_umos_status",
+]
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value) # 금액은 정밀도 손실 없이 문자열로 내보냅니다.
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class OrderExportService:
+    """
+    주문 전체를 NDJSON/CSV로 스트리밍 내보내기 합니다.
+    - 주문은 서버 사이드 커서(stream_results + yield_per)로 읽어, 결과 크기와 관계없이 메모리 사용량이 일정합니다.
+    - MySQL은 서버 사이드 커서가 열려 있는 동안 같은 커넥션에서 다른 쿼리를 실행할 수 없으므로,
+      주문 상품은 별도 세션으로 yield_per 단위마다 한 번씩 조회합니다.
+    - 스트리밍 응답은 요청 핸들러가 반환된 뒤에도 계속되므로, 요청 단위 세션(get_db) 대신 직접 세션을 엽니다.
+    """
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]):
+        self.session_factory = session_factory
+
+    async def iter_orders(
+        self,
+        channel_id: Optional[int]=None,
+        umos_status: Optional[str]=None,
+        date_from: Optional[datetime]=None,
+        date_to: Optional[datetime]=None,
+        yield_per: Optional[int]=None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        조건에 맞는 주문을 yield_per개씩 묶어, 주문 상품(items)을 포함한 dict 리스트로 반환합니다.
+        """
+        yield_per = yield_per or settings.ORDER_EXPORT_YIELD_PER
+
+        stmt = select(*ORDER_EXPORT_COLUMNS)
+        if channel_id is not None:
+            stmt = stmt.where(Order.channel_id == channel_id)
+        if umos_status is not None:
+            stmt = stmt.where(Order.umos_status == umos_status)
+        if date_from is not None:
+            stmt = stmt.where(Order.order_date >= date_from)
+        if date_to is not None:
+            stmt = stmt.where(Order.order_date < date_to)
+        stmt = stmt.order_by(Order.order_date, Order.id).execution_options(yield_per=yield_per)
+
+        async with self.session_factory() as order_session, self.session_factory() as item_session:
+            result = await order_session.stream(stmt)
+            async for partition in result.partitions(yield_per):
+                orders = [dict(row._mapping) for row in partition]
+                for order in orders:
+                    order["items"] = []
+
+                orders_by_id = {order["id"]: order for order in orders}
+                item_result = await item_session.execute(
+                    select(*ORDER_ITEM_EXPORT_COLUMNS)
+                    .where(OrderItem.order_id.in_(list(orders_by_id)))
+                    .order_by(OrderItem.order_id, OrderItem.id)
+                )
+                for item in item_result.mappings():
+                    item = dict(item)
+                    orders_by_id[item.pop("order_id")]["items"].append(item)
+
+                yield orders
+
+    async def export_ndjson(self, **filters) -> AsyncIterator[str]:
+        """
+        주문 한 건당 한 줄의 JSON(items 포함)을 반환합니다.
+        """
+        async for orders in self.iter_orders(**filters):
+            yield "".join(json.dumps(order, ensure_ascii=False, default=_json_default) + "\n" for order in orders)
+
+    async def export_csv(self, **filters) -> AsyncIterator[str]:
+        """
+        주문 상품 한 개당 한 행의 CSV를 반환합니다. 헤더는 첫 조회 전에 바로 전송합니다.
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(CSV_HEADER)
+        yield buffer.getvalue()
+
+        async for orders in self.iter_orders(**filters):
+            buffer.seek(0)
+            buffer.truncate()
+            for order in orders:
+                order_values = [order[column.key] for column in ORDER_EXPORT_COLUMNS]
+                if not order["items"]:
+                    writer.writerow(order_values + [None] * (len(CSV_HEADER) - len(order_values)))
+                for item in order["items"]:
+                    writer.writerow(order_values + [
+                        item["id"], item["external_item_id"], item["product_name"], item["quantity"],
+                        item["item_price"], item["courier_name"], item["tracking_number"], item["umos_status"],
+                    ])
+            yield buffer.getvalue()
@@ -1,19 +1,56 @@
+import asyncio
+import base64
+import hashlib
+import json
 import logging
-from typing import List, Dict, Any
+from contextlib import aclosing
+from datetime import datetime, timedelta
+from typing import List, Dict, Any, Awaitable, Callable, Optional, Tuple
+from pydantic_core import to_jsonable_python
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError, DataError
+from sqlalchemy import select, update, func, or_, and_, case
+from sqlalchemy.orm import selectinload
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from app.core.config import settings
 from app.models.channel import ChannelConfig
-from app.models.order import Order, OrderItem
-from app.schemas.order import OrderBase, OrderItemBase
-from app.core.security import decrypt_data
+from app.models.order import Order, OrderItem, OrderStatusOutbox, OrderIngestDeadLetter
+from app.models.sync import OrderBackfillShard
+from app.schemas.order import (
+    OrderIngestResult, OrderBackfillResult, ShipmentItem, BulkItemResult, BulkItemActionResponse,
+    ItemStatusUpdate, ItemStatusUpdateResponse
+)
+from app.core.security import decrypt_data_async
 from app.collectors.base_collector import IOrderCollector
+from app.collectors.records import OrderRecord, OrderItemRecord
 from app.collectors.coupang_collector import CoupangOrderCollector
 from app.collectors.smartstore_collector import SmartstoreOrderCollector
 from app.collectors.mock_collector import MockCollector
+from app.services.collector_cache import collector_cache
+from app.services.lease_service import db_now_plus
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# 이미 존재하는 주문/상품 행에서 갱신할 컬럼 (채널/외부 ID 같은 식별 컬럼은 제외)
+ORDER_UPSERT_COLUMNS = (
+    "order_date", "total_amount", "recipient_name", "recipient_phone",
+    "shipping_address", "umos_status", "content_hash",
+)
+ORDER_ITEM_UPSERT_COLUMNS = ("product_name", "quantity", "item_price", "umos_status", "content_hash")
+# 채널이 값을 주지 않으면(None) 기존 값을 유지할 컬럼 (관리자가 입력한 송장 정보 등)
+ORDER_ITEM_KEEP_EXISTING_COLUMNS = ("courier_name", "tracking_number")
+# 대량 발주 확인/발송 처리를 허용하는 현재 상태 (취소/발송 완료 등 다른 상태의 상품은 채널 호출 없이 실패 처리)
+PREPARATION_ALLOWED_STATUSES = ("PAID",)
+SHIPMENT_ALLOWED_STATUSES = ("PAID", "PREPARING")
+
+def _content_hash(payload: Dict[str, Any]) -> str:
+    """
+    정규화된 채널 데이터(OrderRecord.payload / OrderItemRecord.payload)의 SHA-256 해시입니다. 키 순서와 무관하게 같은 내용이면 같은 값이 나옵니다.
+    """
+    serialized = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
 ORDER_COLLECTOR_MAPPING={
     "coupang": CoupangOrderCollector,
     "smartstore": SmartstoreOrderCollector,
@@ -25,6 +62,12 @@ class OrderService:
         self.db = db
     
     async def _get_channel_collector(self, channel_id: int) -> IOrderCollector:
+        cached = collector_cache.get("order", channel_id)
+        if cached is not None:
+            return cached
+        # 설정 조회/복호화 중에 채널이 수정되면(invalidate) 이 컬렉터는 캐시에 저장되지 않습니다.
+        generation = collector_cache.generation(channel_id)
+        
         stmt = select(ChannelConfig).where(ChannelConfig.id == channel_id, ChannelConfig.is_active == True)
         result = await self.db.execute(stmt)
         channel_config = result.scalar_one_or_none()
@@ -38,75 +81,933 @@ class OrderService:
             raise NotImplementedError(f"Order Collector for channel type '{channel_type}' is not implemented.")
         
         try:
-            decrypted_api_key = decrypt_data(channel_config.api_key)
-            decrypted_api_secret = decrypt_data(channel_config.api_secret)
+            decrypted_api_key = await decrypt_data_async(channel_config.api_key)
+            decrypted_api_secret = await decrypt_data_async(channel_config.api_secret)
         except ValueError as e:
             raise RuntimeError(f"Configuration error: {channel_id}")
         
         CollectorClass: type[IOrderCollector] = ORDER_COLLECTOR_MAPPING[channel_type]
         
-        return CollectorClass(
+        collector = CollectorClass(
             channel_id = channel_config.id,
             api_key = decrypted_api_key,
             api_secret = decrypted_api_secret
         )
+        collector_cache.put("order", channel_id, collector, generation)
+        return collector
+        
+    async def list_orders(
+        self,
+        channel_id: Optional[int]=None,
+        umos_status: Optional[str]=None,
+        date_from: Optional[datetime]=None,
+        date_to: Optional[datetime]=None,
+        cursor: Optional[str]=None,
+        limit: int=50
+    ) -> Tuple[List[Order], Optional[str]]:
+        """
+        주문 목록을 최신순((order_date, id) 내림차순)으로 조회합니다.
+        OFFSET 대신 이전 페이지 마지막 행의 (order_date, id)를 커서로 사용하는 keyset 페이지네이션이라,
+        페이지 깊이와 관계없이 인덱스 범위 탐색 한 번으로 조회됩니다.
+        주문 상품은 selectinload로 페이지당 한 번의 추가 쿼리로 함께 읽습니다.
+        """
+        stmt = select(Order).options(selectinload(Order.items))
         
-    async def fetch_and_save_orders(self, channel_id:int, start_date: str, end_date: str) -> int:
+        if channel_id is not None:
+            stmt = stmt.where(Order.channel_id == channel_id)
+        if umos_status is not None:
+            stmt = stmt.where(Order.umos_status == umos_status)
+        if date_from is not None:
+            stmt = stmt.where(Order.order_date >= date_from)
+        if date_to is not None:
+            stmt = stmt.where(Order.order_date < date_to)
+        if cursor:
+            cursor_date, cursor_id = self._decode_cursor(cursor)
+            stmt = stmt.where(or_(
+                Order.order_date < cursor_date,
+                and_(Order.order_date == cursor_date, Order.id < cursor_id)
+            ))
+        
+        stmt = stmt.order_by(Order.order_date.desc(), Order.id.desc()).limit(limit + 1)
+        result = await self.db.execute(stmt)
+        orders = list(result.scalars().all())
+        
+        next_cursor = None
+        if len(orders) > limit:
+            orders = orders[:limit]
+            next_cursor = self._encode_cursor(orders[-1])
+        return orders, next_cursor
+    
+    @staticmethod
+    def _encode_cursor(order: Order) -> str:
+        raw = f"{order.order_date.isoformat()}|{order.id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+    
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[datetime, int]:
+        try:
+            raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+            order_date, order_id = raw.split("|")
+            return datetime.fromisoformat(order_date), int(order_id)
+        except Exception:
+            raise ValueError(f"Invalid cursor: {cursor}")
+    
+    async def fetch_and_save_orders(self, channel_id:int, start_date: datetime, end_date: datetime) -> OrderIngestResult:
+        """
+        start_date ~ end_date 구간의 주문을 수집 파이프라인(_ingest_pipeline)으로 저장합니다.
+        저장 묶음마다 커밋하므로, 도중에 실패하면 그때까지 저장한 주문은 유지됩니다. (UPSERT이므로 다시 실행해도 안전)
+        검증/저장에 실패한 주문은 order_ingest_dead_letters로 격리되고 나머지 주문은 저장됩니다.
+        """
         collector = await self._get_channel_collector(channel_id)
         
-        raw_orders_data: List[Dict[str, Any]] = await collector.fetch_orders(start_date,end_date)
+        ingest_result = await self._ingest_pipeline(collector, start_date, end_date)
         
-        if not raw_orders_data:
+        if not ingest_result.total and not ingest_result.failed:
             logger.info(f"Channel {channel_id}: No new orders fetched.")
-            return 0
+        return ingest_result
+    
+    async def sync_incremental(self, channel_id: int) -> OrderIngestResult:
+        """
+        채널의 마지막 동기화 시점(last_sync_at) 이후의 주문만 수집합니다.
+        - 수집 구간: [last_sync_at - ORDER_SYNC_OVERLAP_MINUTES, 현재]
+          (채널 측 반영 지연으로 늦게 나타나는 주문을 놓치지 않도록 겹치는 구간을 둡니다.)
+        - 최초 동기화는 ORDER_SYNC_INITIAL_LOOKBACK_HOURS 전부터 수집합니다.
+        - 주문은 수집 파이프라인(_ingest_pipeline)으로 묶음마다 커밋하고, 커서는 모든 묶음이 저장된 뒤에만 전진합니다.
+          도중에 실패하면 커서가 그대로이므로 다음 동기화에서 같은 구간을 다시 수집합니다.
+        """
+        collector = await self._get_channel_collector(channel_id)
+        
+        cursor_result = await self.db.execute(select(ChannelConfig.last_sync_at).where(ChannelConfig.id == channel_id))
+        last_sync_at = cursor_result.scalar_one_or_none()
         
-        validated_orders: List[OrderBase] = [OrderBase(**data) for data in raw_orders_data]
-        saved_count = await self._save_orders_to_db(validated_orders)
+        window_end = datetime.now()
+        if last_sync_at:
+            window_start = last_sync_at - timedelta(minutes=settings.ORDER_SYNC_OVERLAP_MINUTES)
+        else:
+            window_start = window_end - timedelta(hours=settings.ORDER_SYNC_INITIAL_LOOKBACK_HOURS)
+        
+        ingest_result = await self._ingest_pipeline(collector, window_start, window_end)
+        await self._advance_sync_cursor(channel_id, window_end)
+        await self.db.commit()
         
-        return saved_count
+        logger.info(
+            f"Channel {channel_id}: Synced {ingest_result.total} orders ({window_start} ~ {window_end}) - "
+            f"inserted={ingest_result.inserted} updated={ingest_result.updated} unchanged={ingest_result.unchanged} failed={ingest_result.failed}"
+        )
+        return ingest_result
     
-    async def _save_orders_to_db(self, orders: List[OrderBase]) -> int:
-        order_count=0
+    async def _ingest_pipeline(
+        self,
+        collector: IOrderCollector,
+        start_date: datetime,
+        end_date: datetime,
+        fetch_concurrency: Optional[int]=None,
+        queue_size: Optional[int]=None
+    ) -> OrderIngestResult:
+        """
+        주문을 수집(fetch) → 검증(validate) → 저장(persist) 단계로 나누어 동시에 처리합니다.
+        - 수집: 구간을 컬렉터의 PIPELINE_SHARD_WINDOW(없으면 MAX_QUERY_WINDOW) 단위로 나누어 fetch_concurrency개까지 동시에 조회합니다.
+          구간을 잘게 나눌수록 채널 API 호출 수가 늘어나므로, 기본값은 채널이 허용하는 최대 조회 기간입니다.
+          구간 안에서는 컬렉터의 iter_orders로 페이지 단위로 받아 받는 대로 다음 단계에 넘깁니다.
+        - 검증: 조회된 주문(OrderRecord)을 검증하고 ORDER_INGEST_BATCH_SIZE 단위 묶음으로 나눕니다.
+          검증에 실패한 주문은 묶음에서 빼고 dead letter로 넘깁니다.
+          검증은 await 없는 CPU 작업이라 여러 개를 띄워도 동시에 실행되지 않으므로 하나만 실행합니다.
+        - 저장: 묶음마다 _persist_order_chunk로 저장 후 커밋합니다. AsyncSession은 동시 사용이 불가하므로 저장 단계는 하나만 실행합니다.
+        단계 사이의 큐는 queue_size개까지만 쌓이며, 가득 차면 앞 단계가 기다립니다.
+        따라서 DB 저장 중에도 다음 페이지를 조회하고, 메모리에는 구간 전체가 아니라 큐 크기(와 미리 요청한 페이지)만큼의 주문만 유지됩니다.
+        (fetch_order_page를 재정의하지 않은 컬렉터는 구간 전체가 한 페이지입니다.)
+        어느 단계든 실패하면 나머지 단계를 모두 취소하고 예외를 그대로 전달합니다.
+        채널이 인접 구간에 같은 주문을 중복으로 반환하면, 결과(OrderIngestResult)에는 구간마다 한 번씩 집계됩니다.
+        (두 번째부터는 content_hash가 같아 unchanged로 집계되며 다시 쓰지 않습니다.)
+        """
+        fetch_concurrency = max(1, fetch_concurrency or settings.ORDER_PIPELINE_FETCH_CONCURRENCY)
+        queue_size = max(1, queue_size or settings.ORDER_PIPELINE_QUEUE_SIZE)
+        batch_size = settings.ORDER_INGEST_BATCH_SIZE
         
-        for order_data in orders:
-            order_stmt = select(Order).where(Order.external_order_id == order_data.external_order_id)
-            order_result = await self.db.execute(order_stmt)
-            existing_order = order_result.scalar_one_or_none()
-            
-            order_params = Order.order_data.model_dump(exclude={"items"})
-            
-            if existing_order:
-                update_stmt = update(Order).where(Order.id == existing_order.id).values(**order_params)
-                await self.db.execute(update_stmt)
-                db_order = existing_order
-                logger.debug(f"Updated existing Order: {db_order.external_order_id}")
-            else:
-                db_order = Order(**order_params)
-                self.db.add(db_order)
-                await self.db.flush()
-                logger.debug(f"Created new Order: {db_order.external_order_id}")
+        shard_window = min(collector.MAX_QUERY_WINDOW, collector.PIPELINE_SHARD_WINDOW or collector.MAX_QUERY_WINDOW)
+        shards = iter(self._split_window(start_date, end_date, shard_window))
+        # None은 다음 단계에 입력이 끝났음을 알리는 표시입니다.
+        raw_queue: asyncio.Queue[Optional[List[OrderRecord]]] = asyncio.Queue(maxsize=queue_size)
+        batch_queue: asyncio.Queue[Optional[Tuple[List[OrderRecord], List[Dict[str, Any]]]]] = asyncio.Queue(maxsize=queue_size)
+        ingest_result = OrderIngestResult()
+        
+        async def fetch_stage() -> None:
+            # 수집 작업들이 같은 구간 iterator를 공유하므로 구간마다 한 번씩만 조회됩니다.
+            for shard_start, shard_end in shards:
+                # 취소되면 미리 요청해 둔 페이지도 바로 정리되도록 aclosing으로 닫습니다.
+                async with aclosing(collector.iter_orders(shard_start, shard_end)) as pages:
+                    async for raw_orders_data in pages:
+                        if raw_orders_data:
+                            await raw_queue.put(raw_orders_data)
+        
+        async def validate_stage() -> None:
+            while (raw_orders_data := await raw_queue.get()) is not None:
+                for start in range(0, len(raw_orders_data), batch_size):
+                    await batch_queue.put(self._validate_records(collector.channel_id, raw_orders_data[start:start + batch_size]))
+        
+        async def persist_stage() -> None:
+            while (chunk := await batch_queue.get()) is not None:
+                orders, dead_letters = chunk
+                ingest_result.add(await self._persist_order_chunk(collector.channel_id, orders, dead_letters))
+        
+        async def run_fetchers() -> None:
+            await asyncio.gather(*(fetch_stage() for _ in range(fetch_concurrency)))
+            await raw_queue.put(None)
+        
+        async def run_validator() -> None:
+            await validate_stage()
+            await batch_queue.put(None)
+        
+        stages = [asyncio.create_task(run_fetchers()), asyncio.create_task(run_validator()), asyncio.create_task(persist_stage())]
+        try:
+            await asyncio.gather(*stages)
+        except BaseException:
+            for stage in stages:
+                stage.cancel()
+            await asyncio.gather(*stages, return_exceptions=True)
+            raise
+        return ingest_result
+    
+    async def _persist_order_chunk(
+        self,
+        channel_id: int,
+        orders: List[OrderRecord],
+        dead_letters: List[Dict[str, Any]]
+    ) -> OrderIngestResult:
+        """
+        주문 한 묶음을 저장하고 커밋합니다.
+        - 먼저 묶음 전체를 SAVEPOINT 안에서 일괄 UPSERT합니다. (평상시 경로)
+        - 제약 조건 위반/잘못된 값(IntegrityError, DataError)으로 실패하면 SAVEPOINT만 되돌리고,
+          주문마다 SAVEPOINT를 두고 하나씩 다시 저장하여 실패한 주문만 dead letter로 격리합니다.
+        - dead letter(검증 실패 포함)는 나머지 주문과 같은 트랜잭션으로 order_ingest_dead_letters에 기록됩니다.
+        그 밖의 오류(연결 끊김 등)는 묶음 전체의 문제이므로 그대로 전달합니다.
+        """
+        dead_letters = list(dead_letters)
+        try:
+            async with self.db.begin_nested():
+                ingest_result = await self._upsert_orders(orders)
+        except (IntegrityError, DataError) as e:
+            logger.warning(f"Channel {channel_id}: Bulk upsert of {len(orders)} orders failed, retrying one by one. Error: {e.orig}")
+            ingest_result = OrderIngestResult()
+            for order_data in orders:
+                try:
+                    async with self.db.begin_nested():
+                        ingest_result.add(await self._upsert_order_batch([order_data]))
+                except (IntegrityError, DataError) as order_error:
+                    dead_letters.append(self._dead_letter_row(
+                        channel_id, "persist", str(order_error.orig), order_data.to_json()
+                    ))
+        
+        if dead_letters:
+            await self.db.execute(mysql_insert(OrderIngestDeadLetter).values(dead_letters))
+            ingest_result.failed += len(dead_letters)
+            logger.warning(f"Channel {channel_id}: Quarantined {len(dead_letters)} orders to order_ingest_dead_letters")
+        await self.db.commit()
+        return ingest_result
+    
+    def _validate_records(self, channel_id: int, raw_orders_data: List[Any]) -> Tuple[List[OrderRecord], List[Dict[str, Any]]]:
+        """
+        컬렉터가 반환한 주문을 검증하여 (검증된 주문, 검증에 실패한 주문의 dead letter 행)으로 나눕니다.
+        """
+        orders: List[OrderRecord] = []
+        dead_letters: List[Dict[str, Any]] = []
+        for data in raw_orders_data:
+            try:
+                orders.append(self._to_record(data))
+            except (ValueError, TypeError, KeyError) as e:
+                payload = data.to_json() if isinstance(data, OrderRecord) else data
+                dead_letters.append(self._dead_letter_row(channel_id, "validate", f"{type(e).__name__}: {e}", payload))
+        return orders, dead_letters
+    
+    @staticmethod
+    def _to_record(data: Any) -> OrderRecord:
+        """
+        컬렉터가 반환한 주문을 검증된 OrderRecord로 만듭니다. (dict를 반환하는 컬렉터도 허용)
+        """
+        record = data if isinstance(data, OrderRecord) else OrderRecord.from_dict(data)
+        record.validate()
+        return record
+    
+    @staticmethod
+    def _dead_letter_row(channel_id: int, stage: str, error: str, payload: Any) -> Dict[str, Any]:
+        external_order_id = payload.get("external_order_id") if isinstance(payload, dict) else None
+        return {
+            "channel_id": channel_id,
+            "external_order_id": str(external_order_id)[:100] if external_order_id is not None else None,
+            "stage": stage,
+            "error": error,
+            "payload": to_jsonable_python(payload, fallback=str),
+        }
+    
+    async def _advance_sync_cursor(self, channel_id: int, synced_until: datetime) -> None:
+        """
+        채널의 동기화 커서를 전진시킵니다. 동시에 실행된 다른 동기화가 더 앞선 시점을 기록했다면 되돌리지 않습니다.
+        """
+        stmt = (
+            update(ChannelConfig)
+            .where(
+                ChannelConfig.id == channel_id,
+                or_(ChannelConfig.last_sync_at.is_(None), ChannelConfig.last_sync_at < synced_until)
+            )
+            .values(last_sync_at=synced_until, updated_at=ChannelConfig.updated_at) # 설정 변경 시각(updated_at)은 유지
+        )
+        await self.db.execute(stmt)
+    
+    async def backfill_orders(
+        self,
+        channel_id: int,
+        start_date: datetime,
+        end_date: datetime,
+        concurrency: Optional[int]=None
+    ) -> OrderBackfillResult:
+        """
+        신규 채널 등록 시 과거 주문을 대량으로 수집합니다.
+        - 전체 기간을 채널의 최대 조회 기간(MAX_QUERY_WINDOW) 단위 구간으로 나누고, concurrency개의 작업이
+          구간을 하나씩 가져가 수집 → 저장 → 체크포인트(order_backfill_shards) 기록까지 마친 뒤 다음 구간을 가져갑니다.
+          따라서 메모리에는 최대 concurrency개 구간의 주문만 유지됩니다. (저장 단계는 DB 세션 하나로 순차 실행)
+        - 구간은 ORDER_INGEST_BATCH_SIZE 단위 묶음으로 저장(_persist_order_chunk)하므로, 잘못된 주문은 dead letter로
+          격리되고 구간의 나머지 주문은 저장됩니다.
+        - 구간 경계는 시작일이 아닌 epoch 기준 MAX_QUERY_WINDOW 배수로 맞추므로, 기간을 바꾸어 다시 실행해도
+          이미 완료된 구간(또는 그 안에 포함되는 구간)은 건너뛰고 나머지부터 이어서 수집합니다.
+        """
+        concurrency = concurrency or settings.ORDER_BACKFILL_CONCURRENCY
+        # DATETIME 컬럼은 초 단위로 저장되므로, 재실행 시 구간 경계가 체크포인트와 일치하도록 맞춥니다.
+        start_date = start_date.replace(microsecond=0)
+        end_date = end_date.replace(microsecond=0)
+        
+        collector = await self._get_channel_collector(channel_id)
+        shards = self._split_window(start_date, end_date, collector.MAX_QUERY_WINDOW, aligned=True)
+        
+        done_stmt = select(OrderBackfillShard.shard_start, OrderBackfillShard.shard_end).where(
+            OrderBackfillShard.channel_id == channel_id,
+            OrderBackfillShard.status == "DONE",
+            OrderBackfillShard.shard_start < end_date,
+            OrderBackfillShard.shard_end > start_date
+        )
+        done_shards = (await self.db.execute(done_stmt)).all()
+        pending_shards = [
+            (shard_start, shard_end) for shard_start, shard_end in shards
+            if not any(done_start <= shard_start and shard_end <= done_end for done_start, done_end in done_shards)
+        ]
+        
+        result = OrderBackfillResult(
+            channel_id=channel_id,
+            total_shards=len(shards),
+            skipped_shards=len(shards) - len(pending_shards)
+        )
+        
+        batch_size = settings.ORDER_INGEST_BATCH_SIZE
+        db_lock = asyncio.Lock() # AsyncSession은 동시 사용이 불가하므로 저장 단계는 순차 실행
+        # 작업들이 같은 구간 iterator를 공유하므로 구간마다 한 번씩만 처리됩니다.
+        shard_iter = iter(pending_shards)
+        
+        async def run_shard(shard_start: datetime, shard_end: datetime) -> None:
+            try:
+                raw_orders_data = await collector.fetch_orders(shard_start, shard_end)
                 
+                shard_result = OrderIngestResult()
+                async with db_lock:
+                    # 묶음마다 커밋하고, 모든 묶음이 저장된 뒤에 구간을 DONE으로 기록합니다.
+                    for start in range(0, len(raw_orders_data), batch_size):
+                        orders, dead_letters = self._validate_records(channel_id, raw_orders_data[start:start + batch_size])
+                        shard_result.add(await self._persist_order_chunk(channel_id, orders, dead_letters))
+                    await self._record_backfill_shard(channel_id, shard_start, shard_end, "DONE", shard_result.total)
+                    await self.db.commit()
+                    
+                result.completed_shards += 1
+                result.order_count += shard_result.total
+                result.failed_order_count += shard_result.failed
+                logger.info(
+                    f"Channel {channel_id}: Backfilled {shard_result.total} orders, quarantined {shard_result.failed} "
+                    f"({shard_start} ~ {shard_end})"
+                )
+            except Exception as e:
+                logger.warning(f"Channel {channel_id}: Backfill shard {shard_start} ~ {shard_end} failed. Error: {e}")
+                result.failed_shards += 1
+                # 실패 기록이 실패해도 다른 구간의 수집은 계속되어야 하므로 예외를 전파하지 않습니다.
+                async with db_lock:
+                    try:
+                        await self.db.rollback()
+                        await self._record_backfill_shard(channel_id, shard_start, shard_end, "FAILED", 0, error=str(e))
+                        await self.db.commit()
+                    except Exception as record_error:
+                        logger.error(
+                            f"Channel {channel_id}: Failed to record failed backfill shard {shard_start} ~ {shard_end}. "
+                            f"Error: {record_error}"
+                        )
+                        await self.db.rollback()
+        
+        async def worker() -> None:
+            for shard_start, shard_end in shard_iter:
+                await run_shard(shard_start, shard_end)
+        
+        await asyncio.gather(*(worker() for _ in range(min(concurrency, len(pending_shards)))))
+        return result
+    
+    @staticmethod
+    def _split_window(
+        start_date: datetime,
+        end_date: datetime,
+        window: timedelta,
+        aligned: bool=False
+    ) -> List[Tuple[datetime, datetime]]:
+        """
+        기간을 window 단위 구간으로 나눕니다.
+        aligned이면 구간 경계를 epoch(1970-01-01) 기준 window 배수로 맞추므로, 첫/마지막 구간은 window보다 짧을 수 있습니다.
+        """
+        epoch = datetime(1970, 1, 1, tzinfo=start_date.tzinfo)
+        shards = []
+        shard_start = start_date
+        while shard_start < end_date:
+            if aligned:
+                boundary = epoch + ((shard_start - epoch) // window + 1) * window
+            else:
+                boundary = shard_start + window
+            shard_end = min(boundary, end_date)
+            shards.append((shard_start, shard_end))
+            shard_start = shard_end
+        return shards
+    
+    async def _record_backfill_shard(
+        self,
+        channel_id: int,
+        shard_start: datetime,
+        shard_end: datetime,
+        status: str,
+        order_count: int,
+        error: Optional[str]=None
+    ) -> None:
+        stmt = mysql_insert(OrderBackfillShard).values(
+            channel_id=channel_id,
+            shard_start=shard_start,
+            shard_end=shard_end,
+            status=status,
+            order_count=order_count,
+            attempts=1,
+            error=error
+        )
+        stmt = stmt.on_duplicate_key_update(
+            status=stmt.inserted.status,
+            order_count=stmt.inserted.order_count,
+            attempts=OrderBackfillShard.attempts + 1,
+            error=stmt.inserted.error,
+            updated_at=func.now()
+        )
+        await self.db.execute(stmt)
+    
+    async def _upsert_orders(self, orders: List[OrderRecord]) -> OrderIngestResult:
+        """
+        주문을 ORDER_INGEST_BATCH_SIZE 단위로 나누어 일괄 UPSERT합니다. (커밋은 호출자가 수행)
+        내용이 바뀌지 않은 주문/상품은 쓰지 않으므로, 재수집된 주문 대부분이 그대로인 평상시에는 쓰기 쿼리가 거의 실행되지 않습니다.
+        """
+        batch_size = settings.ORDER_INGEST_BATCH_SIZE
+        
+        ingest_result = OrderIngestResult()
+        for start in range(0, len(orders), batch_size):
+            ingest_result.add(await self._upsert_order_batch(orders[start:start + batch_size]))
+        return ingest_result
+    
+    @staticmethod
+    def _order_row(order_data: OrderRecord) -> Dict[str, Any]:
+        order_params = order_data.order_row()
+        order_params["content_hash"] = _content_hash(order_data.payload())
+        return order_params
+    
+    @staticmethod
+    def _order_item_row(item_data: OrderItemRecord, order_id: int) -> Dict[str, Any]:
+        item_params = item_data.item_row(order_id)
+        item_params["content_hash"] = _content_hash(item_data.payload())
+        return item_params
+    
+    async def _upsert_order_batch(self, orders: List[OrderRecord]) -> OrderIngestResult:
+        """
+        주문 한 배치를 저장합니다. 저장된 content_hash와 비교하여 새 주문/바뀐 주문과 상품만 UPSERT합니다.
+        - content_hash는 마지막으로 수집한 채널 데이터 기준이므로, 관리자가 로컬에서 바꾼 상태(umos_status 등)는
+          채널 쪽 데이터가 바뀌기 전까지 재수집으로 덮어쓰이지 않습니다.
+        - 해시가 없는 기존 행(NULL)은 다음 수집 때 한 번 다시 쓰이면서 해시가 채워집니다.
+        """
+        ingest_result = OrderIngestResult()
+        if not orders:
+            return ingest_result
+        
+        # 같은 배치에 같은 주문이 중복되면 마지막 데이터만 사용합니다.
+        orders = list({order_data.external_order_id: order_data for order_data in orders}.values())
+        external_ids = [order_data.external_order_id for order_data in orders]
+        
+        # 1. 기존 주문의 내부 ID와 content_hash를 한 번에 조회
+        existing_result = await self.db.execute(
+            select(Order.external_order_id, Order.id, Order.content_hash).where(Order.external_order_id.in_(external_ids))
+        )
+        existing_orders: Dict[str, Tuple[int, Optional[str]]] = {
+            external_id: (order_id, content_hash) for external_id, order_id, content_hash in existing_result.all()
+        }
+        
+        # 2. 주문: 새 주문과 해시가 바뀐 주문만 external_order_id 유니크 키 기준 INSERT ... ON DUPLICATE KEY UPDATE
+        changed_order_ids = set()
+        order_rows = []
+        for order_data in orders:
+            order_row = self._order_row(order_data)
+            existing = existing_orders.get(order_data.external_order_id)
+            if existing is None or existing[1] != order_row["content_hash"]:
+                order_rows.append(order_row)
+                changed_order_ids.add(order_data.external_order_id)
+        if order_rows:
+            order_stmt = mysql_insert(Order).values(order_rows)
+            order_update = {column: order_stmt.inserted[column] for column in ORDER_UPSERT_COLUMNS}
+            order_update["updated_at"] = func.now()
+            await self.db.execute(order_stmt.on_duplicate_key_update(order_update))
+        
+        # 3. 새로 추가된 주문의 내부 ID 조회
+        order_ids: Dict[str, int] = {external_id: existing[0] for external_id, existing in existing_orders.items()}
+        new_external_ids = [external_id for external_id in external_ids if external_id not in existing_orders]
+        if new_external_ids:
+            id_result = await self.db.execute(
+                select(Order.external_order_id, Order.id).where(Order.external_order_id.in_(new_external_ids))
+            )
+            order_ids.update({external_id: order_id for external_id, order_id in id_result.all()})
+        
+        # 4. 기존 주문에 속한 상품의 content_hash 조회
+        item_hashes: Dict[Tuple[int, str], Optional[str]] = {}
+        if existing_orders:
+            item_result = await self.db.execute(
+                select(OrderItem.order_id, OrderItem.external_item_id, OrderItem.content_hash)
+                .where(OrderItem.order_id.in_([existing[0] for existing in existing_orders.values()]))
+            )
+            item_hashes = {(order_id, external_item_id): content_hash for order_id, external_item_id, content_hash in item_result.all()}
+        
+        # 5. 주문 상품: 새 상품과 해시가 바뀐 상품만 (order_id, external_item_id) 유니크 키 기준 다중 행 UPSERT
+        item_rows = []
+        for order_data in orders:
+            order_id = order_ids[order_data.external_order_id]
             for item_data in order_data.items:
-                item_stmt = select(OrderItem).where(
-                    OrderItem.external_item_id == item_data.external_item_id,
-                    OrderItem.order_id == db_order.id
+                item_row = self._order_item_row(item_data, order_id)
+                if item_hashes.get((order_id, item_data.external_item_id)) != item_row["content_hash"]:
+                    item_rows.append(item_row)
+                    changed_order_ids.add(order_data.external_order_id)
+        if item_rows:
+            item_stmt = mysql_insert(OrderItem).values(item_rows)
+            item_update = {column: item_stmt.inserted[column] for column in ORDER_ITEM_UPSERT_COLUMNS}
+            for column in ORDER_ITEM_KEEP_EXISTING_COLUMNS:
+                item_update[column] = func.coalesce(item_stmt.inserted[column], getattr(OrderItem, column))
+            item_update["updated_at"] = func.now()
+            await self.db.execute(item_stmt.on_duplicate_key_update(item_update))
+        
+        for external_id in external_ids:
+            if external_id not in existing_orders:
+                ingest_result.inserted += 1
+            elif external_id in changed_order_ids:
+                ingest_result.updated += 1
+            else:
+                ingest_result.unchanged += 1
+        
+        logger.debug(f"Upserted {len(order_rows)} orders / {len(item_rows)} items ({ingest_result.unchanged} orders unchanged)")
+        return ingest_result
+    
+    # ----------------------------------------------------
+    # 대량 발주 확인 / 발송 처리
+    # ----------------------------------------------------
+    async def confirm_preparation_bulk(self, order_item_ids: List[int]) -> BulkItemActionResponse:
+        """
+        여러 주문 상품의 발주를 확인하고, 성공한 상품의 상태를 PREPARING으로 일괄 변경합니다.
+        채널별로 PREPARATION_BATCH_SIZE 단위로 나누어 동시에 호출합니다.
+        상태가 PREPARATION_ALLOWED_STATUSES가 아닌 상품은 채널을 호출하지 않고 실패로 반환합니다.
+        """
+        item_ids = list(dict.fromkeys(order_item_ids))
+        errors = await self._dispatch_item_chunks(
+            item_ids, lambda collector: collector.PREPARATION_BATCH_SIZE, self._send_preparation, PREPARATION_ALLOWED_STATUSES
+        )
+        
+        succeeded = [item_id for item_id in item_ids if errors.get(item_id) is None]
+        for start in range(0, len(succeeded), settings.ORDER_INGEST_BATCH_SIZE):
+            chunk = succeeded[start:start + settings.ORDER_INGEST_BATCH_SIZE]
+            await self.db.execute(
+                update(OrderItem)
+                .where(OrderItem.id.in_(chunk), OrderItem.umos_status.in_(PREPARATION_ALLOWED_STATUSES))
+                .values(umos_status="PREPARING", updated_at=func.now())
+                .execution_options(synchronize_session=False)
+            )
+        await self.db.commit()
+        return self._bulk_response(item_ids, errors)
+    
+    async def ship_items_bulk(self, shipments: List[ShipmentItem]) -> BulkItemActionResponse:
+        """
+        여러 주문 상품의 송장을 등록(발송 처리)하고, 성공한 상품의 택배사/송장번호/상태(SHIPPED)를 일괄 반영합니다.
+        - 채널별로 SHIPMENT_BATCH_SIZE 단위로 나누어 최대 ORDER_BULK_CHUNK_CONCURRENCY개씩 동시에 호출합니다.
+          일괄 등록 API가 없는 채널은 chunk 안에서 최대 SHIPMENT_CONCURRENCY개씩 상품별로 호출합니다.
+        - 상태가 SHIPMENT_ALLOWED_STATUSES가 아닌 상품(취소 등)은 채널을 호출하지 않고 실패로 반환합니다.
+        - DB 반영은 상품별 UPDATE 대신 CASE 식을 사용한 UPDATE 한 문장(배치 단위)으로 처리합니다.
+        """
+        shipment_by_id: Dict[int, ShipmentItem] = {shipment.order_item_id: shipment for shipment in shipments}
+        item_ids = list(shipment_by_id)
+        
+        send = self._shipment_sender({
+            item_id: (shipment.courier_code, shipment.tracking_number) for item_id, shipment in shipment_by_id.items()
+        })
+        errors = await self._dispatch_item_chunks(
+            item_ids, lambda collector: collector.SHIPMENT_BATCH_SIZE, send, SHIPMENT_ALLOWED_STATUSES
+        )
+        
+        succeeded = [shipment_by_id[item_id] for item_id in item_ids if errors.get(item_id) is None]
+        for start in range(0, len(succeeded), settings.ORDER_INGEST_BATCH_SIZE):
+            chunk = succeeded[start:start + settings.ORDER_INGEST_BATCH_SIZE]
+            await self.db.execute(
+                update(OrderItem)
+                .where(
+                    OrderItem.id.in_([shipment.order_item_id for shipment in chunk]),
+                    OrderItem.umos_status.in_(SHIPMENT_ALLOWED_STATUSES)
                 )
-                item_result = await self.db.execute(item_stmt)
-                existing_item = item_result.scalar_one_or_none()
-                
-                item_params = item_data.model_dump()
-                item_params["order_id"] = db_order.id
-
-                if existing_item:
-                    update_item_stmt = update(OrderItem).where(OrderItem.id == existing_item.id).values(**item_params)
-                    await self.db.execute(update_item_stmt)
-                    logger.debug(f"Updated existing OrderItem: {existing_item.external_item_id}")
-                else:
-                    db_item = OrderItem(**item_params)
-                    self.db.add(db_item)
-                    logger.debug(f"Created new OrderItem: {db_item.external_item_id}")
-            
-            order_count += 1
-            
+                .values(
+                    courier_name=case({shipment.order_item_id: shipment.courier_code for shipment in chunk}, value=OrderItem.id),
+                    tracking_number=case({shipment.order_item_id: shipment.tracking_number for shipment in chunk}, value=OrderItem.id),
+                    umos_status="SHIPPED",
+                    updated_at=func.now()
+                )
+                .execution_options(synchronize_session=False)
+            )
+        await self.db.commit()
+        return self._bulk_response(item_ids, errors)
+    
+    @staticmethod
+    async def _send_preparation(collector: IOrderCollector, chunk: List[Tuple[int, str]]) -> Dict[int, Optional[str]]:
+        confirmed = await collector.confirm_order_preparation([external_item_id for _, external_item_id in chunk])
+        error = None if confirmed is not False else "Rejected by channel API"
+        return {item_id: error for item_id, _ in chunk}
+    
+    @staticmethod
+    def _shipment_sender(
+        tracking_by_id: Dict[int, Tuple[str, str]]
+    ) -> Callable[[IOrderCollector, List[Tuple[int, str]]], Awaitable[Dict[int, Optional[str]]]]:
+        """
+        주문 상품 ID별 (택배사, 송장번호)로 송장 등록 chunk를 전송하는 함수를 만듭니다.
+        """
+        async def send(collector: IOrderCollector, chunk: List[Tuple[int, str]]) -> Dict[int, Optional[str]]:
+            results = await collector.register_tracking_and_ship_bulk([
+                (external_item_id, *tracking_by_id[item_id]) for item_id, external_item_id in chunk
+            ])
+            return {item_id: results.get(external_item_id, "No result from channel API") for item_id, external_item_id in chunk}
+        return send
+    
+    async def _dispatch_item_chunks(
+        self,
+        item_ids: List[int],
+        batch_size_of: Callable[[IOrderCollector], int],
+        send: Callable[[IOrderCollector, List[Tuple[int, str]]], Awaitable[Dict[int, Optional[str]]]],
+        allowed_statuses: Optional[Tuple[str, ...]]=None
+    ) -> Dict[int, Optional[str]]:
+        """
+        주문 상품을 채널별로 묶고, 컬렉터의 배치 한도 단위 chunk로 나누어 send를 동시에 호출합니다.
+        상품 ID별 오류 메시지(성공 시 None)를 반환합니다. chunk 호출이 예외를 던지면 chunk 전체가 실패로 기록됩니다.
+        allowed_statuses가 주어지면 현재 상태가 그 중 하나가 아닌 상품은 send에 넘기지 않고 실패로 기록합니다.
+        """
+        errors: Dict[int, Optional[str]] = {}
+        
+        result = await self.db.execute(
+            select(OrderItem.id, OrderItem.external_item_id, OrderItem.umos_status, Order.channel_id)
+            .join(Order, OrderItem.order_id == Order.id)
+            .where(OrderItem.id.in_(item_ids))
+        )
+        items_by_channel: Dict[int, List[Tuple[int, str]]] = {}
+        found = set()
+        for item_id, external_item_id, umos_status, channel_id in result.all():
+            found.add(item_id)
+            if allowed_statuses is not None and umos_status not in allowed_statuses:
+                errors[item_id] = f"Not allowed in status {umos_status}"
+                continue
+            items_by_channel.setdefault(channel_id, []).append((item_id, external_item_id))
+        
+        for item_id in item_ids:
+            if item_id not in found:
+                errors[item_id] = "Order item not found"
+        
+        chunks: List[Tuple[IOrderCollector, List[Tuple[int, str]]]] = []
+        for channel_id, items in items_by_channel.items():
+            try:
+                collector = await self._get_channel_collector(channel_id)
+            except Exception as e:
+                errors.update({item_id: str(e) for item_id, _ in items})
+                continue
+            batch_size = max(1, batch_size_of(collector))
+            chunks.extend((collector, items[start:start + batch_size]) for start in range(0, len(items), batch_size))
+        # 채널 API를 호출하는 동안 조회 트랜잭션을 열어두지 않습니다.
+        await self.db.commit()
+        
+        semaphore = asyncio.Semaphore(settings.ORDER_BULK_CHUNK_CONCURRENCY)
+        
+        async def run_chunk(collector: IOrderCollector, chunk: List[Tuple[int, str]]) -> None:
+            async with semaphore:
+                try:
+                    errors.update(await send(collector, chunk))
+                except Exception as e:
+                    logger.warning(f"Channel {collector.channel_id}: Bulk request for {len(chunk)} items failed. Error: {e}")
+                    errors.update({item_id: str(e) for item_id, _ in chunk})
+        
+        await asyncio.gather(*(run_chunk(collector, chunk) for collector, chunk in chunks))
+        return errors
+    
+    @staticmethod
+    def _bulk_response(item_ids: List[int], errors: Dict[int, Optional[str]]) -> BulkItemActionResponse:
+        response = BulkItemActionResponse()
+        for item_id in item_ids:
+            error = errors.get(item_id)
+            response.results.append(BulkItemResult(order_item_id=item_id, success=error is None, error=error))
+            if error is None:
+                response.succeeded += 1
+            else:
+                response.failed += 1
+        return response
+    
+    # ----------------------------------------------------
+    # 상태 변경 outbox (채널 반영은 워커에서 비동기로 처리)
+    # ----------------------------------------------------
+    async def update_item_statuses(self, updates: List[ItemStatusUpdate]) -> ItemStatusUpdateResponse:
+        """
+        주문 상품 상태(택배사/송장번호 포함)를 변경하고, 같은 트랜잭션에서 outbox 이벤트를 기록합니다.
+        채널 API는 호출하지 않으므로 외부 API 지연과 무관하게 바로 반환됩니다.
+        """
+        update_by_id: Dict[int, ItemStatusUpdate] = {update_data.order_item_id: update_data for update_data in updates}
+        
+        result = await self.db.execute(
+            select(OrderItem.id, Order.channel_id)
+            .join(Order, OrderItem.order_id == Order.id)
+            .where(OrderItem.id.in_(list(update_by_id)))
+        )
+        channel_by_item: Dict[int, int] = dict(result.all())
+        found = [update_by_id[item_id] for item_id in update_by_id if item_id in channel_by_item]
+        
+        for start in range(0, len(found), settings.ORDER_INGEST_BATCH_SIZE):
+            chunk = found[start:start + settings.ORDER_INGEST_BATCH_SIZE]
+            ids = [update_data.order_item_id for update_data in chunk]
+            # 택배사/송장번호가 주어지지 않은 상품은 기존 값을 유지합니다.
+            await self.db.execute(
+                update(OrderItem)
+                .where(OrderItem.id.in_(ids))
+                .values(
+                    umos_status=case({u.order_item_id: u.umos_status for u in chunk}, value=OrderItem.id),
+                    courier_name=func.coalesce(case({u.order_item_id: u.courier_code for u in chunk}, value=OrderItem.id), OrderItem.courier_name),
+                    tracking_number=func.coalesce(case({u.order_item_id: u.tracking_number for u in chunk}, value=OrderItem.id), OrderItem.tracking_number),
+                    updated_at=func.now()
+                )
+                .execution_options(synchronize_session=False)
+            )
+            await self.db.execute(mysql_insert(OrderStatusOutbox).values([
+                {
+                    "channel_id": channel_by_item[u.order_item_id],
+                    "order_item_id": u.order_item_id,
+                    "umos_status": u.umos_status,
+                    "courier_name": u.courier_code,
+                    "tracking_number": u.tracking_number,
+                    "status": "PENDING",
+                    "attempts": 0,
+                }
+                for u in chunk
+            ]))
         await self.db.commit()
-        return order_count
\ No newline at end of file
+        
+        return ItemStatusUpdateResponse(
+            updated=len(found),
+            not_found=[item_id for item_id in update_by_id if item_id not in channel_by_item]
+        )
+    
+    async def flush_status_outbox(self, batch_size: Optional[int]=None) -> int:
+        """
+        전송 대기 outbox 이벤트를 기록 순서대로 최대 batch_size개 가져와 채널에 반영하고, 처리한 이벤트 수를 반환합니다.
+        채널 API 호출 동안 outbox 행 잠금을 유지하지 않도록 세 단계로 나누어 처리합니다.
+        1. 가져오기(_claim_outbox_events): 이벤트를 IN_FLIGHT로 표시하고 커밋합니다.
+        2. 전송: 트랜잭션 없이 채널 API를 호출합니다.
+           PREPARING은 발주 확인, SHIPPED는 송장 등록 API로 채널별 배치 한도 단위로 묶어 전송합니다.
+           같은 상품의 이벤트가 여러 개(예: PREPARING → SHIPPED)이면 기록 순서대로 한 단계씩 보내며,
+           앞 이벤트가 실패하면 뒤 이벤트는 보내지 않고 다시 대기(PENDING)시킵니다. (채널은 발주 확인 후에만 발송 처리 가능)
+        3. 기록(_record_outbox_results): 결과를 새 트랜잭션으로 기록합니다.
+           실패한 이벤트는 지수 백오프(ORDER_OUTBOX_RETRY_DELAY부터 2배씩) 후 ORDER_OUTBOX_MAX_ATTEMPTS까지 재시도합니다.
+        """
+        processed_count, events = await self._claim_outbox_events(batch_size or settings.ORDER_OUTBOX_BATCH_SIZE)
+        if not events:
+            return processed_count
+    
+        chains: Dict[int, List[Dict[str, Any]]] = {}
+        for event in events:
+            chains.setdefault(event["order_item_id"], []).append(event)
+    
+        errors: Dict[int, Optional[str]] = {}
+        deferred_ids: List[int] = []
+        step = 0
+        while True:
+            current = {item_id: chain[step] for item_id, chain in chains.items() if step < len(chain)}
+            if not current:
+                break
+            step_errors = await self._send_outbox_step(current)
+            for item_id, event in current.items():
+                errors[event["id"]] = step_errors.get(item_id)
+                if step_errors.get(item_id) is not None:
+                    # 앞 단계가 실패한 상품의 다음 이벤트는 보내지 않습니다.
+                    deferred_ids.extend(later["id"] for later in chains.pop(item_id)[step + 1:])
+            step += 1
+    
+        await self._record_outbox_results(
+            [event for event in events if event["id"] not in deferred_ids], errors, deferred_ids
+        )
+    
+        failed = sum(1 for error in errors.values() if error is not None)
+        logger.info(
+            f"Flushed {processed_count} outbox events ({len(errors)} sent, {failed} failed, {len(deferred_ids)} deferred)"
+        )
+        return processed_count
+    
+    async def _send_outbox_step(self, events_by_item: Dict[int, Dict[str, Any]]) -> Dict[int, Optional[str]]:
+        """
+        상품마다 이벤트 하나씩을 채널에 전송하고, 상품 ID별 오류 메시지(성공 시 None)를 반환합니다.
+        """
+        preparation_ids = [item_id for item_id, event in events_by_item.items() if event["umos_status"] == "PREPARING"]
+        shipment_ids = [item_id for item_id, event in events_by_item.items() if event["umos_status"] == "SHIPPED"]
+    
+        errors: Dict[int, Optional[str]] = {}
+        if preparation_ids:
+            errors.update(await self._dispatch_item_chunks(
+                preparation_ids, lambda collector: collector.PREPARATION_BATCH_SIZE, self._send_preparation
+            ))
+        if shipment_ids:
+            send = self._shipment_sender({
+                item_id: (events_by_item[item_id]["courier_name"], events_by_item[item_id]["tracking_number"])
+                for item_id in shipment_ids
+            })
+            errors.update(await self._dispatch_item_chunks(
+                shipment_ids, lambda collector: collector.SHIPMENT_BATCH_SIZE, send
+            ))
+        return errors
+    
+    @staticmethod
+    def _coalesce_outbox_events(claimed: List[Any], open_events: List[Any]) -> Tuple[List[int], List[int], List[Any]]:
+        """
+        가져온 이벤트를 (SUPERSEDED로 표시할 ID, SKIPPED로 표시할 ID, 전송할 행)으로 나눕니다. 나머지는 보류하여 그대로 둡니다.
+        - claimed는 가져온 이벤트 행, open_events는 같은 상품들의 처리되지 않은(PENDING/IN_FLIGHT) 이벤트 행이며 둘 다 id 순서입니다.
+        - 채널 API가 있는 상태 기준으로 바로 다음 이벤트가 같은 상태이면 다음 이벤트로 대체(SUPERSEDED)합니다.
+          상태가 다른 중간 이벤트(예: SHIPPED 앞의 PREPARING)는 합치지 않고 순서대로 보냅니다.
+        - 채널 API가 없는 상태의 이벤트는 SKIPPED입니다.
+        - 같은 상품에 이번에 보낼 수 없는 앞 이벤트(재시도 대기 중 등)가 있으면, 순서를 지키기 위해 그 뒤 이벤트는 보류합니다.
+        """
+        api_statuses = ("PREPARING", "SHIPPED")
+        sequence_by_item: Dict[int, List[Any]] = {}
+        for row in open_events:
+            if row.umos_status in api_statuses:
+                sequence_by_item.setdefault(row.order_item_id, []).append(row)
+        following_status: Dict[int, str] = {}
+        for sequence in sequence_by_item.values():
+            for current, following in zip(sequence, sequence[1:]):
+                following_status[current.id] = following.umos_status
+    
+        superseded_ids, skipped_ids, candidate_ids = [], [], set()
+        for row in claimed:
+            if row.umos_status not in api_statuses:
+                skipped_ids.append(row.id)
+            elif following_status.get(row.id) == row.umos_status:
+                superseded_ids.append(row.id)
+            else:
+                candidate_ids.add(row.id)
+    
+        superseded = set(superseded_ids)
+        sendable_ids = set()
+        for sequence in sequence_by_item.values():
+            for event in sequence:
+                if event.id in superseded:
+                    continue
+                if event.id not in candidate_ids:
+                    break
+                sendable_ids.add(event.id)
+        return superseded_ids, skipped_ids, [row for row in claimed if row.id in sendable_ids]
+    
+    async def _claim_outbox_events(self, batch_size: int) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        전송할 이벤트를 가져와 IN_FLIGHT로 표시하고 커밋합니다. (처리한 이벤트 수, 전송할 이벤트 목록)을 반환합니다.
+        - 대상: 재시도 시각이 지난 PENDING 이벤트, 전송 제한 시간(ORDER_OUTBOX_CLAIM_TIMEOUT)이 지난 IN_FLIGHT 이벤트(flush 중 비정상 종료)
+        - 대체/건너뛰기/보류 규칙은 _coalesce_outbox_events를 따릅니다. 보류한 이벤트는 변경하지 않으며 처리 수에 포함하지 않습니다.
+        """
+        Outbox = OrderStatusOutbox
+        result = await self.db.execute(
+            select(Outbox.id, Outbox.order_item_id, Outbox.umos_status, Outbox.courier_name, Outbox.tracking_number, Outbox.attempts)
+            .where(or_(
+                and_(Outbox.status == "PENDING", or_(Outbox.next_attempt_at.is_(None), Outbox.next_attempt_at <= func.now())),
+                and_(Outbox.status == "IN_FLIGHT", Outbox.next_attempt_at <= func.now())
+            ))
+            .order_by(Outbox.id)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        rows = result.all()
+        if not rows:
+            await self.db.commit()
+            return 0, []
+    
+        open_result = await self.db.execute(
+            select(Outbox.id, Outbox.order_item_id, Outbox.umos_status)
+            .where(Outbox.order_item_id.in_({row.order_item_id for row in rows}), Outbox.status.in_(["PENDING", "IN_FLIGHT"]))
+            .order_by(Outbox.id)
+        )
+        superseded_ids, skipped_ids, sendable = self._coalesce_outbox_events(rows, open_result.all())
+        events = [{**row._asdict(), "attempts": row.attempts + 1} for row in sendable]
+    
+        for ids, status in ((superseded_ids, "SUPERSEDED"), (skipped_ids, "SKIPPED")):
+            if ids:
+                await self.db.execute(
+                    update(Outbox).where(Outbox.id.in_(ids)).values(status=status, next_attempt_at=None, processed_at=func.now())
+                )
+        if events:
+            await self.db.execute(
+                update(Outbox)
+                .where(Outbox.id.in_([event["id"] for event in events]))
+                .values(status="IN_FLIGHT", attempts=Outbox.attempts + 1, next_attempt_at=db_now_plus(settings.ORDER_OUTBOX_CLAIM_TIMEOUT))
+            )
+        await self.db.commit()
+        return len(superseded_ids) + len(skipped_ids) + len(events), events
+    
+    async def _record_outbox_results(
+        self,
+        events: List[Dict[str, Any]],
+        errors: Dict[int, Optional[str]],
+        deferred_ids: List[int]=()
+    ) -> None:
+        """
+        전송 결과(이벤트 ID별 오류 메시지, 성공 시 None)를 기록합니다.
+        성공은 SENT, 마지막 시도까지 실패하면 FAILED, 그 외 실패는 백오프 후 재시도(PENDING)로 표시합니다.
+        앞 이벤트가 실패하여 보내지 않은 이벤트(deferred_ids)는 시도 횟수를 되돌리고 PENDING으로 둡니다.
+        전송 제한 시간이 지나 다른 flush가 다시 가져간 이벤트(IN_FLIGHT가 아닌 이벤트)는 변경하지 않습니다.
+        """
+        Outbox = OrderStatusOutbox
+        sent_ids = []
+        failed_errors: Dict[int, str] = {}
+        retry_errors_by_delay: Dict[int, Dict[int, str]] = {}
+        for event in events:
+            error = errors.get(event["id"])
+            if error is None:
+                sent_ids.append(event["id"])
+            elif event["attempts"] >= settings.ORDER_OUTBOX_MAX_ATTEMPTS:
+                failed_errors[event["id"]] = error
+            else:
+                delay = min(settings.ORDER_OUTBOX_RETRY_DELAY * (2 ** (event["attempts"] - 1)), settings.ORDER_OUTBOX_MAX_RETRY_DELAY)
+                retry_errors_by_delay.setdefault(delay, {})[event["id"]] = error
+    
+        in_flight = Outbox.status == "IN_FLIGHT"
+        if sent_ids:
+            await self.db.execute(
+                update(Outbox)
+                .where(Outbox.id.in_(sent_ids), in_flight)
+                .values(status="SENT", error=None, next_attempt_at=None, processed_at=func.now())
+            )
+        if failed_errors:
+            await self.db.execute(
+                update(Outbox)
+                .where(Outbox.id.in_(list(failed_errors)), in_flight)
+                .values(status="FAILED", error=case(failed_errors, value=Outbox.id), next_attempt_at=None, processed_at=func.now())
+            )
+        for delay, retry_errors in retry_errors_by_delay.items():
+            await self.db.execute(
+                update(Outbox)
+                .where(Outbox.id.in_(list(retry_errors)), in_flight)
+                .values(status="PENDING", error=case(retry_errors, value=Outbox.id), next_attempt_at=db_now_plus(delay))
+            )
+        if deferred_ids:
+            await self.db.execute(
+                update(Outbox)
+                .where(Outbox.id.in_(list(deferred_ids)), in_flight)
+                .values(status="PENDING", attempts=Outbox.attempts - 1, next_attempt_at=None)
+            )
+        await self.db.commit()
\ No newline at end of file
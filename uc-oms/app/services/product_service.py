@@ -1,12 +1,24 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
 from app.models.channel import ChannelConfig
-from app.core.security import decrypt_data
+from app.models.product import Product
+from app.core.security import decrypt_data_async
 from app.collectors.base_collector import IProductCollector
 from app.collectors.coupang_collector import CoupangCollector
 from app.collectors.smartstore_collector import SmartstoreCollector
 from app.collectors.mock_collector import MockCollector
-from sqlalchemy import select
+from app.schemas.product import ChannelFetchResult, ProductFetchAllResponse, ProductRead, ProductSnapshotResponse
+from app.services.collector_cache import collector_cache
+from sqlalchemy import select, update, delete, func
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
 
 COLLECTOR_MAPPING = {
         "coupang": CoupangCollector,
@@ -14,57 +26,307 @@ COLLECTOR_MAPPING = {
         "mock": MockCollector
 }
 
+# 스냅샷 갱신 시 ON DUPLICATE KEY UPDATE로 덮어쓸 컬럼
+PRODUCT_UPSERT_COLUMNS = ["channel_type", "product_name", "status", "synced_at"]
+
+# 채널별로 진행 중인 스냅샷 갱신 작업. 같은 채널의 갱신은 동시에 하나만 실행합니다. (single-flight)
+_refresh_tasks: Dict[int, asyncio.Task] = {}
+# 프로세스 전체의 스냅샷 갱신 동시 실행 수 제한. 요청이 기다리는 갱신과 백그라운드 갱신이 모두 이 세마포어를 거칩니다.
+_refresh_semaphore = asyncio.Semaphore(settings.PRODUCT_SNAPSHOT_REFRESH_CONCURRENCY)
+
+def snapshot_ttl(channel_type: str) -> timedelta:
+        return timedelta(seconds=settings.PRODUCT_SNAPSHOT_TTLS.get(channel_type, settings.PRODUCT_SNAPSHOT_TTL))
+
+def schedule_snapshot_refresh(
+        channel_id: int,
+        session_factory: async_sessionmaker[AsyncSession] = AsyncSessionLocal
+) -> asyncio.Task:
+        """
+        채널의 상품 스냅샷 갱신을 백그라운드 작업으로 시작합니다.
+        이미 진행 중인 갱신이 있으면 새로 시작하지 않고 그 작업을 반환합니다.
+        갱신은 요청과 무관하게 끝까지 실행되어야 하므로 요청 세션이 아닌 별도 세션을 사용합니다.
+        동시에 실행되는 갱신 수는 _refresh_semaphore로 제한되며, 초과한 갱신은 순서를 기다립니다.
+        """
+        task = _refresh_tasks.get(channel_id)
+        if task is not None and not task.done():
+                return task
+
+        async def run() -> int:
+                async with _refresh_semaphore:
+                        async with session_factory() as session:
+                                return await ProductCollectorService(db=session).refresh_snapshot(channel_id)
+
+        def on_done(finished: asyncio.Task) -> None:
+                if _refresh_tasks.get(channel_id) is finished:
+                        del _refresh_tasks[channel_id]
+                # 아무도 기다리지 않는 백그라운드 갱신의 실패도 로그로 남깁니다.
+                if not finished.cancelled() and finished.exception() is not None:
+                        logger.warning(f"Product snapshot refresh failed for channel ID {channel_id}. Error: {finished.exception()}")
+
+        task = asyncio.create_task(run())
+        task.add_done_callback(on_done)
+        _refresh_tasks[channel_id] = task
+        return task
+
 class ProductCollectorService:
         def __init__(self, db:AsyncSession):
                 self.db = db
                 
-        async def fetch_products_from_channel(self, channel_id: int, page: int=1, page_size: int=50) -> List[Dict[str,Any]]:
-                stmt = select(ChannelConfig).where(ChannelConfig.id == channel_id, ChannelConfig.is_active == True)
-                result= await self.db.execute(stmt)
-                channel_config = result.scalar_one_or_none()
-                
-                if not channel_config:
-                        raise ValueError(f"Channel with ID {channel_id} not found or is inactive.")
-                
+        async def _build_collector(self, channel_config: ChannelConfig) -> IProductCollector:
+                channel_id = channel_config.id
                 channel_type = channel_config.channel_type
                 
                 if channel_type not in COLLECTOR_MAPPING:
                         raise NotImplementedError(f"Collector for channel type '{channel_type}' is not implemented.")
                 
                 try:
-                        decrypted_api_key = decrypt_data(channel_config.api_key)
-                        decrypted_api_secret = decrypt_data(channel_config.api_secret)
+                        decrypted_api_key = await decrypt_data_async(channel_config.api_key)
+                        decrypted_api_secret = await decrypt_data_async(channel_config.api_secret)
                 except ValueError as e:
                         raise RuntimeError(f"Configuration error: Failed to decrypt API keys for channel {channel_id}.")
                 
                 CollectorClass: type[IProductCollector] = COLLECTOR_MAPPING[channel_type]
                 
-                collector = CollectorClass(
+                return CollectorClass(
                         channel_id=channel_id,
                         api_key=decrypted_api_key,
                         api_secret=decrypted_api_secret
                 )
                 
+        async def _get_or_build_collector(self, channel_config: ChannelConfig, generation: Optional[int]=None) -> IProductCollector:
+                """
+                generation은 channel_config를 조회하기 전에 읽은 collector_cache.generation 값입니다. (없으면 지금 읽습니다)
+                조회/복호화 중에 채널이 수정되어 invalidate되었으면, 만든 컬렉터는 이번 호출에만 사용하고 캐시에 저장하지 않습니다.
+                """
+                if generation is None:
+                        generation = collector_cache.generation(channel_config.id)
+                collector = collector_cache.get("product", channel_config.id)
+                if collector is None:
+                        collector = await self._build_collector(channel_config)
+                        collector_cache.put("product", channel_config.id, collector, generation)
+                return collector
+        
+        async def _get_active_channel(self, channel_id: int) -> ChannelConfig:
+                stmt = select(ChannelConfig).where(ChannelConfig.id == channel_id, ChannelConfig.is_active == True)
+                result= await self.db.execute(stmt)
+                channel_config = result.scalar_one_or_none()
+
+                if not channel_config:
+                        raise ValueError(f"Channel with ID {channel_id} not found or is inactive.")
+                return channel_config
+
+        async def _get_collector(self, channel_id: int) -> IProductCollector:
+                """
+                캐시된 컬렉터를 반환합니다. 없을 때만 채널 설정을 조회하고 키를 복호화하여 생성합니다.
+                """
+                collector = collector_cache.get("product", channel_id)
+                if collector is not None:
+                        return collector
+                
+                generation = collector_cache.generation(channel_id)
+                return await self._get_or_build_collector(await self._get_active_channel(channel_id), generation)
+                
+        async def fetch_products_from_channel(self, channel_id: int, page: int=1, page_size: int=50) -> List[Dict[str,Any]]:
+                """
+                스냅샷을 거치지 않고 채널 API에서 상품 한 페이지를 직접 조회합니다.
+                """
+                collector = await self._get_collector(channel_id)
+                
                 products = await collector.fetch_products(page=page, page_size=page_size)
                 return products
+
+        # ----------------------------------------------------
+        # 상품 스냅샷 (products 테이블)
+        # ----------------------------------------------------
+        @staticmethod
+        def _is_stale(channel_config: ChannelConfig) -> bool:
+                synced_at = channel_config.products_synced_at
+                return synced_at is None or datetime.now() - synced_at >= snapshot_ttl(channel_config.channel_type)
+
+        @staticmethod
+        def _product_row(channel_id: int, channel_type: str, product: Dict[str, Any], synced_at: datetime) -> Optional[Dict[str, Any]]:
+                external_id = product.get("external_id")
+                if external_id is None:
+                        return None
+                return {
+                        "channel_id": channel_id,
+                        "channel_type": channel_type,
+                        "external_id": str(external_id),
+                        "product_name": product.get("product_name"),
+                        "status": product.get("status"),
+                        "synced_at": synced_at,
+                }
+
+        async def _upsert_products(self, rows: List[Dict[str, Any]]) -> None:
+                stmt = mysql_insert(Product).values(rows)
+                product_update = {column: stmt.inserted[column] for column in PRODUCT_UPSERT_COLUMNS}
+                product_update["updated_at"] = func.now()
+                await self.db.execute(stmt.on_duplicate_key_update(product_update))
+                await self.db.commit()
+
+        async def refresh_snapshot(self, channel_id: int) -> int:
+                """
+                채널 API의 전체 상품을 페이지 순서대로 읽어 products 테이블을 갱신하고, 저장한 상품 수를 반환합니다.
+                - batch 단위로 UPSERT 후 커밋하므로 갱신 중에도 조회 요청은 기존 스냅샷을 읽을 수 있습니다.
+                - 전체 순회가 끝난 뒤에만 채널에서 사라진 상품을 삭제하고 갱신 시각을 기록합니다.
+                  중간에 실패하면 갱신 시각이 그대로이므로 다음 조회에서 다시 갱신됩니다.
+                """
+                channel_config = await self._get_active_channel(channel_id)
+                channel_type = channel_config.channel_type # 배치마다 커밋하면 ORM 객체가 만료되므로 미리 읽어 둡니다.
+                collector = await self._get_or_build_collector(channel_config)
+
+                # DATETIME 컬럼은 초 단위로 저장되므로 비교 기준도 초 단위로 맞춥니다.
+                started_at = datetime.now().replace(microsecond=0)
+                batch_size = settings.PRODUCT_SNAPSHOT_BATCH_SIZE
+
+                batch: List[Dict[str, Any]] = []
+                saved = 0
+                try:
+                        async for product in collector.iter_products(page_size=settings.PRODUCT_SNAPSHOT_PAGE_SIZE):
+                                row = self._product_row(channel_id, channel_type, product, started_at)
+                                if row is None:
+                                        logger.warning(f"Channel {channel_id}: Skipping product without external_id")
+                                        continue
+                                batch.append(row)
+                                if len(batch) >= batch_size:
+                                        await self._upsert_products(batch)
+                                        saved += len(batch)
+                                        batch = []
+                        if batch:
+                                await self._upsert_products(batch)
+                                saved += len(batch)
+
+                        # 이번 갱신에서 확인되지 않은 상품은 채널에서 삭제된 상품입니다.
+                        await self.db.execute(
+                                delete(Product).where(Product.channel_id == channel_id, Product.synced_at < started_at)
+                        )
+                        await self.db.execute(
+                                update(ChannelConfig)
+                                .where(ChannelConfig.id == channel_id)
+                                .values(products_synced_at=started_at, updated_at=ChannelConfig.updated_at) # 설정 변경 시각(updated_at)은 유지
+                        )
+                        await self.db.commit()
+                except Exception:
+                        await self.db.rollback()
+                        raise
+
+                logger.info(f"Channel {channel_id}: Product snapshot refreshed ({saved} products)")
+                return saved
+
+        async def _read_snapshot_page(self, channel_id: int, page: int, page_size: int) -> List[ProductRead]:
+                stmt = (
+                        select(Product)
+                        .where(Product.channel_id == channel_id)
+                        .order_by(Product.id)
+                        .offset((page - 1) * page_size)
+                        .limit(page_size)
+                )
+                result = await self.db.execute(stmt)
+                return [ProductRead.model_validate(product) for product in result.scalars().all()]
+
+        async def get_channel_products(
+                self,
+                channel_id: int,
+                page: int=1,
+                page_size: int=50,
+                force_refresh: bool=False
+        ) -> ProductSnapshotResponse:
+                """
+                채널의 상품 목록을 스냅샷에서 조회합니다. (stale-while-revalidate)
+                - 스냅샷이 없거나 force_refresh이면 갱신이 끝날 때까지 기다린 뒤 반환합니다.
+                - 스냅샷이 TTL보다 오래되었으면 기존 스냅샷을 바로 반환하고, 갱신은 백그라운드에서 실행합니다.
+                """
+                channel_config = await self._get_active_channel(channel_id)
+                stale = False
+
+                if force_refresh or channel_config.products_synced_at is None:
+                        # 요청이 취소되어도 다른 요청과 공유하는 갱신 작업은 취소되지 않도록 shield로 감쌉니다.
+                        await asyncio.shield(schedule_snapshot_refresh(channel_id))
+                        # 다른 세션에서 커밋한 스냅샷을 읽기 위해 현재 읽기 트랜잭션을 종료합니다. (REPEATABLE READ)
+                        await self.db.rollback()
+                        channel_config = await self._get_active_channel(channel_id)
+                elif self._is_stale(channel_config):
+                        schedule_snapshot_refresh(channel_id)
+                        stale = True
+
+                return ProductSnapshotResponse(
+                        channel_id=channel_id,
+                        products=await self._read_snapshot_page(channel_id, page, page_size),
+                        synced_at=channel_config.products_synced_at,
+                        stale=stale
+                )
         
-        async def fetch_all_products(self, page: int=1, page_size: int=50) -> List[Dict[str, Any]]:
-                stmt = select(ChannelConfig.id).where(ChannelConfig.is_active==True)
+        async def fetch_all_products(
+                self,
+                page: int=1,
+                page_size: int=50,
+                concurrency: Optional[int]=None,
+                channel_timeout: Optional[float]=None
+        ) -> ProductFetchAllResponse:
+                """
+                모든 활성 채널의 상품을 스냅샷에서 조회합니다.
+                - 오래된 스냅샷은 그대로 반환하고 백그라운드에서 갱신합니다.
+                - 스냅샷이 없는 채널만 최초 갱신을 기다리며, 동시 갱신 수는 concurrency,
+                  채널별 대기 시간은 channel_timeout으로 제한합니다. (시간 초과 시 갱신은 백그라운드에서 계속됩니다)
+                - 일부 채널이 실패하거나 시간 초과되어도 나머지 채널의 결과는 반환합니다.
+                """
+                concurrency = concurrency or settings.PRODUCT_FETCH_CONCURRENCY
+                channel_timeout = channel_timeout or settings.PRODUCT_FETCH_CHANNEL_TIMEOUT
+                
+                stmt = select(ChannelConfig).where(ChannelConfig.is_active==True)
                 result = await self.db.execute(stmt)
-                active_channel_ids: List[int] = result.scalars().all()
+                active_channels: List[ChannelConfig] = list(result.scalars().all())
+                channel_ids = [channel_config.id for channel_config in active_channels]
                 
-                all_products = []
+                semaphore = asyncio.Semaphore(concurrency)
                 
-                for channel_id in active_channel_ids:
+                async def wait_first_snapshot(channel_id: int) -> Optional[ChannelFetchResult]:
                         try:
-                                products = await self.fetch_products_from_channel(
-                                        channel_id=channel_id,
-                                        page=page,
-                                        page_size=page_size
-                                )                       
-                                all_products.extend(products)
+                                async with semaphore:
+                                        await asyncio.wait_for(asyncio.shield(schedule_snapshot_refresh(channel_id)), timeout=channel_timeout)
+                                return None
+                        except asyncio.TimeoutError:
+                                logger.warning(f"Timed out waiting for product snapshot of channel ID {channel_id} after {channel_timeout}s")
+                                return ChannelFetchResult(channel_id=channel_id, status="timeout", error=f"Timed out after {channel_timeout}s")
                         except Exception as e:
-                                print(f"Warning: Failed to fetch products for channel ID {channel_id}. Error: {e}")
+                                logger.warning(f"Failed to fetch products for channel ID {channel_id}. Error: {e}")
+                                return ChannelFetchResult(channel_id=channel_id, status="error", error=str(e))
+                
+                failures: Dict[int, ChannelFetchResult] = {}
+                stale_ids = set()
+                pending_ids = []
+                for channel_config in active_channels:
+                        if channel_config.products_synced_at is None:
+                                pending_ids.append(channel_config.id)
+                        elif self._is_stale(channel_config):
+                                schedule_snapshot_refresh(channel_config.id)
+                                stale_ids.add(channel_config.id)
+
+                if pending_ids:
+                        outcomes = await asyncio.gather(*(wait_first_snapshot(channel_id) for channel_id in pending_ids))
+                        failures = {outcome.channel_id: outcome for outcome in outcomes if outcome is not None}
+                        # 다른 세션에서 커밋한 스냅샷을 읽기 위해 현재 읽기 트랜잭션을 종료합니다. (REPEATABLE READ)
+                        await self.db.rollback()
+                        result = await self.db.execute(
+                                select(ChannelConfig.id, ChannelConfig.products_synced_at)
+                                .where(ChannelConfig.id.in_(channel_ids))
+                        )
+                        synced_at_by_id = dict(result.all())
+                else:
+                        synced_at_by_id = {channel_config.id: channel_config.products_synced_at for channel_config in active_channels}
+                
+                response = ProductFetchAllResponse()
+                for channel_id, synced_at in synced_at_by_id.items():
+                        if channel_id in failures:
+                                response.channels.append(failures[channel_id])
                                 continue
-                return all_products
-                        
\ No newline at end of file
+                        products = await self._read_snapshot_page(channel_id, page, page_size)
+                        response.channels.append(ChannelFetchResult(
+                                channel_id=channel_id,
+                                status="ok",
+                                product_count=len(products),
+                                synced_at=synced_at,
+                                stale=channel_id in stale_ids
+                        ))
+                        response.products.extend(products)
+                return response
\ No newline at end of file
@@ -0,0 +1,128 @@
+import logging
+from typing import Any, Dict, List, Optional
+from sqlalchemy import select, update, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.models.channel import ChannelConfig
+from app.models.sync import SyncJob
+from app.schemas.sync import SyncJobCreate, ClaimedSyncJob
+from app.services.lease_service import db_now_plus
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+class SyncJobService:
+    """
+    sync_jobs 테이블 기반 수집 작업 큐입니다.
+    API는 enqueue/get_job만 사용하고, 워커(app.worker)가 claim_jobs/complete/fail로 작업을 처리합니다.
+    """
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def enqueue(self, job_in: SyncJobCreate) -> SyncJob:
+        result = await self.db.execute(select(ChannelConfig.id).where(ChannelConfig.id == job_in.channel_id, ChannelConfig.is_active == True))
+        if result.scalar_one_or_none() is None:
+            raise ValueError(f"Channel with ID {job_in.channel_id} not found or is inactive")
+
+        payload = None
+        if job_in.job_type == "order_fetch":
+            payload = {"start_date": job_in.start_date.isoformat(), "end_date": job_in.end_date.isoformat()}
+
+        job = SyncJob(
+            job_type=job_in.job_type,
+            channel_id=job_in.channel_id,
+            payload=payload,
+            status="PENDING",
+            attempts=0,
+            max_attempts=settings.SYNC_JOB_MAX_ATTEMPTS
+        )
+        self.db.add(job)
+        await self.db.commit()
+        await self.db.refresh(job)
+        return job
+
+    async def get_job(self, job_id: int) -> Optional[SyncJob]:
+        result = await self.db.execute(select(SyncJob).where(SyncJob.id == job_id))
+        return result.scalar_one_or_none()
+
+    async def claim_jobs(self, worker_id: str, limit: int, visibility_timeout: int) -> List[ClaimedSyncJob]:
+        """
+        실행 가능한 작업을 최대 limit개 가져와 RUNNING으로 표시합니다.
+        - 실행 가능: PENDING이면서 run_after가 지난 작업, 또는 RUNNING이지만 visibility timeout이 지난 작업(워커 비정상 종료)
+        - FOR UPDATE SKIP LOCKED로 다른 워커가 잠근 행은 건너뛰므로, 여러 워커가 동시에 호출해도 같은 작업을 가져가지 않습니다.
+        - 가져간 작업의 run_after는 visibility timeout 만료 시각으로 바뀝니다.
+        """
+        stmt = (
+            select(SyncJob.id, SyncJob.job_type, SyncJob.channel_id, SyncJob.payload, SyncJob.attempts, SyncJob.max_attempts)
+            .where(SyncJob.status.in_(["PENDING", "RUNNING"]), SyncJob.run_after <= func.now())
+            .order_by(SyncJob.run_after, SyncJob.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        rows = (await self.db.execute(stmt)).all()
+
+        claimed: List[ClaimedSyncJob] = []
+        exhausted_ids = []
+        for row in rows:
+            if row.attempts >= row.max_attempts:
+                # 마지막 시도 중에 visibility timeout이 지난 작업
+                exhausted_ids.append(row.id)
+                continue
+            claimed.append(ClaimedSyncJob(
+                id=row.id,
+                job_type=row.job_type,
+                channel_id=row.channel_id,
+                payload=row.payload,
+                attempts=row.attempts + 1,
+                max_attempts=row.max_attempts
+            ))
+
+        if exhausted_ids:
+            await self.db.execute(
+                update(SyncJob)
+                .where(SyncJob.id.in_(exhausted_ids))
+                .values(status="FAILED", error="Visibility timeout exceeded on the last attempt", locked_by=None, finished_at=func.now())
+            )
+        if claimed:
+            await self.db.execute(
+                update(SyncJob)
+                .where(SyncJob.id.in_([job.id for job in claimed]))
+                .values(status="RUNNING", attempts=SyncJob.attempts + 1, locked_by=worker_id, run_after=db_now_plus(visibility_timeout))
+            )
+        await self.db.commit()
+        return claimed
+
+    async def complete(self, job_id: int, worker_id: str, result: Dict[str, Any]) -> bool:
+        """
+        작업을 완료(DONE) 처리합니다.
+        visibility timeout이 지나 다른 워커가 이미 가져간 작업이면 변경하지 않고 False를 반환합니다.
+        """
+        stmt = (
+            update(SyncJob)
+            .where(SyncJob.id == job_id, SyncJob.status == "RUNNING", SyncJob.locked_by == worker_id)
+            .values(status="DONE", result=result, error=None, locked_by=None, finished_at=func.now())
+        )
+        updated = (await self.db.execute(stmt)).rowcount
+        await self.db.commit()
+        if not updated:
+            logger.warning(f"Sync job {job_id}: Lost ownership before completion (worker={worker_id})")
+        return bool(updated)
+
+    async def fail(self, job: ClaimedSyncJob, worker_id: str, error: str) -> None:
+        """
+        실패한 작업을 재시도 대기(PENDING, 지수 백오프) 또는 최종 실패(FAILED)로 표시합니다.
+        """
+        if job.attempts >= job.max_attempts:
+            values = dict(status="FAILED", error=error, locked_by=None, finished_at=func.now())
+        else:
+            delay = settings.SYNC_JOB_RETRY_DELAY * (2 ** (job.attempts - 1))
+            values = dict(status="PENDING", error=error, locked_by=None, run_after=db_now_plus(delay))
+
+        stmt = (
+            update(SyncJob)
+            .where(SyncJob.id == job.id, SyncJob.status == "RUNNING", SyncJob.locked_by == worker_id)
+            .values(**values)
+        )
+        await self.db.execute(stmt)
+        await self.db.commit()
@@ -0,0 +1,217 @@
+import asyncio
+import inspect
+import logging
+import os
+import random
+import socket
+import uuid
+from typing import Any, Awaitable, List, Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.models.channel import ChannelConfig
+from app.services.lease_service import LeaseService
+from app.services.order_service import OrderService, ORDER_COLLECTOR_MAPPING
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+def _syncable_channel_types() -> List[str]:
+    # 주문 수집이 구현되지 않은(추상) 컬렉터의 채널 타입은 제외합니다.
+    return [channel_type for channel_type, CollectorClass in ORDER_COLLECTOR_MAPPING.items() if not inspect.isabstract(CollectorClass)]
+
+
+class OrderSyncScheduler:
+    """
+    활성 채널의 주문을 주기적으로 증분 동기화(OrderService.sync_incremental)하는 앱 내장 스케줄러입니다.
+    - 워커마다 하나씩 실행되며, 채널별 DB lease를 획득한 워커만 해당 채널을 동기화합니다.
+      웹 워커/컨테이너 수를 늘려도 채널 API 호출 수는 늘어나지 않습니다.
+    - 동기화가 끝나면 다음 주기까지 lease를 유지하여 다른 워커가 곧바로 다시 동기화하지 않도록 합니다.
+    - 워커가 비정상 종료되면 lease_seconds 후 다른 워커가 이어받습니다.
+    - 동기화가 lease_seconds보다 오래 걸려도 다른 워커가 끼어들지 않도록, 동기화 중에는 lease를 주기적으로 연장합니다.
+      연장에 실패하면(다른 워커가 가져갔거나 DB 오류) 동기화를 중단합니다.
+    - 한 채널의 lease/DB 오류는 그 채널만 실패로 기록하고 같은 주기의 다른 채널 동기화는 계속합니다.
+    """
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession] = AsyncSessionLocal,
+        interval: Optional[float]=None,
+        jitter: Optional[float]=None,
+        lease_seconds: Optional[int]=None,
+        concurrency: Optional[int]=None
+    ):
+        self.session_factory = session_factory
+        self.interval = interval or settings.ORDER_SYNC_INTERVAL_SECONDS
+        self.jitter = settings.ORDER_SYNC_JITTER_SECONDS if jitter is None else jitter
+        self.lease_seconds = lease_seconds or settings.ORDER_SYNC_LEASE_SECONDS
+        self.concurrency = concurrency or settings.ORDER_SYNC_CONCURRENCY
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run_forever())
+            logger.info(f"Order sync scheduler started (owner={self.owner}, interval={self.interval}s)")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run_forever(self) -> None:
+        # 여러 워커가 동시에 시작해도 같은 순간에 몰리지 않도록 첫 실행도 무작위로 늦춥니다.
+        await asyncio.sleep(random.uniform(0, self.jitter))
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error(f"Order sync scheduler run failed. Error: {e}")
+            await asyncio.sleep(self.interval + random.uniform(0, self.jitter))
+
+    async def run_once(self) -> int:
+        """
+        모든 활성 채널에 대해 lease를 시도하고, 획득한 채널을 동기화합니다. 동기화한 채널 수를 반환합니다.
+        """
+        async with self.session_factory() as session:
+            result = await session.execute(
+                select(ChannelConfig.id)
+                .where(ChannelConfig.is_active == True, ChannelConfig.channel_type.in_(_syncable_channel_types()))
+                .order_by(ChannelConfig.id)
+            )
+            channel_ids = list(result.scalars().all())
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        outcomes = await asyncio.gather(
+            *(self._sync_channel(channel_id, semaphore) for channel_id in channel_ids),
+            return_exceptions=True
+        )
+        synced = 0
+        for channel_id, outcome in zip(channel_ids, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.warning(f"Channel {channel_id}: Scheduled order sync failed. Error: {outcome}")
+            elif outcome:
+                synced += 1
+        return synced
+
+    async def _sync_channel(self, channel_id: int, semaphore: asyncio.Semaphore) -> bool:
+        lease_name = f"order_sync:{channel_id}"
+        # 주기에 jitter가 더해지므로, 다음 주기보다 조금 일찍 lease가 풀리도록 합니다.
+        cooldown = max(1.0, self.interval - self.jitter)
+
+        async with semaphore:
+            async with self.session_factory() as session:
+                leases = LeaseService(session)
+                try:
+                    if not await leases.try_acquire(lease_name, self.owner, self.lease_seconds):
+                        return False
+                except Exception as e:
+                    logger.warning(f"Channel {channel_id}: Failed to acquire sync lease. Error: {e}")
+                    return False
+
+                try:
+                    await self._run_holding_lease(lease_name, OrderService(db=session).sync_incremental(channel_id))
+                except Exception as e:
+                    await session.rollback()
+                    logger.warning(f"Channel {channel_id}: Scheduled order sync failed. Error: {e}")
+                finally:
+                    await leases.extend(lease_name, self.owner, cooldown)
+                return True
+
+    async def _run_holding_lease(self, lease_name: str, coro: Awaitable[Any]) -> Any:
+        """
+        coro를 실행하는 동안 별도 세션으로 lease를 lease_seconds의 1/3 주기마다 연장합니다.
+        연장에 실패하면 coro를 취소하고 RuntimeError를 발생시킵니다.
+        """
+        task = asyncio.ensure_future(coro)
+        lost = False
+
+        async def heartbeat() -> None:
+            nonlocal lost
+            while True:
+                await asyncio.sleep(max(1.0, self.lease_seconds / 3))
+                try:
+                    async with self.session_factory() as session:
+                        extended = await LeaseService(session).extend(lease_name, self.owner, self.lease_seconds)
+                except Exception as e:
+                    logger.warning(f"Failed to extend lease {lease_name}. Error: {e}")
+                    extended = False
+                if not extended:
+                    lost = True
+                    task.cancel()
+                    return
+
+        heartbeat_task = asyncio.create_task(heartbeat())
+        try:
+            return await task
+        except asyncio.CancelledError:
+            if not lost:
+                raise
+            raise RuntimeError(f"Lost lease {lease_name}; aborted") from None
+        finally:
+            heartbeat_task.cancel()
+            await asyncio.gather(heartbeat_task, return_exceptions=True)
+
+
+class OrderStatusOutboxFlusher:
+    """
+    주문 상품 상태 변경 outbox를 주기적으로 채널에 전송하는 루프입니다. (워커 프로세스에서 실행)
+    outbox는 기록 순서대로 전송되어야 하므로, DB lease를 가진 워커 하나만 flush합니다.
+    """
+    LEASE_NAME = "order_status_outbox_flush"
+    LEASE_MIN_SECONDS = 15
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession] = AsyncSessionLocal,
+        interval: Optional[float]=None
+    ):
+        self.session_factory = session_factory
+        self.interval = interval or settings.ORDER_OUTBOX_FLUSH_INTERVAL
+        # lease는 매 주기 연장됩니다. 정상 종료 시에는 stop()에서 반납하고, 비정상 종료 시에는 몇 주기 후 만료되어 다른 워커가 이어받습니다.
+        # flush가 lease보다 오래 걸려 다른 워커가 이어받더라도, 이벤트는 IN_FLIGHT로 표시되어 있으므로 중복 전송되지 않습니다.
+        self.lease_seconds = max(self.LEASE_MIN_SECONDS, int(self.interval * 3))
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run_forever())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        try:
+            async with self.session_factory() as session:
+                await LeaseService(session).release(self.LEASE_NAME, self.owner)
+        except Exception as e:
+            logger.warning(f"Failed to release outbox flush lease. Error: {e}")
+
+    async def _run_forever(self) -> None:
+        while True:
+            processed = 0
+            try:
+                processed = await self.flush_once()
+            except Exception as e:
+                logger.error(f"Order status outbox flush failed. Error: {e}")
+            # 한 배치를 가득 채웠으면 남은 이벤트가 있을 수 있으므로 바로 이어서 처리합니다.
+            if processed < settings.ORDER_OUTBOX_BATCH_SIZE:
+                await asyncio.sleep(self.interval)
+
+    async def flush_once(self) -> int:
+        async with self.session_factory() as session:
+            if not await LeaseService(session).try_acquire(self.LEASE_NAME, self.owner, self.lease_seconds):
+                return 0
+            return await OrderService(db=session).flush_status_outbox()
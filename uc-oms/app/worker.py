@@ -0,0 +1,173 @@
+"""
+수집 작업(sync_jobs) 워커 프로세스입니다.
+외부 채널 API 호출과 주문/상품 저장을 관리자 API 프로세스와 분리하여 실행합니다.
+주문 상품 상태 변경 outbox도 이 프로세스에서 채널로 전송합니다.
+
+실행 예시 (uc-oms 디렉토리에서):
+    python -m app.worker --concurrency 4
+    python -m app.worker --processes 4           # 코어 수만큼 프로세스 실행
+    python -m app.worker --with-scheduler        # 주기적 주문 동기화 스케줄러도 이 프로세스에서 실행
+
+여러 프로세스/컨테이너를 동시에 실행해도 작업은 SKIP LOCKED로 나뉘어 한 번씩만 실행됩니다.
+"""
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import os
+import signal
+import socket
+import uuid
+from datetime import datetime
+from typing import Any, Dict, Optional, Set
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, dispose_engines
+from app.core.http_client import close_http_clients
+from app.core.security import shutdown_crypto_executor
+from app.schemas.sync import ClaimedSyncJob
+from app.services.order_service import OrderService
+from app.services.product_service import ProductCollectorService
+from app.services.sync_job_service import SyncJobService
+from app.services.sync_scheduler import OrderSyncScheduler, OrderStatusOutboxFlusher
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+class SyncWorker:
+    """
+    sync_jobs 큐에서 작업을 가져와 최대 concurrency개까지 동시에 실행합니다.
+    작업 하나는 visibility timeout 안에 끝나야 하며, 넘기면 취소되고 실패(재시도 대상)로 처리됩니다.
+    """
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession] = AsyncSessionLocal,
+        concurrency: Optional[int]=None,
+        poll_interval: Optional[float]=None,
+        visibility_timeout: Optional[int]=None
+    ):
+        self.session_factory = session_factory
+        self.concurrency = concurrency or settings.SYNC_WORKER_CONCURRENCY
+        self.poll_interval = poll_interval or settings.SYNC_WORKER_POLL_INTERVAL
+        self.visibility_timeout = visibility_timeout or settings.SYNC_JOB_VISIBILITY_TIMEOUT
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+    async def run(self, stop_event: asyncio.Event) -> None:
+        """
+        stop_event가 설정될 때까지 작업을 가져와 실행합니다. 종료 시 실행 중인 작업이 끝날 때까지 기다립니다.
+        """
+        running: Set[asyncio.Task] = set()
+        logger.info(f"Sync worker started (worker={self.worker_id}, concurrency={self.concurrency})")
+
+        while not stop_event.is_set():
+            free_slots = self.concurrency - len(running)
+            claimed = []
+            if free_slots > 0:
+                try:
+                    async with self.session_factory() as session:
+                        claimed = await SyncJobService(session).claim_jobs(self.worker_id, free_slots, self.visibility_timeout)
+                except Exception as e:
+                    logger.error(f"Failed to claim sync jobs. Error: {e}")
+
+            for job in claimed:
+                task = asyncio.create_task(self._execute(job))
+                running.add(task)
+                task.add_done_callback(running.discard)
+
+            # 슬롯이 모두 찼거나 큐가 비었으면 잠시 대기합니다.
+            if len(claimed) < free_slots or free_slots <= 0:
+                try:
+                    await asyncio.wait_for(stop_event.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+        if running:
+            logger.info(f"Waiting for {len(running)} running jobs to finish...")
+            await asyncio.gather(*running, return_exceptions=True)
+
+    async def _execute(self, job: ClaimedSyncJob) -> None:
+        async with self.session_factory() as session:
+            service = SyncJobService(session)
+            try:
+                result = await asyncio.wait_for(self._run_job(session, job), timeout=self.visibility_timeout)
+            except Exception as e:
+                await session.rollback()
+                error = f"Timed out after {self.visibility_timeout}s" if isinstance(e, asyncio.TimeoutError) else str(e)
+                logger.warning(f"Sync job {job.id} ({job.job_type}, channel {job.channel_id}) failed on attempt {job.attempts}. Error: {error}")
+                await service.fail(job, self.worker_id, error)
+                return
+
+            await service.complete(job.id, self.worker_id, result)
+            logger.info(f"Sync job {job.id} ({job.job_type}, channel {job.channel_id}) done: {result}")
+
+    async def _run_job(self, session: AsyncSession, job: ClaimedSyncJob) -> Dict[str, Any]:
+        if job.job_type == "order_fetch":
+            start_date = datetime.fromisoformat(job.payload["start_date"])
+            end_date = datetime.fromisoformat(job.payload["end_date"])
+            ingest_result = await OrderService(db=session).fetch_and_save_orders(job.channel_id, start_date, end_date)
+            return {"order_count": ingest_result.total, **ingest_result.model_dump()}
+        if job.job_type == "order_sync":
+            ingest_result = await OrderService(db=session).sync_incremental(job.channel_id)
+            return {"order_count": ingest_result.total, **ingest_result.model_dump()}
+        if job.job_type == "product_sync":
+            count = await ProductCollectorService(db=session).refresh_snapshot(job.channel_id)
+            return {"product_count": count}
+        raise ValueError(f"Unknown sync job type: {job.job_type}")
+
+
+async def serve(args: argparse.Namespace) -> None:
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop_event.set)
+
+    scheduler = OrderSyncScheduler() if args.with_scheduler else None
+    if scheduler:
+        scheduler.start()
+    # 주문 상품 상태 변경을 채널로 전송 (여러 워커 중 lease를 가진 하나만 실행)
+    outbox_flusher = OrderStatusOutboxFlusher()
+    outbox_flusher.start()
+    try:
+        await SyncWorker(concurrency=args.concurrency, poll_interval=args.poll_interval).run(stop_event)
+    finally:
+        await outbox_flusher.stop()
+        if scheduler:
+            await scheduler.stop()
+        await close_http_clients()
+        shutdown_crypto_executor()
+        await dispose_engines()
+
+
+def run_process(args: argparse.Namespace) -> None:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(process)d] %(name)s %(levelname)s %(message)s")
+    asyncio.run(serve(args))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sync job worker")
+    parser.add_argument("--concurrency", type=int, default=None, help="프로세스당 동시 실행 작업 수 (기본값: SYNC_WORKER_CONCURRENCY)")
+    parser.add_argument("--processes", type=int, default=1, help="실행할 워커 프로세스 수")
+    parser.add_argument("--poll-interval", type=float, default=None, help="큐 조회 간격 (초)")
+    parser.add_argument("--with-scheduler", action="store_true", help="주기적 주문 동기화 스케줄러도 실행 (channel별 lease로 중복 실행 방지)")
+    args = parser.parse_args()
+
+    if args.processes <= 1:
+        run_process(args)
+    else:
+        # 부모 프로세스의 이벤트 루프/커넥션 풀을 물려받지 않도록 spawn으로 새 인터프리터를 시작합니다.
+        context = multiprocessing.get_context("spawn")
+        processes = [context.Process(target=run_process, args=(args,)) for _ in range(args.processes)]
+        for process in processes:
+            process.start()
+        # SIGTERM(docker stop 등)은 부모에게만 오므로 자식 프로세스에 전달하여 각자 정상 종료하도록 합니다.
+        signal.signal(signal.SIGTERM, lambda signum, frame: [process.terminate() for process in processes if process.is_alive()])
+        try:
+            for process in processes:
+                process.join()
+        except KeyboardInterrupt:
+            # Ctrl+C는 자식 프로세스에도 전달되므로 종료될 때까지 기다립니다.
+            for process in processes:
+                process.join()
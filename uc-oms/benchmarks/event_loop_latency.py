@@ -0,0 +1,78 @@
+"""
+bcrypt 해싱이 실행되는 동안 동시에 들어오는 GET / 요청의 지연 시간(p50/p99)을 측정하는 벤치마크입니다.
+
+- sync : 코루틴 안에서 get_password_hash를 직접 호출 (이벤트 루프 블로킹)
+- async: get_password_hash_async로 암호화 전용 스레드 풀에서 실행
+
+DB 연결은 필요 없지만 설정 로드를 위해 .env(또는 환경 변수)가 있어야 합니다.
+
+실행 예시 (uc-oms 디렉토리에서):
+    python -m benchmarks.event_loop_latency --requests 500 --hashes 40
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List
+
+import httpx
+
+from app.core import security
+from app.main import app
+
+
+async def hash_worker(mode: str, count: int) -> None:
+    for _ in range(count):
+        if mode == "sync":
+            security.get_password_hash("benchmark-password")
+            await asyncio.sleep(0) # 다른 코루틴에 실행 기회를 넘김
+        else:
+            await security.get_password_hash_async("benchmark-password")
+
+
+async def request_worker(client: httpx.AsyncClient, count: int, latencies: List[float]) -> None:
+    for _ in range(count):
+        started = time.perf_counter()
+        response = await client.get("/")
+        response.raise_for_status()
+        latencies.append((time.perf_counter() - started) * 1000)
+
+
+def percentile(values: List[float], ratio: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * ratio))]
+
+
+async def run(mode: str, requests: int, concurrency: int, hashes: int, hash_concurrency: int) -> None:
+    latencies: List[float] = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        started = time.perf_counter()
+        await asyncio.gather(
+            *(request_worker(client, requests // concurrency, latencies) for _ in range(concurrency)),
+            *(hash_worker(mode, hashes // hash_concurrency) for _ in range(hash_concurrency)),
+        )
+        elapsed = time.perf_counter() - started
+
+    print(
+        f"{mode:<6} requests={len(latencies):<6} "
+        f"p50={statistics.median(latencies):8.2f}ms "
+        f"p99={percentile(latencies, 0.99):8.2f}ms "
+        f"max={max(latencies):8.2f}ms "
+        f"total={elapsed:6.2f}s"
+    )
+
+
+async def main(args: argparse.Namespace) -> None:
+    for mode in ("sync", "async"):
+        await run(mode, args.requests, args.concurrency, args.hashes, args.hash_concurrency)
+    security.shutdown_crypto_executor()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Event loop latency under bcrypt load")
+    parser.add_argument("--requests", type=int, default=500, help="GET / 총 요청 수")
+    parser.add_argument("--concurrency", type=int, default=20, help="동시 요청 코루틴 수")
+    parser.add_argument("--hashes", type=int, default=40, help="bcrypt 해시 총 횟수")
+    parser.add_argument("--hash-concurrency", type=int, default=4, help="동시 해싱 코루틴 수")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,202 @@
+"""
+주문 수집(UPSERT)/목록 조회 쿼리의 인덱스 적용 전후 실행 계획과 수행 시간을 비교하는 벤치마크입니다.
+
+운영 테이블을 건드리지 않도록 같은 DB에 bench_orders / bench_order_items 테이블을 따로 만들어
+데이터를 채운 뒤 측정하고, 종료 시 삭제합니다.
+
+실행 예시 (uc-oms 디렉토리에서):
+    python -m benchmarks.order_index_benchmark --orders 200000 --items-per-order 2
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+
+from app.core.config import settings
+
+ORDERS_TABLE = "bench_orders"
+ITEMS_TABLE = "bench_order_items"
+STATUSES = ["PAID", "PREPARING", "SHIPPED", "DELIVERED", "CANCELLED"]
+
+# 현재(마이그레이션 전) 스키마와 동일한 단일 컬럼 인덱스만 가진 테이블
+CREATE_TABLES = [
+    f"""
+    CREATE TABLE {ORDERS_TABLE} (
+        id INT AUTO_INCREMENT PRIMARY KEY,
+        channel_id INT NOT NULL,
+        external_order_id VARCHAR(100) NOT NULL,
+        order_date DATETIME NOT NULL,
+        umos_status VARCHAR(50) NOT NULL,
+        total_amount NUMERIC(10,2) NOT NULL,
+        UNIQUE KEY ix_external_order_id (external_order_id),
+        KEY ix_channel_id (channel_id),
+        KEY ix_umos_status (umos_status)
+    )
+    """,
+    f"""
+    CREATE TABLE {ITEMS_TABLE} (
+        id INT AUTO_INCREMENT PRIMARY KEY,
+        order_id INT NOT NULL,
+        external_item_id VARCHAR(100) NOT NULL,
+        product_name VARCHAR(255) NOT NULL,
+        umos_status VARCHAR(50) NOT NULL,
+        KEY ix_order_id (order_id),
+        KEY ix_external_item_id (external_item_id)
+    )
+    """,
+]
+
+# 마이그레이션 8d2e4b6a1c37에서 추가하는 키/인덱스
+ADD_INDEXES = [
+    f"ALTER TABLE {ITEMS_TABLE} ADD UNIQUE KEY uq_order_id_external_item_id (order_id, external_item_id)",
+    f"ALTER TABLE {ORDERS_TABLE} ADD KEY ix_channel_id_order_date (channel_id, order_date)",
+    f"ALTER TABLE {ORDERS_TABLE} ADD KEY ix_umos_status_order_date (umos_status, order_date)",
+]
+
+# 측정 대상 쿼리 (OrderService의 수집/목록 조회 패턴)
+QUERIES: Dict[str, str] = {
+    "item_lookup": (
+        f"SELECT id FROM {ITEMS_TABLE} "
+        "WHERE order_id = :order_id AND external_item_id = :external_item_id"
+    ),
+    "list_by_channel": (
+        f"SELECT id, order_date FROM {ORDERS_TABLE} "
+        "WHERE channel_id = :channel_id AND order_date >= :date_from "
+        "ORDER BY order_date DESC, id DESC LIMIT 50"
+    ),
+    "list_by_status": (
+        f"SELECT id, order_date FROM {ORDERS_TABLE} "
+        "WHERE umos_status = :status AND order_date >= :date_from "
+        "ORDER BY order_date DESC, id DESC LIMIT 50"
+    ),
+}
+
+
+async def seed(conn: AsyncConnection, orders: int, items_per_order: int, channels: int, batch_size: int = 5000) -> None:
+    base_date = datetime.now() - timedelta(days=365)
+    for start in range(0, orders, batch_size):
+        order_rows = []
+        for order_no in range(start, min(start + batch_size, orders)):
+            order_rows.append({
+                "id": order_no + 1,
+                "channel_id": random.randint(1, channels),
+                "external_order_id": f"BENCH-{order_no}",
+                "order_date": base_date + timedelta(seconds=random.randint(0, 365 * 24 * 3600)),
+                "umos_status": random.choice(STATUSES),
+                "total_amount": random.randint(1000, 200000),
+            })
+        await conn.execute(
+            text(
+                f"INSERT INTO {ORDERS_TABLE} (id, channel_id, external_order_id, order_date, umos_status, total_amount) "
+                "VALUES (:id, :channel_id, :external_order_id, :order_date, :umos_status, :total_amount)"
+            ),
+            order_rows,
+        )
+        item_rows = [
+            {
+                "order_id": row["id"],
+                "external_item_id": f"{row['external_order_id']}-{item_no}",
+                "product_name": f"bench product {item_no}",
+                "umos_status": row["umos_status"],
+            }
+            for row in order_rows
+            for item_no in range(items_per_order)
+        ]
+        await conn.execute(
+            text(
+                f"INSERT INTO {ITEMS_TABLE} (order_id, external_item_id, product_name, umos_status) "
+                "VALUES (:order_id, :external_item_id, :product_name, :umos_status)"
+            ),
+            item_rows,
+        )
+        await conn.commit()
+    await conn.execute(text(f"ANALYZE TABLE {ORDERS_TABLE}, {ITEMS_TABLE}"))
+
+
+def sample_params(orders: int, channels: int) -> Dict[str, Dict[str, Any]]:
+    order_no = random.randint(0, orders - 1)
+    return {
+        "item_lookup": {"order_id": order_no + 1, "external_item_id": f"BENCH-{order_no}-0"},
+        "list_by_channel": {"channel_id": random.randint(1, channels), "date_from": datetime.now() - timedelta(days=30)},
+        "list_by_status": {"status": random.choice(STATUSES), "date_from": datetime.now() - timedelta(days=30)},
+    }
+
+
+async def measure(conn: AsyncConnection, orders: int, channels: int, repeat: int) -> Dict[str, Dict[str, Any]]:
+    report: Dict[str, Dict[str, Any]] = {}
+    for name, sql in QUERIES.items():
+        plan = (await conn.execute(text(f"EXPLAIN {sql}"), sample_params(orders, channels)[name])).mappings().first()
+
+        timings: List[float] = []
+        for _ in range(repeat):
+            params = sample_params(orders, channels)[name]
+            started = time.perf_counter()
+            (await conn.execute(text(sql), params)).all()
+            timings.append((time.perf_counter() - started) * 1000)
+
+        report[name] = {
+            "key": plan.get("key"),
+            "rows": plan.get("rows"),
+            "extra": plan.get("Extra"),
+            "median_ms": statistics.median(timings),
+            "p95_ms": sorted(timings)[int(len(timings) * 0.95) - 1],
+        }
+    return report
+
+
+def print_report(title: str, report: Dict[str, Dict[str, Any]]) -> None:
+    print(f"\n[{title}]")
+    print(f"{'query':<18}{'key':<34}{'rows':>10}{'median(ms)':>12}{'p95(ms)':>10}  extra")
+    for name, row in report.items():
+        print(
+            f"{name:<18}{str(row['key']):<34}{str(row['rows']):>10}"
+            f"{row['median_ms']:>12.3f}{row['p95_ms']:>10.3f}  {row['extra']}"
+        )
+
+
+async def main(args: argparse.Namespace) -> None:
+    engine = create_async_engine(args.database_url or settings.DATABASE_URL)
+    try:
+        async with engine.connect() as conn:
+            for table in (ITEMS_TABLE, ORDERS_TABLE):
+                await conn.execute(text(f"DROP TABLE IF EXISTS {table}"))
+            for ddl in CREATE_TABLES:
+                await conn.execute(text(ddl))
+            await conn.commit()
+
+            print(f"Seeding {args.orders} orders x {args.items_per_order} items across {args.channels} channels...")
+            started = time.perf_counter()
+            await seed(conn, args.orders, args.items_per_order, args.channels)
+            print(f"Seeded in {time.perf_counter() - started:.1f}s")
+
+            print_report("before", await measure(conn, args.orders, args.channels, args.repeat))
+
+            for ddl in ADD_INDEXES:
+                await conn.execute(text(ddl))
+            await conn.execute(text(f"ANALYZE TABLE {ORDERS_TABLE}, {ITEMS_TABLE}"))
+            await conn.commit()
+
+            print_report("after", await measure(conn, args.orders, args.channels, args.repeat))
+    finally:
+        if not args.keep_tables:
+            async with engine.begin() as conn:
+                for table in (ITEMS_TABLE, ORDERS_TABLE):
+                    await conn.execute(text(f"DROP TABLE IF EXISTS {table}"))
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Order index before/after benchmark")
+    parser.add_argument("--database-url", default=None, help="기본값: settings.DATABASE_URL")
+    parser.add_argument("--orders", type=int, default=100_000)
+    parser.add_argument("--items-per-order", type=int, default=2)
+    parser.add_argument("--channels", type=int, default=30)
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--keep-tables", action="store_true", help="측정 후 벤치마크 테이블을 삭제하지 않음")
+    asyncio.run(main(parser.parse_args()))
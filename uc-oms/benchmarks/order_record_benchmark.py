@@ -0,0 +1,153 @@
+"""
+주문 수집 경로의 레코드 표현별 CPU 시간과 메모리 사용량을 비교하는 벤치마크입니다.
+
+- dict  : 컬렉터가 dict 생성 → OrderBase(**data) 검증 → model_dump로 DB 행/content_hash 생성 (이전 경로)
+- record: 컬렉터가 OrderRecord 생성 → validate() → order_row/item_row로 DB 행/content_hash 생성 (현재 경로)
+
+각 경로를 따로 실행하여 주문 N건을 만드는 데 걸린 시간과, 검증된 주문 N건을 메모리에 들고 있을 때의
+tracemalloc 기준 메모리(유지/최대)를 측정합니다. DB에 연결하지는 않습니다.
+다만 app.services.order_service를 import하면 app.core.config.settings가 만들어지므로, 앱과 같은 필수 환경 변수
+(MYSQL_USER, MYSQL_PASSWORD, MYSQL_HOST, MYSQL_DATABASE, SECRET_KEY)가 .env 또는 환경 변수로 있어야 합니다.
+MYSQL_* 값은 접속하지 않으므로 아무 값이나 되지만, SECRET_KEY는 Fernet 키 형식이어야 합니다.
+
+실행 예시 (uc-oms 디렉토리에서, .env가 없을 때):
+    MYSQL_USER=x MYSQL_PASSWORD=x MYSQL_HOST=x MYSQL_DATABASE=x \
+    SECRET_KEY=$(python -c "from cryptography.fernet import Fernet; print(Fernet.generate_key().decode())") \
+    python -m benchmarks.order_record_benchmark --orders 100000 --items-per-order 2
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Tuple
+
+from app.collectors.records import OrderRecord, OrderItemRecord
+from app.schemas.order import OrderBase
+from app.services.order_service import OrderService, _content_hash
+
+BASE_DATE = datetime(2026, 1, 1)
+
+
+def make_dicts(orders: int, items_per_order: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "channel_id": 1,
+            "channel_type": "mock",
+            "external_order_id": f"O_BENCH_{n}",
+            "order_date": BASE_DATE + timedelta(seconds=n),
+            "total_amount": 10000.0 * items_per_order,
+            "recipient_name": "홍길동",
+            "recipient_phone": "010-1234-5678",
+            "shipping_address": "서울시 강남구 테스트로 123",
+            "umos_status": "PAID",
+            "items": [
+                {
+                    "external_item_id": f"I_BENCH_{n}_{i}",
+                    "product_name": f"벤치마크 상품 {i}",
+                    "quantity": 1,
+                    "item_price": 10000.0,
+                    "courier_code": None,
+                    "tracking_number": None,
+                    "umos_status": "PAID"
+                }
+                for i in range(items_per_order)
+            ]
+        }
+        for n in range(orders)
+    ]
+
+
+def make_records(orders: int, items_per_order: int) -> List[OrderRecord]:
+    return [
+        OrderRecord(
+            channel_id=1,
+            channel_type="mock",
+            external_order_id=f"O_BENCH_{n}",
+            order_date=BASE_DATE + timedelta(seconds=n),
+            total_amount=10000.0 * items_per_order,
+            recipient_name="홍길동",
+            recipient_phone="010-1234-5678",
+            shipping_address="서울시 강남구 테스트로 123",
+            umos_status="PAID",
+            items=[
+                OrderItemRecord(
+                    external_item_id=f"I_BENCH_{n}_{i}",
+                    product_name=f"벤치마크 상품 {i}",
+                    quantity=1,
+                    item_price=10000.0,
+                    umos_status="PAID"
+                )
+                for i in range(items_per_order)
+            ]
+        )
+        for n in range(orders)
+    ]
+
+
+def dict_path(orders: int, items_per_order: int) -> Tuple[list, int]:
+    validated = [OrderBase(**data) for data in make_dicts(orders, items_per_order)]
+    rows = 0
+    for order_data in validated:
+        order_params = order_data.model_dump(exclude={"items"})
+        order_params["content_hash"] = _content_hash(order_data.model_dump(mode="json", exclude={"items"}))
+        for item_data in order_data.items:
+            item_params = item_data.model_dump(exclude={"courier_code"})
+            item_params["courier_name"] = item_data.courier_code
+            item_params["order_id"] = 0
+            item_params["content_hash"] = _content_hash(item_data.model_dump(mode="json"))
+            rows += 1
+        rows += 1
+    return validated, rows
+
+
+def record_path(orders: int, items_per_order: int) -> Tuple[list, int]:
+    validated = [OrderService._to_record(record) for record in make_records(orders, items_per_order)]
+    rows = 0
+    for order_data in validated:
+        OrderService._order_row(order_data)
+        for item_data in order_data.items:
+            OrderService._order_item_row(item_data, 0)
+            rows += 1
+        rows += 1
+    return validated, rows
+
+
+def measure_cpu(path: Callable[[int, int], Tuple[list, int]], orders: int, items_per_order: int, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        started = time.process_time()
+        path(orders, items_per_order)
+        timings.append(time.process_time() - started)
+    return min(timings)
+
+
+def measure_memory(path: Callable[[int, int], Tuple[list, int]], orders: int, items_per_order: int) -> Tuple[int, int]:
+    gc.collect()
+    tracemalloc.start()
+    validated, _ = path(orders, items_per_order)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del validated
+    return retained, peak
+
+
+def main(args: argparse.Namespace) -> None:
+    print(f"orders={args.orders}, items_per_order={args.items_per_order}, repeat={args.repeat}")
+    print(f"{'path':<8} {'cpu (s)':>10} {'us/order':>10} {'retained (MB)':>14} {'peak (MB)':>10}")
+    for name, path in (("dict", dict_path), ("record", record_path)):
+        cpu = measure_cpu(path, args.orders, args.items_per_order, args.repeat)
+        retained, peak = measure_memory(path, args.orders, args.items_per_order)
+        print(
+            f"{name:<8} {cpu:>10.3f} {cpu / args.orders * 1e6:>10.2f} "
+            f"{retained / 1024 / 1024:>14.1f} {peak / 1024 / 1024:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Order record representation benchmark")
+    parser.add_argument("--orders", type=int, default=100000, help="주문 수")
+    parser.add_argument("--items-per-order", type=int, default=2, help="주문당 상품 수")
+    parser.add_argument("--repeat", type=int, default=3, help="CPU 시간 측정 반복 횟수 (최솟값 사용)")
+    main(parser.parse_args())
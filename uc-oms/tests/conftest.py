@@ -0,0 +1,15 @@
+"""
+테스트 공통 설정
+
+app.core.config.settings는 import 시점에 필수 환경 변수(MySQL 접속 정보, SECRET_KEY)를 읽으므로,
+DB 없이 실행하는 테스트를 위해 설정되지 않은 값만 더미 값으로 채웁니다. (실제 연결은 하지 않습니다)
+"""
+import os
+
+from cryptography.fernet import Fernet
+
+os.environ.setdefault("MYSQL_USER", "test")
+os.environ.setdefault("MYSQL_PASSWORD", "test")
+os.environ.setdefault("MYSQL_HOST", "localhost")
+os.environ.setdefault("MYSQL_DATABASE", "uc_oms_test")
+os.environ.setdefault("SECRET_KEY", Fernet.generate_key().decode())
@@ -0,0 +1,160 @@
+"""
+대량 발송 처리 테스트 (IOrderCollector.register_tracking_and_ship_bulk, OrderService.ship_items_bulk)
+
+일괄 등록 API가 없는 채널에서 상품별 송장 등록이 SHIPMENT_CONCURRENCY개까지만 동시에 실행되는지,
+채널 결과(실패/예외)가 상품별 오류로 바뀌는지, 발송할 수 없는 상태의 상품은 채널을 호출하지 않는지 확인합니다.
+
+실행 예시 (uc-oms 디렉토리에서):
+    python -m pytest -q tests
+"""
+import asyncio
+
+from sqlalchemy.sql import Select
+
+from app.collectors.base_collector import IOrderCollector
+from app.schemas.order import ShipmentItem
+from app.services import order_service
+from app.services.order_service import OrderService
+
+
+class ShippingCollector(IOrderCollector):
+    """
+    register_tracking_and_ship 호출을 기록하고 동시 실행 수의 최댓값을 측정하는 가짜 컬렉터
+    """
+    SHIPMENT_CONCURRENCY = 3
+
+    def __init__(self, channel_id: int=1, outcomes: dict=None, counter: dict=None):
+        super().__init__(channel_id, "key", "secret")
+        self.outcomes = outcomes or {}
+        self.counter = counter if counter is not None else {"active": 0, "max": 0}
+        self.shipped = []
+
+    async def fetch_products(self, page=1, page_size=50):
+        return []
+
+    async def fetch_orders(self, start_date, end_date):
+        return []
+
+    async def confirm_order_preparation(self, order_item_ids):
+        return True
+
+    async def register_tracking_and_ship(self, order_item_id, courier_code, tracking_number):
+        self.counter["active"] += 1
+        self.counter["max"] = max(self.counter["max"], self.counter["active"])
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.counter["active"] -= 1
+        self.shipped.append((order_item_id, courier_code, tracking_number))
+        outcome = self.outcomes.get(order_item_id, True)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def all(self):
+        return self._rows
+
+
+class FakeSession:
+    """
+    조회(SELECT)에는 rows를 반환하고, 그 밖의 문장(UPDATE)은 기록만 합니다.
+    """
+    def __init__(self, rows):
+        self.rows = rows
+        self.updates = []
+        self.commits = 0
+
+    async def execute(self, statement):
+        if isinstance(statement, Select):
+            return FakeResult(self.rows)
+        self.updates.append(statement)
+
+    async def commit(self):
+        self.commits += 1
+
+
+def test_bulk_registration_is_bounded_by_shipment_concurrency():
+    collector = ShippingCollector()
+    shipments = [(f"I{index}", "CJ", f"T{index}") for index in range(10)]
+
+    results = asyncio.run(collector.register_tracking_and_ship_bulk(shipments))
+
+    assert collector.counter["max"] == collector.SHIPMENT_CONCURRENCY
+    assert sorted(collector.shipped) == sorted(shipments)
+    assert results == {f"I{index}": None for index in range(10)}
+
+
+def test_bulk_registration_maps_rejections_and_errors():
+    collector = ShippingCollector(outcomes={
+        "I1": False,
+        "I2": RuntimeError("invalid tracking number"),
+        "I3": asyncio.TimeoutError(),
+    })
+    shipments = [(f"I{index}", "CJ", f"T{index}") for index in range(4)]
+
+    results = asyncio.run(collector.register_tracking_and_ship_bulk(shipments))
+
+    assert results == {
+        "I0": None,
+        "I1": "Rejected by channel API",
+        "I2": "invalid tracking number",
+        "I3": "TimeoutError",
+    }
+
+
+def test_ship_items_bulk_skips_items_in_disallowed_status(monkeypatch):
+    rows = [
+        (1, "E1", "PAID", 10),
+        (2, "E2", "PREPARING", 10),
+        (3, "E3", "CANCELLED", 10),
+        (4, "E4", "SHIPPED", 10),
+    ]
+    service = OrderService(db=FakeSession(rows))
+    collector = ShippingCollector(channel_id=10)
+
+    async def get_channel_collector(channel_id):
+        return collector
+
+    monkeypatch.setattr(service, "_get_channel_collector", get_channel_collector)
+    shipments = [ShipmentItem(order_item_id=item_id, courier_code="CJ", tracking_number=f"T{item_id}") for item_id in (1, 2, 3, 4, 5)]
+
+    response = asyncio.run(service.ship_items_bulk(shipments))
+
+    assert sorted(collector.shipped) == [("E1", "CJ", "T1"), ("E2", "CJ", "T2")]
+    assert [(result.order_item_id, result.success, result.error) for result in response.results] == [
+        (1, True, None),
+        (2, True, None),
+        (3, False, "Not allowed in status CANCELLED"),
+        (4, False, "Not allowed in status SHIPPED"),
+        (5, False, "Order item not found"),
+    ]
+    assert (response.succeeded, response.failed) == (2, 3)
+    assert len(service.db.updates) == 1
+
+
+def test_ship_items_bulk_bounds_chunks_and_per_item_calls(monkeypatch):
+    monkeypatch.setattr(order_service.settings, "ORDER_BULK_CHUNK_CONCURRENCY", 2)
+    rows = [(item_id, f"E{item_id}", "PAID", 10) for item_id in range(1, 25)]
+    service = OrderService(db=FakeSession(rows))
+    collector = ShippingCollector(channel_id=10, outcomes={"E7": RuntimeError("invalid tracking number")})
+    collector.SHIPMENT_BATCH_SIZE = 4
+    collector.SHIPMENT_CONCURRENCY = 2
+
+    async def get_channel_collector(channel_id):
+        return collector
+
+    monkeypatch.setattr(service, "_get_channel_collector", get_channel_collector)
+    shipments = [ShipmentItem(order_item_id=item_id, courier_code="CJ", tracking_number=f"T{item_id}") for item_id in range(1, 25)]
+
+    response = asyncio.run(service.ship_items_bulk(shipments))
+
+    # chunk 수(ORDER_BULK_CHUNK_CONCURRENCY) x chunk 안의 동시 요청 수(SHIPMENT_CONCURRENCY)
+    assert collector.counter["max"] == 4
+    assert len(collector.shipped) == 24
+    assert (response.succeeded, response.failed) == (23, 1)
+    assert response.results[6].error == "invalid tracking number"
@@ -0,0 +1,157 @@
+"""
+HttpCollectorMixin._send 재시도 테스트
+
+응답/예외를 차례로 돌려주는 httpx.MockTransport로, 메서드와 idempotent 여부에 따라
+429/5xx 응답과 네트워크 오류를 재시도하는지(재시도 결정표) 확인합니다. 백오프 대기는 0으로 바꾸어 실행합니다.
+
+실행 예시 (uc-oms 디렉토리에서):
+    python -m pytest -q tests
+"""
+import asyncio
+
+import httpx
+import pytest
+
+from app.collectors import base_collector
+from app.collectors.base_collector import HttpCollectorMixin
+from app.collectors.rate_limiter import AdaptiveRateLimiter
+
+MAX_ATTEMPTS = base_collector.settings.COLLECTOR_MAX_RETRIES + 1
+
+
+class RecordingRateLimiter(AdaptiveRateLimiter):
+    """
+    429 응답 시 전달된 Retry-After를 기록합니다. (min_rate를 rate와 같게 두어 속도를 낮추지 않습니다)
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.throttled = []
+
+    def on_throttle(self, retry_after=None) -> None:
+        self.throttled.append(retry_after)
+        super().on_throttle(retry_after)
+
+
+class FakeHttpCollector(HttpCollectorMixin):
+    """
+    공용 AsyncClient/속도 제한기 대신 테스트용 MockTransport 클라이언트와 자체 속도 제한기를 사용합니다.
+    """
+    CHANNEL_TYPE = "fake"
+
+    def __init__(self, outcomes: list):
+        self.channel_id = 1
+        self.calls = []
+        self.outcomes = list(outcomes)
+        self._client = httpx.AsyncClient(transport=httpx.MockTransport(self._handle), base_url="http://channel.test")
+        self._limiter = RecordingRateLimiter(rate=1000, capacity=100, min_rate=1000)
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        return self._client
+
+    @property
+    def rate_limiter(self) -> AdaptiveRateLimiter:
+        return self._limiter
+
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+        self.calls.append(request.method)
+        # 마지막 결과는 이후 요청에도 계속 사용합니다.
+        outcome = self.outcomes.pop(0) if len(self.outcomes) > 1 else self.outcomes[0]
+        if isinstance(outcome, type) and issubclass(outcome, Exception):
+            raise outcome("simulated", request=request)
+        if isinstance(outcome, tuple):
+            status_code, headers = outcome
+            return httpx.Response(status_code, headers=headers, json={"status": status_code})
+        return httpx.Response(outcome, json={"status": outcome})
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(base_collector, "backoff_delay", lambda attempt: 0)
+
+
+def _send(collector: FakeHttpCollector, method: str, **kwargs):
+    async def run():
+        try:
+            return await collector._send(method, "/orders", **kwargs)
+        finally:
+            await collector.client.aclose()
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize("method, idempotent, status_code, attempts", [
+    # 5xx: 멱등 요청만 재시도합니다. (POST는 서버가 이미 처리했을 수 있음)
+    ("GET", None, 503, MAX_ATTEMPTS),
+    ("PUT", None, 500, MAX_ATTEMPTS),
+    ("POST", None, 503, 1),
+    ("PATCH", None, 502, 1),
+    ("POST", True, 503, MAX_ATTEMPTS),
+    ("GET", False, 503, 1),
+    # 429: 처리되지 않은 요청이므로 메서드와 관계없이 재시도합니다.
+    ("GET", None, 429, MAX_ATTEMPTS),
+    ("POST", None, 429, MAX_ATTEMPTS),
+    # 재시도 대상이 아닌 응답은 그대로 반환합니다.
+    ("GET", None, 404, 1),
+    ("POST", None, 400, 1),
+])
+def test_retry_decision_for_responses(method, idempotent, status_code, attempts):
+    collector = FakeHttpCollector([status_code])
+
+    response = _send(collector, method, idempotent=idempotent)
+
+    # 마지막 시도의 응답은 상태 코드와 관계없이 반환합니다.
+    assert response.status_code == status_code
+    assert collector.calls == [method] * attempts
+
+
+@pytest.mark.parametrize("method, idempotent, error, attempts", [
+    # 연결 실패는 요청이 전달되지 않았으므로 항상 재시도합니다.
+    ("POST", None, httpx.ConnectError, MAX_ATTEMPTS),
+    ("POST", None, httpx.ConnectTimeout, MAX_ATTEMPTS),
+    # 연결 이후의 오류는 멱등 요청만 재시도합니다.
+    ("POST", None, httpx.ReadTimeout, 1),
+    ("POST", None, httpx.RemoteProtocolError, 1),
+    ("POST", True, httpx.ReadTimeout, MAX_ATTEMPTS),
+    ("GET", None, httpx.ReadTimeout, MAX_ATTEMPTS),
+])
+def test_retry_decision_for_network_errors(method, idempotent, error, attempts):
+    collector = FakeHttpCollector([error])
+
+    with pytest.raises(error):
+        _send(collector, method, idempotent=idempotent)
+    assert collector.calls == [method] * attempts
+
+
+def test_retry_stops_at_first_success():
+    collector = FakeHttpCollector([503, httpx.ConnectError, 200])
+
+    response = _send(collector, "GET")
+
+    assert response.status_code == 200
+    assert collector.calls == ["GET"] * 3
+
+
+def test_throttle_passes_retry_after_to_rate_limiter():
+    collector = FakeHttpCollector([(429, {"Retry-After": "0"}), 200])
+
+    response = _send(collector, "POST")
+
+    assert response.status_code == 200
+    assert collector.rate_limiter.throttled == [0.0]
+
+
+def test_stream_retry_returns_open_final_response():
+    collector = FakeHttpCollector([503, 200])
+
+    async def run():
+        try:
+            response = await collector._send("GET", "/orders", stream=True)
+            try:
+                return response.status_code, await response.aread()
+            finally:
+                await response.aclose()
+        finally:
+            await collector.client.aclose()
+
+    assert asyncio.run(run()) == (200, b'{"status":200}')
+    assert collector.calls == ["GET", "GET"]
@@ -0,0 +1,90 @@
+"""
+app.collectors.json_stream.iter_json_items 테스트
+
+응답 본문을 작은 chunk로 나누어 보내는 httpx.MockTransport로, ijson 스트리밍 경로와
+ijson이 없을 때의 response.json() 경로가 같은 결과를 반환하는지 확인합니다.
+
+실행 예시 (uc-oms 디렉토리에서):
+    python -m pytest -q tests
+"""
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from app.collectors import json_stream
+
+BODY = {
+    "code": "SUCCESS",
+    "nextToken": "2",
+    "data": {
+        "totalPages": 3,
+        "content": [
+            {"sellerProductId": 1, "productName": "상품 1", "salesStatus": "APPROVED", "options": [{"id": 10}, {"id": 11}]},
+            {"sellerProductId": 2, "productName": "상품 \"2\"", "salesStatus": "SUSPENDED", "options": []},
+            {"sellerProductId": 3, "productName": "상품 3", "salesStatus": None, "price": 1234.5},
+        ],
+    },
+}
+EXPECTED = [
+    ("item", BODY["data"]["content"][0]),
+    ("item", BODY["data"]["content"][1]),
+    ("item", BODY["data"]["content"][2]),
+]
+
+
+def _chunked_transport(body: bytes, chunk_size: int) -> httpx.MockTransport:
+    async def chunks():
+        for start in range(0, len(body), chunk_size):
+            yield body[start:start + chunk_size]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"Content-Type": "application/json"}, content=chunks())
+
+    return httpx.MockTransport(handler)
+
+
+def _collect(body: dict, items_prefix: str, scalar_prefixes=(), chunk_size: int=7) -> list:
+    async def run() -> list:
+        raw = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        async with httpx.AsyncClient(transport=_chunked_transport(raw, chunk_size), base_url="http://channel.test") as client:
+            response = await client.send(client.build_request("GET", "/products"), stream=True)
+            try:
+                return [pair async for pair in json_stream.iter_json_items(response, items_prefix, scalar_prefixes)]
+            finally:
+                await response.aclose()
+    return asyncio.run(run())
+
+
+@pytest.fixture(params=["ijson", "fallback"])
+def parser(request, monkeypatch):
+    if request.param == "ijson":
+        pytest.importorskip("ijson")
+    else:
+        monkeypatch.setattr(json_stream, "ijson", None)
+    return request.param
+
+
+def test_items_and_scalars(parser):
+    result = _collect(BODY, "data.content.item", ("nextToken", "data.totalPages"))
+
+    assert [pair for pair in result if pair[0] == "item"] == EXPECTED
+    assert dict(pair for pair in result if pair[0] != "item") == {"nextToken": "2", "data.totalPages": 3}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 64, 1 << 20])
+def test_chunk_boundaries(parser, chunk_size):
+    assert _collect(BODY, "data.content.item", chunk_size=chunk_size) == EXPECTED
+
+
+def test_missing_items_and_scalars(parser):
+    result = _collect({"code": "SUCCESS", "data": {"content": []}}, "data.content.item", ("nextToken", "data.totalPages"))
+
+    assert result == []
+
+
+def test_scalar_items(parser):
+    result = _collect({"data": {"content": [1, "a", None, 2.5]}}, "data.content.item")
+
+    assert result == [("item", 1), ("item", "a"), ("item", None), ("item", 2.5)]
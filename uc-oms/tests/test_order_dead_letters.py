@@ -0,0 +1,164 @@
+"""
+OrderService._persist_order_chunk / _validate_records dead letter 격리 테스트
+
+SAVEPOINT(begin_nested)와 실행한 문장을 기록하는 가짜 세션으로, 일괄 UPSERT가 실패하면 주문마다 SAVEPOINT를 두고
+다시 저장하여 실패한 주문만 order_ingest_dead_letters로 격리하는지 확인합니다.
+
+실행 예시 (uc-oms 디렉토리에서):
+    python -m pytest -q tests
+"""
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime
+
+import pytest
+from sqlalchemy.dialects import mysql
+from sqlalchemy.exc import DataError, IntegrityError, OperationalError
+
+from app.collectors.records import OrderItemRecord, OrderRecord
+from app.schemas.order import OrderIngestResult
+from app.services.order_service import OrderService
+
+
+def _record(external_order_id: str, quantity: int=1) -> OrderRecord:
+    return OrderRecord(
+        channel_id=1,
+        channel_type="fake",
+        external_order_id=external_order_id,
+        order_date=datetime(2026, 3, 1),
+        total_amount=1000.0,
+        recipient_name="홍길동",
+        recipient_phone="010-1234-5678",
+        shipping_address="서울시 강남구 테스트로 123",
+        umos_status="PAID",
+        items=[OrderItemRecord(
+            external_item_id=f"{external_order_id}_A",
+            product_name="상품",
+            quantity=quantity,
+            item_price=1000.0,
+            umos_status="PAID"
+        )]
+    )
+
+
+class FakeSession:
+    """
+    SAVEPOINT 결과("release"/"rollback"), 실행한 문장, 커밋 횟수를 기록합니다.
+    """
+    def __init__(self):
+        self.savepoints = []
+        self.statements = []
+        self.commits = 0
+
+    @asynccontextmanager
+    async def begin_nested(self):
+        try:
+            yield
+        except BaseException:
+            self.savepoints.append("rollback")
+            raise
+        self.savepoints.append("release")
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+
+    async def commit(self):
+        self.commits += 1
+
+
+def _dead_letter_rows(statement) -> list:
+    """
+    order_ingest_dead_letters INSERT 문의 행을 (external_order_id, stage, error)로 반환합니다.
+    """
+    assert statement.table.name == "order_ingest_dead_letters"
+    params = statement.compile(dialect=mysql.dialect()).params
+    rows = []
+    index = 0
+    while f"stage_m{index}" in params:
+        rows.append((params[f"external_order_id_m{index}"], params[f"stage_m{index}"], params[f"error_m{index}"]))
+        index += 1
+    return rows
+
+
+def _service(monkeypatch, bulk_error=None, bad_orders=()) -> OrderService:
+    service = OrderService(db=FakeSession())
+
+    async def upsert_orders(orders):
+        if bulk_error is not None:
+            raise bulk_error
+        return OrderIngestResult(inserted=len(orders))
+
+    async def upsert_order_batch(orders):
+        if orders[0].external_order_id in bad_orders:
+            raise DataError("INSERT INTO orders ...", {}, Exception(f"Data too long: {orders[0].external_order_id}"))
+        return OrderIngestResult(inserted=len(orders))
+
+    monkeypatch.setattr(service, "_upsert_orders", upsert_orders)
+    monkeypatch.setattr(service, "_upsert_order_batch", upsert_order_batch)
+    return service
+
+
+def test_bulk_upsert_without_errors_writes_no_dead_letters(monkeypatch):
+    service = _service(monkeypatch)
+
+    result = asyncio.run(service._persist_order_chunk(1, [_record("O1"), _record("O2")], []))
+
+    assert result == OrderIngestResult(inserted=2)
+    assert service.db.savepoints == ["release"]
+    assert service.db.statements == []
+    assert service.db.commits == 1
+
+
+def test_bulk_failure_quarantines_only_failing_orders(monkeypatch):
+    bulk_error = IntegrityError("INSERT INTO orders ...", {}, Exception("Duplicate entry"))
+    service = _service(monkeypatch, bulk_error=bulk_error, bad_orders={"O2"})
+
+    result = asyncio.run(service._persist_order_chunk(1, [_record("O1"), _record("O2"), _record("O3")], []))
+
+    assert result == OrderIngestResult(inserted=2, failed=1)
+    # 일괄 SAVEPOINT만 되돌리고, 주문별 SAVEPOINT 중 실패한 주문만 되돌립니다.
+    assert service.db.savepoints == ["rollback", "release", "rollback", "release"]
+    [statement] = service.db.statements
+    assert _dead_letter_rows(statement) == [("O2", "persist", "Data too long: O2")]
+    assert service.db.commits == 1
+
+
+def test_validation_dead_letters_are_written_with_the_chunk(monkeypatch):
+    service = _service(monkeypatch)
+    orders, dead_letters = service._validate_records(1, [_record("O1"), _record("O2", quantity=0)])
+
+    result = asyncio.run(service._persist_order_chunk(1, orders, dead_letters))
+
+    assert result == OrderIngestResult(inserted=1, failed=1)
+    [(external_order_id, stage, error)] = _dead_letter_rows(service.db.statements[0])
+    assert (external_order_id, stage) == ("O2", "validate")
+    assert error.startswith("ValueError: items[0].quantity")
+
+
+def test_other_database_errors_are_not_quarantined(monkeypatch):
+    bulk_error = OperationalError("INSERT INTO orders ...", {}, Exception("Lost connection"))
+    service = _service(monkeypatch, bulk_error=bulk_error)
+
+    with pytest.raises(OperationalError):
+        asyncio.run(service._persist_order_chunk(1, [_record("O1")], []))
+    assert service.db.statements == []
+    assert service.db.commits == 0
+
+
+def test_validate_records_quarantines_invalid_records():
+    service = OrderService(db=None)
+    raw = [
+        _record("O1"),
+        _record("O2", quantity=0),
+        {"external_order_id": "O3", "channel_id": 1},
+    ]
+
+    orders, dead_letters = service._validate_records(7, raw)
+
+    assert [order.external_order_id for order in orders] == ["O1"]
+    assert [(row["channel_id"], row["external_order_id"], row["stage"]) for row in dead_letters] == [
+        (7, "O2", "validate"),
+        (7, "O3", "validate"),
+    ]
+    assert dead_letters[1]["error"] == "KeyError: 'channel_type'"
+    assert dead_letters[0]["payload"]["items"][0]["quantity"] == 0
@@ -0,0 +1,146 @@
+"""
+상태 변경 outbox 테스트 (OrderService._coalesce_outbox_events, flush_status_outbox, _record_outbox_results)
+
+같은 상태의 이벤트만 최신 이벤트로 대체(SUPERSEDED)하고 상태가 다른 중간 이벤트(PREPARING → SHIPPED)는 순서대로 보내는지,
+앞 이벤트를 보낼 수 없거나 전송에 실패하면 같은 상품의 뒤 이벤트를 보류하는지 확인합니다.
+
+실행 예시 (uc-oms 디렉토리에서):
+    python -m pytest -q tests
+"""
+import asyncio
+from collections import namedtuple
+
+import pytest
+from sqlalchemy.dialects import mysql
+
+from app.services import order_service
+from app.services.order_service import OrderService
+
+Row = namedtuple("Row", "id order_item_id umos_status")
+
+
+def _coalesce(claimed_ids, open_events):
+    by_id = {row.id: row for row in open_events}
+    superseded, skipped, sendable = OrderService._coalesce_outbox_events([by_id[i] for i in claimed_ids], open_events)
+    return superseded, skipped, [row.id for row in sendable]
+
+
+def test_different_statuses_are_sent_in_order():
+    events = [Row(1, 10, "PREPARING"), Row(2, 10, "SHIPPED")]
+
+    assert _coalesce([1, 2], events) == ([], [], [1, 2])
+
+
+def test_only_same_status_events_are_superseded():
+    events = [Row(1, 10, "PREPARING"), Row(2, 10, "PREPARING"), Row(3, 10, "SHIPPED"), Row(4, 10, "SHIPPED")]
+
+    assert _coalesce([1, 2, 3, 4], events) == ([1, 3], [], [2, 4])
+
+
+def test_statuses_without_channel_api_are_skipped():
+    # DELIVERED는 채널 API가 없으므로 건너뛰고, 앞뒤 SHIPPED의 대체 여부에도 영향을 주지 않습니다.
+    events = [Row(1, 10, "SHIPPED"), Row(2, 10, "DELIVERED"), Row(3, 10, "SHIPPED")]
+
+    assert _coalesce([1, 2, 3], events) == ([1], [2], [3])
+
+
+def test_later_events_wait_for_an_earlier_unclaimed_event():
+    # 1번은 재시도 대기 중이라 가져오지 않았으므로, 같은 상품의 2번(SHIPPED)은 보내지 않고 보류합니다.
+    events = [Row(1, 10, "PREPARING"), Row(2, 10, "SHIPPED"), Row(3, 11, "SHIPPED")]
+
+    assert _coalesce([2, 3], events) == ([], [], [3])
+
+
+def _event(event_id: int, order_item_id: int, umos_status: str, attempts: int=1) -> dict:
+    return {
+        "id": event_id,
+        "order_item_id": order_item_id,
+        "umos_status": umos_status,
+        "courier_name": "CJ" if umos_status == "SHIPPED" else None,
+        "tracking_number": f"T{order_item_id}" if umos_status == "SHIPPED" else None,
+        "attempts": attempts,
+    }
+
+
+def test_flush_sends_one_step_per_item_and_defers_after_failure(monkeypatch):
+    events = [
+        _event(1, 10, "PREPARING"),
+        _event(2, 14, "PREPARING"),
+        _event(3, 10, "SHIPPED"),
+        _event(4, 14, "SHIPPED"),
+        _event(5, 15, "SHIPPED"),
+    ]
+    service = OrderService(db=None)
+    steps = []
+    recorded = {}
+
+    async def claim_outbox_events(batch_size):
+        return len(events), events
+
+    async def send_outbox_step(events_by_item):
+        steps.append({item_id: event["id"] for item_id, event in events_by_item.items()})
+        return {item_id: "Rejected by channel API" if item_id == 14 else None for item_id in events_by_item}
+
+    async def record_outbox_results(sent_events, errors, deferred_ids=()):
+        recorded.update(events=[event["id"] for event in sent_events], errors=errors, deferred_ids=list(deferred_ids))
+
+    monkeypatch.setattr(service, "_claim_outbox_events", claim_outbox_events)
+    monkeypatch.setattr(service, "_send_outbox_step", send_outbox_step)
+    monkeypatch.setattr(service, "_record_outbox_results", record_outbox_results)
+
+    assert asyncio.run(service.flush_status_outbox()) == 5
+
+    # PREPARING을 먼저 보내고, 성공한 상품만 다음 단계(SHIPPED)를 보냅니다.
+    assert steps == [{10: 1, 14: 2, 15: 5}, {10: 3}]
+    assert recorded == {
+        "events": [1, 2, 3, 5],
+        "errors": {1: None, 2: "Rejected by channel API", 5: None, 3: None},
+        "deferred_ids": [4],
+    }
+
+
+class FakeSession:
+    def __init__(self):
+        self.statements = []
+        self.commits = 0
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+
+    async def commit(self):
+        self.commits += 1
+
+
+def _sql(statement) -> str:
+    return str(statement.compile(dialect=mysql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+def test_record_results_backs_off_and_restores_deferred_attempts(monkeypatch):
+    monkeypatch.setattr(order_service.settings, "ORDER_OUTBOX_MAX_ATTEMPTS", 3)
+    monkeypatch.setattr(order_service.settings, "ORDER_OUTBOX_RETRY_DELAY", 30)
+    service = OrderService(db=FakeSession())
+    events = [_event(1, 10, "PREPARING"), _event(2, 11, "PREPARING", attempts=2), _event(3, 12, "SHIPPED", attempts=3)]
+    errors = {1: None, 2: "timeout", 3: "timeout"}
+
+    asyncio.run(service._record_outbox_results(events, errors, [4]))
+
+    sent, failed, retry, deferred = [_sql(statement) for statement in service.db.statements]
+    assert "status='SENT'" in sent and "IN (1)" in sent
+    assert "status='FAILED'" in failed and "IN (3)" in failed
+    # 두 번째 시도까지 실패했으므로 RETRY_DELAY x 2초 후에 다시 보냅니다.
+    assert "status='PENDING'" in retry and "IN (2)" in retry and "INTERVAL 60 SECOND" in retry
+    assert "attempts=(order_status_outbox.attempts - 1)" in deferred and "IN (4)" in deferred
+    for sql in (sent, failed, retry, deferred):
+        assert "order_status_outbox.status = 'IN_FLIGHT'" in sql
+    assert service.db.commits == 1
+
+
+@pytest.mark.parametrize("attempts, delay", [(1, 30), (3, 120), (10, 900)])
+def test_retry_delay_is_capped(monkeypatch, attempts, delay):
+    monkeypatch.setattr(order_service.settings, "ORDER_OUTBOX_MAX_ATTEMPTS", 20)
+    service = OrderService(db=FakeSession())
+
+    asyncio.run(service._record_outbox_results([_event(1, 10, "PREPARING", attempts=attempts)], {1: "timeout"}))
+
+    [retry] = [_sql(statement) for statement in service.db.statements]
+    assert f"INTERVAL {delay} SECOND" in retry
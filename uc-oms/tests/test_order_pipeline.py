@@ -0,0 +1,217 @@
+"""
+OrderService._ingest_pipeline / _split_window 테스트
+
+페이지 단위로 주문을 반환하는 가짜 컬렉터와 DB 대신 호출을 기록하는 _persist_order_chunk로,
+수집 → 검증 → 저장 단계가 큐와 종료 표시(None)로 끝까지 진행되는지, 어느 단계가 실패하면 나머지 단계가 취소되는지 확인합니다.
+
+실행 예시 (uc-oms 디렉토리에서):
+    python -m pytest -q tests
+"""
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.collectors.base_collector import IOrderCollector
+from app.collectors.records import OrderItemRecord, OrderRecord
+from app.schemas.order import OrderIngestResult
+from app.services.order_service import OrderService
+
+START = datetime(2026, 3, 1)
+TIMEOUT = 5
+
+
+def _record(external_order_id: str, quantity: int=1) -> OrderRecord:
+    return OrderRecord(
+        channel_id=1,
+        channel_type="fake",
+        external_order_id=external_order_id,
+        order_date=START,
+        total_amount=1000.0,
+        recipient_name="홍길동",
+        recipient_phone="010-1234-5678",
+        shipping_address="서울시 강남구 테스트로 123",
+        umos_status="PAID",
+        items=[OrderItemRecord(
+            external_item_id=f"{external_order_id}_A",
+            product_name="상품",
+            quantity=quantity,
+            item_price=1000.0,
+            umos_status="PAID"
+        )]
+    )
+
+
+class PagedCollector(IOrderCollector):
+    """
+    구간마다 pages개의 페이지를 반환하는 가짜 컬렉터. 조회한 (구간 시작, 페이지)를 events에 기록합니다.
+    """
+    ORDER_PAGE_SIZE = 2
+
+    def __init__(self, pages: int=2, events: list=None, invalid: set=frozenset(), fail_on: tuple=None):
+        super().__init__(1, "key", "secret")
+        self.pages = pages
+        self.events = events if events is not None else []
+        self.invalid = invalid
+        self.fail_on = fail_on
+        self.cancelled = False
+
+    async def fetch_products(self, page=1, page_size=50):
+        return []
+
+    async def fetch_orders(self, start_date, end_date):
+        raise AssertionError("pipeline must fetch through fetch_order_page")
+
+    async def fetch_order_page(self, start_date, end_date, page=1, page_size=100):
+        try:
+            await asyncio.sleep(0)
+            if (start_date, page) == self.fail_on:
+                raise RuntimeError("channel API failed")
+            if start_date >= START + timedelta(days=1) and self.fail_on == "block":
+                await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        self.events.append(("fetch", start_date, page))
+        orders = []
+        for index in range(page_size):
+            external_order_id = f"{start_date:%m%d}-{page}-{index}"
+            orders.append(_record(external_order_id, quantity=0 if external_order_id in self.invalid else 1))
+        return orders, page < self.pages
+
+    async def confirm_order_preparation(self, order_item_ids):
+        return True
+
+    async def register_tracking_and_ship(self, order_item_id, courier_code, tracking_number):
+        return True
+
+
+def _service(monkeypatch, events: list, persist=None) -> OrderService:
+    service = OrderService(db=None)
+
+    async def persist_order_chunk(channel_id, orders, dead_letters):
+        events.append(("persist", [order.external_order_id for order in orders], len(dead_letters)))
+        if persist is not None:
+            await persist()
+        return OrderIngestResult(inserted=len(orders), failed=len(dead_letters))
+
+    monkeypatch.setattr(service, "_persist_order_chunk", persist_order_chunk)
+    return service
+
+
+def _run(service: OrderService, collector: IOrderCollector, days: int=3, **kwargs) -> OrderIngestResult:
+    async def run() -> OrderIngestResult:
+        pipeline = service._ingest_pipeline(collector, START, START + timedelta(days=days), **kwargs)
+        # 종료 표시가 전달되지 않으면 멈추므로 제한 시간을 둡니다.
+        return await asyncio.wait_for(pipeline, TIMEOUT)
+    return asyncio.run(run())
+
+
+def test_all_pages_reach_persist_and_stages_finish(monkeypatch):
+    events = []
+    collector = PagedCollector(pages=2, events=events, invalid={"0302-2-1"})
+    service = _service(monkeypatch, events)
+
+    result = _run(service, collector, fetch_concurrency=2, queue_size=1)
+
+    fetched = sorted(e[1:] for e in events if e[0] == "fetch")
+    assert fetched == [(START + timedelta(days=day), page) for day in range(3) for page in (1, 2)]
+    persisted = [order_id for e in events if e[0] == "persist" for order_id in e[1]]
+    assert len(persisted) == 11 and "0302-2-1" not in persisted
+    assert result == OrderIngestResult(inserted=11, failed=1)
+
+
+def test_pages_are_split_into_ingest_batches(monkeypatch):
+    from app.services import order_service
+    monkeypatch.setattr(order_service.settings, "ORDER_INGEST_BATCH_SIZE", 1)
+    events = []
+    service = _service(monkeypatch, events)
+
+    result = _run(service, PagedCollector(pages=1, events=events), days=1)
+
+    assert [e[1] for e in events if e[0] == "persist"] == [["0301-1-0"], ["0301-1-1"]]
+    assert result.inserted == 2
+
+
+def test_persist_runs_while_later_pages_are_fetched(monkeypatch):
+    events = []
+    service = _service(monkeypatch, events)
+
+    _run(service, PagedCollector(pages=4, events=events), days=2, fetch_concurrency=1, queue_size=1)
+
+    kinds = [e[0] for e in events]
+    assert kinds.index("persist") < len(kinds) - 1 - kinds[::-1].index("fetch")
+
+
+def test_fetch_error_cancels_other_stages(monkeypatch):
+    events = []
+    persist_cancelled = []
+
+    async def slow_persist():
+        try:
+            await asyncio.sleep(TIMEOUT)
+        except asyncio.CancelledError:
+            persist_cancelled.append(True)
+            raise
+
+    service = _service(monkeypatch, events, persist=slow_persist)
+    collector = PagedCollector(pages=2, events=events, fail_on=(START + timedelta(days=1), 1))
+
+    with pytest.raises(RuntimeError, match="channel API failed"):
+        _run(service, collector, fetch_concurrency=1, queue_size=1)
+    assert persist_cancelled == [True]
+
+
+def test_persist_error_cancels_fetchers(monkeypatch):
+    events = []
+
+    async def failing_persist():
+        raise RuntimeError("database unavailable")
+
+    service = _service(monkeypatch, events, persist=failing_persist)
+    collector = PagedCollector(pages=1, events=events, fail_on="block")
+
+    with pytest.raises(RuntimeError, match="database unavailable"):
+        _run(service, collector, fetch_concurrency=2)
+    assert collector.cancelled
+
+
+def test_split_window_unaligned():
+    end = START + timedelta(days=2, hours=12)
+
+    shards = OrderService._split_window(START + timedelta(hours=6), end, timedelta(days=1))
+
+    assert shards == [
+        (START + timedelta(hours=6), START + timedelta(days=1, hours=6)),
+        (START + timedelta(days=1, hours=6), START + timedelta(days=2, hours=6)),
+        (START + timedelta(days=2, hours=6), end),
+    ]
+
+
+@pytest.mark.parametrize("tzinfo", [None, timezone.utc])
+def test_split_window_aligned_to_epoch_multiples(tzinfo):
+    start = datetime(2026, 3, 1, 10, 30, tzinfo=tzinfo)
+    end = datetime(2026, 3, 3, 6, tzinfo=tzinfo)
+
+    shards = OrderService._split_window(start, end, timedelta(days=1), aligned=True)
+
+    assert shards == [
+        (start, datetime(2026, 3, 2, tzinfo=tzinfo)),
+        (datetime(2026, 3, 2, tzinfo=tzinfo), datetime(2026, 3, 3, tzinfo=tzinfo)),
+        (datetime(2026, 3, 3, tzinfo=tzinfo), end),
+    ]
+
+
+def test_split_window_aligned_boundaries_do_not_depend_on_start():
+    window = timedelta(hours=6)
+    end = datetime(2026, 3, 2)
+
+    first = OrderService._split_window(datetime(2026, 3, 1, 1), end, window, aligned=True)
+    second = OrderService._split_window(datetime(2026, 3, 1, 5, 59), end, window, aligned=True)
+
+    assert first[1:] == second[1:]
+    assert [shard_start.hour for shard_start, _ in first[1:]] == [6, 12, 18]
+
+
+def test_split_window_empty_range():
+    assert OrderService._split_window(START, START, timedelta(days=1), aligned=True) == []
@@ -0,0 +1,123 @@
+"""
+app.collectors.token_cache.TokenCache 테스트
+
+동시에 들어온 요청이 토큰을 한 번만 발급받는지(single-flight), 만료 refresh_margin초 전부터 갱신하는지,
+invalidate가 이미 갱신된 새 토큰을 지우지 않는지 확인합니다. 시각은 time.monotonic을 바꾸어 제어합니다.
+
+실행 예시 (uc-oms 디렉토리에서):
+    python -m pytest -q tests
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.collectors import token_cache as token_cache_module
+from app.collectors.token_cache import TokenCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    # asyncio 이벤트 루프도 time.monotonic을 사용하므로, time 모듈 대신 token_cache 모듈이 참조하는 time만 바꿉니다.
+    monkeypatch.setattr(token_cache_module, "time", SimpleNamespace(monotonic=clock))
+    return clock
+
+
+class CountingFetcher:
+    """
+    호출될 때마다 token-1, token-2, ... 를 발급합니다. delay 동안 기다린 뒤 반환하여 동시 요청이 겹치도록 합니다.
+    """
+    def __init__(self, expires_in=3600, delay: float=0.01):
+        self.expires_in = expires_in
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        token = f"token-{self.calls}"
+        await asyncio.sleep(self.delay)
+        return token, self.expires_in
+
+
+def test_concurrent_gets_fetch_once(clock):
+    cache = TokenCache(refresh_margin=60, default_ttl=600)
+    fetcher = CountingFetcher()
+
+    async def run():
+        return await asyncio.gather(*(cache.get(1, fetcher) for _ in range(20)))
+
+    assert asyncio.run(run()) == ["token-1"] * 20
+    assert fetcher.calls == 1
+
+
+def test_keys_are_fetched_independently(clock):
+    cache = TokenCache(refresh_margin=60, default_ttl=600)
+    fetchers = {1: CountingFetcher(), 2: CountingFetcher()}
+
+    async def run():
+        return await asyncio.gather(*(cache.get(key, fetchers[key]) for key in (1, 2, 1, 2)))
+
+    assert asyncio.run(run()) == ["token-1"] * 4
+    assert (fetchers[1].calls, fetchers[2].calls) == (1, 1)
+
+
+def test_token_is_refreshed_within_refresh_margin(clock):
+    cache = TokenCache(refresh_margin=60, default_ttl=600)
+    fetcher = CountingFetcher(expires_in=3600)
+
+    assert asyncio.run(cache.get(1, fetcher)) == "token-1"
+    clock.now += 3600 - 61
+    assert asyncio.run(cache.get(1, fetcher)) == "token-1"
+    clock.now += 1
+    assert asyncio.run(cache.get(1, fetcher)) == "token-2"
+    assert fetcher.calls == 2
+
+
+def test_default_ttl_is_used_without_expires_in(clock):
+    cache = TokenCache(refresh_margin=60, default_ttl=600)
+    fetcher = CountingFetcher(expires_in=None)
+
+    asyncio.run(cache.get(1, fetcher))
+    clock.now += 600 - 61
+    asyncio.run(cache.get(1, fetcher))
+    clock.now += 1
+    asyncio.run(cache.get(1, fetcher))
+
+    assert fetcher.calls == 2
+
+
+def test_invalidate_with_stale_token_keeps_refreshed_token(clock):
+    cache = TokenCache(refresh_margin=60, default_ttl=600)
+    fetcher = CountingFetcher()
+
+    assert asyncio.run(cache.get(1, fetcher)) == "token-1"
+    cache.invalidate(1, "token-1")
+    assert asyncio.run(cache.get(1, fetcher)) == "token-2"
+
+    # token-1로 401을 받은 요청이 늦게 폐기를 요청해도, 이미 갱신된 token-2는 유지합니다.
+    cache.invalidate(1, "token-1")
+    assert asyncio.run(cache.get(1, fetcher)) == "token-2"
+
+    cache.invalidate(1)
+    assert asyncio.run(cache.get(1, fetcher)) == "token-3"
+
+
+def test_failed_fetch_is_not_cached(clock):
+    cache = TokenCache(refresh_margin=60, default_ttl=600)
+    fetcher = CountingFetcher()
+
+    async def failing_fetcher():
+        raise RuntimeError("token endpoint unavailable")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(cache.get(1, failing_fetcher))
+    assert asyncio.run(cache.get(1, fetcher)) == "token-1"